@@ -0,0 +1,144 @@
+"""Benchmark the JsonApiRoute against the default APIRoute of FastAPI.
+
+Both routes return the same JSON:API document. The default route validates the
+document against the response model and serializes it again, the JsonApiRoute
+serializes the document directly. The ASGI application is called directly, so
+no network overhead is measured.
+
+Usage:
+    python benchmarks/json_api_route.py [--requests 2000] [--resources 100]
+"""
+
+import argparse
+import asyncio
+import time
+
+from typing import Literal
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from kwai.api.responses import JsonApiRoute
+from kwai.core.json_api import Document, ResourceData, ResourceIdentifier
+
+
+class JudokaResourceIdentifier(ResourceIdentifier):
+    """A JSON:API resource identifier for a judoka."""
+
+    type: Literal["judokas"] = "judokas"
+
+
+class JudokaAttributes(BaseModel):
+    """Attributes for a JSON:API resource of a judoka."""
+
+    name: str
+    birth_date: str
+    remark: str
+
+
+class JudokaResource(JudokaResourceIdentifier, ResourceData[JudokaAttributes, None]):
+    """A JSON:API resource for a judoka."""
+
+
+class JudokaDocument(Document[JudokaResource, None]):
+    """A JSON:API document for judokas."""
+
+
+def create_document(resources: int) -> JudokaDocument:
+    """Create a document with the given number of resources."""
+    return JudokaDocument(
+        data=[
+            JudokaResource(
+                id=str(index),
+                attributes=JudokaAttributes(
+                    name=f"Judoka {index}",
+                    birth_date="18601210",
+                    remark="A judoka used for benchmarking the JSON:API route.",
+                ),
+            )
+            for index in range(resources)
+        ]
+    )
+
+
+def create_app(route_class: type[APIRoute], document: JudokaDocument) -> FastAPI:
+    """Create an app with one endpoint that uses the given route class."""
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/judokas")
+    async def get_judokas() -> JudokaDocument:
+        return document
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> tuple[float, bytes]:
+    """Return the mean duration of a request in microseconds and the body."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/judokas",
+        "raw_path": b"/judokas",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "server": ("localhost", 80),
+        "client": ("127.0.0.1", 1234),
+    }
+    status = []
+    body = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(dict(scope), receive, send)
+    if status[0] != 200:
+        raise RuntimeError(f"The endpoint returned {status[0]}: {b''.join(body)}")
+    response_body = b"".join(body)
+
+    for _ in range(100):  # Warm up
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1_000_000, response_body
+
+
+async def main(requests: int, resources: int):
+    """Run the benchmark."""
+    document = create_document(resources)
+    print(f"{resources} resources, {requests} requests")
+    baseline = None
+    bodies = []
+    for name, route_class in (("APIRoute", APIRoute), ("JsonApiRoute", JsonApiRoute)):
+        duration, body = await measure(create_app(route_class, document), requests)
+        bodies.append(body)
+        if baseline is None:
+            baseline = duration
+        print(
+            f"{name:15} {duration:8.1f} us/request "
+            f"(speedup {baseline / duration:4.2f}x, {len(body)} bytes)"
+        )
+    if len(set(bodies)) != 1:
+        print("Warning: the routes returned a different body!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--resources", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.resources))
@@ -0,0 +1,147 @@
+"""Benchmark the per-request overhead of the request logging middleware.
+
+The old `@app.middleware("http")` implementation is compared with the
+AccessLogMiddleware. The ASGI application is called directly, so no network
+overhead is measured. The log records are written to a temporary file.
+
+Usage:
+    python benchmarks/request_logging.py [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import uuid
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from kwai.api.access_log import AccessLogMiddleware
+
+
+def create_app_without_logging() -> FastAPI:
+    """Create an app with one endpoint."""
+    app = FastAPI()
+
+    @app.get("/dojos")
+    async def get_dojos():
+        return []
+
+    return app
+
+
+def create_app_with_http_middleware() -> FastAPI:
+    """Create an app with the previous implementation of the logging middleware."""
+    app = create_app_without_logging()
+
+    @app.middleware("http")
+    async def log(request: Request, call_next):
+        request_id = str(uuid.uuid4())
+        with logger.contextualize(request_id=request_id):
+            logger.info(f"{request.url} - {request.method} - Request started")
+
+            response = None
+            try:
+                response = await call_next(request)
+            except Exception as ex:
+                logger.error(f"{request.url} - Request failed: {ex}")
+                logger.exception(ex)
+                response = JSONResponse(
+                    content={
+                        "detail": str(ex),
+                    },
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
+            finally:
+                response.headers["X-Request-ID"] = request_id
+                logger.info(
+                    f"{request.url} - {request.method} - Request ended: "
+                    f"{response.status_code}"
+                )
+
+            return response
+
+    return app
+
+
+def create_app_with_access_log(sample_rate: float) -> FastAPI:
+    """Create an app with the AccessLogMiddleware."""
+    app = create_app_without_logging()
+    app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate)
+    return app
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """Return the mean duration of a request in microseconds."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/dojos",
+        "raw_path": b"/dojos",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "server": ("localhost", 80),
+        "client": ("127.0.0.1", 1234),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(100):  # Warm up
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(requests: int):
+    """Run the benchmark."""
+    logger.remove()
+    with tempfile.NamedTemporaryFile(suffix=".log") as log_file:
+        # name, app, colorize and enqueue
+        cases = [
+            ("no logging", create_app_without_logging(), False, False),
+            ("@app.middleware('http')", create_app_with_http_middleware(), True, False),
+            ("AccessLogMiddleware", create_app_with_access_log(1.0), False, False),
+            (
+                "AccessLogMiddleware (enqueue)",
+                create_app_with_access_log(1.0),
+                False,
+                True,
+            ),
+            (
+                "AccessLogMiddleware (enqueue, 10%)",
+                create_app_with_access_log(0.1),
+                False,
+                True,
+            ),
+        ]
+        baseline = None
+        for name, app, colorize, enqueue in cases:
+            handler_id = logger.add(log_file.name, colorize=colorize, enqueue=enqueue)
+            duration = await measure(app, requests)
+            await logger.complete()
+            logger.remove(handler_id)
+            if baseline is None:
+                baseline = duration
+            print(
+                f"{name:35} {duration:8.1f} us/request "
+                f"(overhead {duration - baseline:7.1f} us)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,278 @@
+"""Benchmark the startup of the kwai application.
+
+Each measurement runs in a new process, so it is a cold start:
+
+- import: importing kwai.app (and all routers).
+- create_api: building the API application.
+- create_app: building the application with the API and the frontend.
+- openapi: generating /api/openapi.json for the first time.
+- first request: the first GET request for each router.
+
+The ASGI application is called directly, so no network overhead is measured. The
+lifespan is not run, so the warm-up doesn't hide the cost of the first requests.
+The first requests run offline with dependency overrides: a logged-in user, a
+database that returns no rows and a Redis client without keys. This measures the
+real handler of each router (dependencies, queries, validation and serialization)
+without depending on a database or Redis with data. A request that doesn't return
+a 2xx status code is skipped: its duration is the duration of the error path, not
+of the endpoint.
+
+The results are compared with the baselines in startup_baseline.json. The script
+fails when a measurement is slower than its baseline plus the tolerance and the
+minimum difference (this avoids failures on noise of short measurements). Baselines
+depend on the machine: update them with --update on the machine that runs the
+benchmark. The environment (Python, platform, CPU) is stored with the baselines.
+
+Usage:
+    KWAI_SETTINGS_FILE=kwai.toml python benchmarks/startup.py [--runs 5]
+        [--tolerance 0.25] [--min-delta 5] [--update]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+
+BASELINE_FILE = Path(__file__).parent / "startup_baseline.json"
+
+# A GET request for each router of the API.
+FIRST_REQUESTS = {
+    "auth": "/api/v1/auth/user",
+    "portal": "/api/v1/portal/applications",
+    "pages": "/api/v1/pages",
+    "news": "/api/v1/news_items",
+    "teams": "/api/v1/teams",
+    "trainings": "/api/v1/trainings",
+    "club": "/api/v1/club/members",
+    "metrics": "/api/metrics",
+}
+
+
+def override_dependencies(app) -> None:
+    """Override the database, Redis and the current user of the API."""
+    from sql_smith.query import SelectQuery
+    from starlette.routing import Mount
+
+    from kwai.api.dependencies import create_database, get_current_user, get_redis
+    from kwai.core.db.database import Database
+    from kwai.core.domain.value_objects.email_address import EmailAddress
+    from kwai.core.domain.value_objects.name import Name
+    from kwai.core.domain.value_objects.unique_id import UniqueId
+    from kwai.core.settings import get_settings
+    from kwai.modules.identity.users.user import UserEntity
+
+    class OfflineDatabase(Database):
+        """A database that compiles the queries, but returns no rows."""
+
+        async def check_connection(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def fetch_one(self, query: SelectQuery) -> dict[str, Any] | None:
+            if "COUNT(" in query.compile().sql.upper():
+                return {"c": 0}
+            return None
+
+        async def fetch(self, query: SelectQuery) -> AsyncIterator[dict[str, Any]]:
+            query.compile()
+            for row in ():
+                yield row
+
+    class OfflineRedis:
+        """A Redis client without keys."""
+
+        async def scan_iter(self, **kwargs) -> AsyncIterator[bytes]:
+            for key in ():
+                yield key
+
+    user = UserEntity(
+        uuid=UniqueId.generate(),
+        name=Name(first_name="Jigoro", last_name="Kano"),
+        email=EmailAddress("jigoro.kano@kwai.com"),
+    )
+
+    async def create_offline_database() -> AsyncIterator[Database]:
+        yield OfflineDatabase(get_settings().db)
+
+    api_app = next(
+        route.app
+        for route in app.routes
+        if isinstance(route, Mount) and route.path == "/api"
+    )
+    api_app.dependency_overrides[create_database] = create_offline_database
+    api_app.dependency_overrides[get_current_user] = lambda: user
+    api_app.dependency_overrides[get_redis] = OfflineRedis
+
+
+def measure() -> tuple[dict[str, float], dict[str, int]]:
+    """Measure the startup in this process.
+
+    Returns:
+        The durations in milliseconds and the status codes of the requests.
+    """
+    results = {}
+    status_codes = {}
+
+    start = time.perf_counter()
+    from kwai.api.app import create_api
+    from kwai.app import create_app
+    from kwai.warm_up import send_request
+
+    results["import"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    create_api()
+    results["create_api"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    app = create_app()
+    results["create_app"] = (time.perf_counter() - start) * 1000
+    override_dependencies(app)
+
+    async def send_requests():
+        start = time.perf_counter()
+        await send_request(app, "/api/openapi.json")
+        results["openapi"] = (time.perf_counter() - start) * 1000
+
+        for name, path in FIRST_REQUESTS.items():
+            start = time.perf_counter()
+            status_code = await send_request(app, path)
+            results[f"first request {name}"] = (time.perf_counter() - start) * 1000
+            status_codes[f"first request {name}"] = status_code
+
+    asyncio.run(send_requests())
+    return results, status_codes
+
+
+def run(runs: int) -> tuple[dict[str, float], dict[str, int]]:
+    """Run the measurement in new processes.
+
+    Returns:
+        The median of the durations of each measurement, and the status codes of
+        the requests that didn't return a 2xx status code in one of the runs.
+    """
+    measurements: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, __file__, "--child"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        durations, status_codes = json.loads(result.stdout.splitlines()[-1])
+        for name, duration in durations.items():
+            measurements.setdefault(name, []).append(duration)
+        errors.update(
+            (name, status_code)
+            for name, status_code in status_codes.items()
+            if not 200 <= status_code < 300
+        )
+    return {
+        name: statistics.median(durations)
+        for name, durations in measurements.items()
+        if name not in errors
+    }, errors
+
+
+def get_environment() -> dict[str, str | int | None]:
+    """Return the environment in which the benchmark runs."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(
+    results: dict[str, float],
+    baselines: dict[str, float],
+    tolerance: float,
+    min_delta: float,
+) -> list[str]:
+    """Print the results and return the names of the regressions."""
+    regressions = []
+    print(f"{'Measurement':<32}{'Baseline':>12}{'Result':>12}")
+    for name, duration in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:<32}{'-':>12}{duration:>10.1f}ms")
+            continue
+        marker = ""
+        if duration > max(baseline * (1 + tolerance), baseline + min_delta):
+            regressions.append(name)
+            marker = "  REGRESSION"
+        print(f"{name:<32}{baseline:>10.1f}ms{duration:>10.1f}ms{marker}")
+    return regressions
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown compared with the baseline (0.25 = 25%%).",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=5,
+        help="Minimum slowdown in milliseconds to report a regression.",
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Store the results as baselines."
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure()))
+        return
+
+    results, errors = run(args.runs)
+    baselines = {}
+    if BASELINE_FILE.exists():
+        stored = json.loads(BASELINE_FILE.read_text())
+        baselines = stored["baselines"]
+        print(f"Baselines recorded on: {stored['environment']}")
+
+    regressions = compare(results, baselines, args.tolerance, args.min_delta)
+    for name, status_code in errors.items():
+        print(f"{name:<32}{'skipped':>12}  (status code {status_code})")
+
+    if args.update:
+        BASELINE_FILE.write_text(
+            json.dumps(
+                {
+                    "environment": get_environment(),
+                    "baselines": {k: round(v, 1) for k, v in results.items()},
+                    # The measurements without a baseline, with their status code.
+                    "skipped": errors,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"Baselines stored in {BASELINE_FILE}")
+    elif regressions:
+        print(f"Regressions: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+-- migrate:up
+
+create table event_outbox
+(
+    id               bigint unsigned auto_increment primary key,
+    stream           varchar(255) not null,
+    data             text not null,
+    created_at       datetime default CURRENT_TIMESTAMP not null
+) charset = utf8mb4;
+
+-- migrate:down
@@ -0,0 +1,15 @@
+-- migrate:up
+
+alter table news_contents
+    add column html_summary text null,
+    add column html_content text null;
+
+alter table page_contents
+    add column html_summary text null,
+    add column html_content text null;
+
+alter table training_contents
+    add column html_summary text null,
+    add column html_content text null;
+
+-- migrate:down
@@ -0,0 +1,17 @@
+-- migrate:up
+
+create table collection_versions
+(
+    name             varchar(255) primary key,
+    version          bigint unsigned default 0 not null,
+    updated_at       datetime null
+) charset = utf8mb4;
+
+insert into collection_versions (name, version, updated_at)
+values ('applications', 0, CURRENT_TIMESTAMP),
+       ('news_stories', 0, CURRENT_TIMESTAMP),
+       ('pages', 0, CURRENT_TIMESTAMP),
+       ('training_definitions', 0, CURRENT_TIMESTAMP),
+       ('trainings', 0, CURRENT_TIMESTAMP);
+
+-- migrate:down
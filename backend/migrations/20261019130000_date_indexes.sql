@@ -0,0 +1,18 @@
+-- migrate:up
+
+-- The listings filter on the active/enabled flag and a date range, and they are
+-- ordered on the date and the id. The filter on active news combines enabled and
+-- end_date with OR, so an index that starts with enabled can't be used for a
+-- range on the publication date.
+create index trainings_active_start_date_index
+    on trainings(active, start_date, id);
+create index news_stories_publish_date_index
+    on news_stories(publish_date, id);
+create index judo_members_license_end_date_index
+    on judo_members(license_end_date);
+
+-- migrate:down
+
+drop index trainings_active_start_date_index on trainings;
+drop index news_stories_publish_date_index on news_stories;
+drop index judo_members_license_end_date_index on judo_members;
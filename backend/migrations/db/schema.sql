@@ -71,6 +71,20 @@ CREATE TABLE `coaches` (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
+--
+-- Table structure for table `collection_versions`
+--
+
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `collection_versions` (
+  `name` varchar(255) NOT NULL,
+  `version` bigint unsigned NOT NULL DEFAULT '0',
+  `updated_at` datetime DEFAULT NULL,
+  PRIMARY KEY (`name`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `contacts`
 --
@@ -112,6 +126,21 @@ CREATE TABLE `countries` (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
+--
+-- Table structure for table `event_outbox`
+--
+
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `event_outbox` (
+  `id` bigint unsigned NOT NULL AUTO_INCREMENT,
+  `stream` varchar(255) NOT NULL,
+  `data` text NOT NULL,
+  `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `imports`
 --
@@ -165,7 +194,8 @@ CREATE TABLE `judo_members` (
   `uuid` varchar(255) NOT NULL,
   PRIMARY KEY (`id`),
   KEY `judo_members_license_index` (`license`),
-  KEY `judo_members_uuid_index` (`uuid`)
+  KEY `judo_members_uuid_index` (`uuid`),
+  KEY `judo_members_license_end_date_index` (`license_end_date`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -202,6 +232,8 @@ CREATE TABLE `news_contents` (
   `user_id` int NOT NULL,
   `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
   `updated_at` datetime DEFAULT NULL,
+  `html_summary` text,
+  `html_content` text,
   PRIMARY KEY (`news_id`,`locale`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -223,7 +255,8 @@ CREATE TABLE `news_stories` (
   `application_id` int unsigned NOT NULL,
   `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
   `updated_at` datetime DEFAULT NULL,
-  PRIMARY KEY (`id`)
+  PRIMARY KEY (`id`),
+  KEY `news_stories_publish_date_index` (`publish_date`,`id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -279,6 +312,8 @@ CREATE TABLE `page_contents` (
   `user_id` int NOT NULL,
   `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
   `updated_at` datetime DEFAULT NULL,
+  `html_summary` text,
+  `html_content` text,
   PRIMARY KEY (`page_id`,`locale`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -446,6 +481,8 @@ CREATE TABLE `training_contents` (
   `user_id` int unsigned NOT NULL,
   `created_at` timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
   `updated_at` timestamp NULL DEFAULT NULL,
+  `html_summary` text,
+  `html_content` text,
   PRIMARY KEY (`training_id`,`locale`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -526,7 +563,8 @@ CREATE TABLE `trainings` (
   `cancelled` tinyint(1) NOT NULL DEFAULT '0',
   `location` varchar(255) DEFAULT NULL,
   `remark` text,
-  PRIMARY KEY (`id`)
+  PRIMARY KEY (`id`),
+  KEY `trainings_active_start_date_index` (`active`,`start_date`,`id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb3;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -650,5 +688,9 @@ INSERT INTO `schema_migrations` (version) VALUES
   ('20240525191900'),
   ('20240601194900'),
   ('20250211152654'),
-  ('20250418203100');
+  ('20250418203100'),
+  ('20261019100000'),
+  ('20261019110000'),
+  ('20261019120000'),
+  ('20261019130000');
 UNLOCK TABLES;
@@ -0,0 +1,106 @@
+"""Module that implements the logging of requests.
+
+The middleware is a pure ASGI middleware: unlike a middleware created with
+`@app.middleware("http")`, it doesn't need an extra task and memory stream for
+each request.
+"""
+
+import itertools
+import os
+import random
+import time
+
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestIdGenerator:
+    """Generate unique ids for requests.
+
+    An id is a random prefix, unique for the process, and a counter. This is a lot
+    cheaper than creating a uuid for each request.
+    """
+
+    def __init__(self):
+        self._prefix = os.urandom(4).hex()
+        self._counter = itertools.count(1)
+
+    def __call__(self) -> str:
+        """Return a new request id."""
+        return f"{self._prefix}-{next(self._counter):x}"
+
+
+class AccessLogMiddleware:
+    """Middleware that logs each request with one structured log line.
+
+    Each request gets a request id. The id is returned with the X-Request-ID header
+    and is available in the extra dict of all log records created while handling
+    the request.
+
+    The method, path, status code and duration of a request are available as extra
+    fields (method, path, status, duration) of the access log record. To reduce the
+    number of log lines, only a sample of the successful requests can be logged.
+    Failed requests (status 500 and above) are always logged.
+
+    An unhandled exception is logged and a 500 response with the exception as
+    detail is returned.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0):
+        """Initialize the middleware.
+
+        Args:
+            app: The application to wrap.
+            sample_rate: The fraction of the successful requests to log.
+        """
+        self.app = app
+        self._sample_rate = sample_rate
+        self._generate_request_id = RequestIdGenerator()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle the request and log it."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._generate_request_id()
+        start = time.perf_counter()
+        status_code = 500
+        response_started = False
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        with logger.contextualize(request_id=request_id):
+            try:
+                await self.app(scope, receive, send_with_request_id)
+            except Exception as ex:
+                logger.opt(exception=ex).error(
+                    f"{scope['method']} {scope['path']} - Request failed: {ex}"
+                )
+                if response_started:
+                    raise
+                response = JSONResponse(
+                    content={"detail": str(ex)},
+                    status_code=500,
+                )
+                await response(scope, receive, send_with_request_id)
+            finally:
+                if status_code >= 500 or random.random() < self._sample_rate:
+                    duration = (time.perf_counter() - start) * 1000
+                    logger.bind(
+                        method=scope["method"],
+                        path=scope["path"],
+                        status=status_code,
+                        duration=round(duration, 2),
+                    ).info(
+                        f"{scope['method']} {scope['path']} - {status_code} - "
+                        f"{duration:.2f}ms"
+                    )
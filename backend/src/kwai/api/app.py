@@ -2,15 +2,17 @@
 
 import os
 import sys
-import uuid
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from loguru import logger
 
+from kwai.api.access_log import AccessLogMiddleware
+from kwai.api.compression import CompressionMiddleware
+from kwai.api.metrics import router as metrics_router
+from kwai.api.response_cache import create_response_cache
 from kwai.api.v1.auth.api import api_router as auth_api_router
 from kwai.api.v1.club.api import api_router as club_api_router
 from kwai.api.v1.news.api import api_router as news_api_router
@@ -18,6 +20,7 @@ from kwai.api.v1.pages.api import api_router as pages_api_router
 from kwai.api.v1.portal.api import api_router as portal_api_router
 from kwai.api.v1.teams.api import router as teams_api_router
 from kwai.api.v1.trainings.api import api_router as training_api_router
+from kwai.core.events.redis_client import create_redis
 from kwai.core.settings import LoggerSettings, Settings, get_settings
 
 
@@ -26,10 +29,21 @@ APP_NAME = "kwai API"
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Log the start/stop of the application."""
+    """Log the start/stop of the application.
+
+    A shared Redis client (with a connection pool) and the response cache are
+    created on startup. The Redis client is closed on shutdown.
+    """
     logger.info(f"{APP_NAME} is starting")
+    settings = get_settings()
+    app.state.redis = create_redis(settings.redis)
+    app.state.response_cache = create_response_cache(
+        settings.response_cache, app.state.redis
+    )
     yield
+    await app.state.redis.aclose()
     logger.warning(f"{APP_NAME} has ended!")
+    await logger.complete()
 
 
 def configure_logger(settings: LoggerSettings):
@@ -55,9 +69,10 @@ def configure_logger(settings: LoggerSettings):
         settings.file or sys.stderr,
         format=log_format,
         level=settings.level,
-        colorize=True,
+        colorize=not settings.file,
         retention=settings.retention,
         rotation=settings.rotation,
+        enqueue=settings.enqueue,
         backtrace=False,
         diagnose=False,
     )
@@ -74,33 +89,13 @@ def create_api(settings: Settings | None = None) -> FastAPI:
     if settings is None:
         settings = get_settings()
 
-    @app.middleware("http")
-    async def log(request: Request, call_next):
-        """Middleware for logging the requests."""
-        request_id = str(uuid.uuid4())
-        with logger.contextualize(request_id=request_id):
-            logger.info(f"{request.url} - {request.method} - Request started")
-
-            response = None  # Make pylint happy...
-            try:
-                response = await call_next(request)
-            except Exception as ex:
-                logger.error(f"{request.url} - Request failed: {ex}")
-                logger.exception(ex)
-                response = JSONResponse(
-                    content={
-                        "detail": str(ex),
-                    },
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
-            finally:
-                response.headers["X-Request-ID"] = request_id
-                logger.info(
-                    f"{request.url} - {request.method} - Request ended: "
-                    f"{response.status_code}"
-                )
-
-            return response
+    app.add_middleware(
+        AccessLogMiddleware,
+        sample_rate=settings.logger.access_log_sample_rate if settings.logger else 1.0,
+    )
+
+    # Compress responses, the large JSON:API documents benefit the most.
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
 
     # Setup CORS
     if settings.cors:
@@ -123,5 +118,6 @@ def create_api(settings: Settings | None = None) -> FastAPI:
     app.include_router(teams_api_router, prefix="/v1")
     app.include_router(training_api_router, prefix="/v1")
     app.include_router(club_api_router, prefix="/v1")
+    app.include_router(metrics_router)
 
     return app
@@ -0,0 +1,128 @@
+"""Module that implements compression of responses.
+
+Gzip is always available. Brotli is used when the compression extra is installed
+(pip install kwai[compression]) and the client prefers it.
+"""
+
+from loguru import logger
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+BROTLI_AVAILABLE = brotli is not None
+
+
+def accepted_encodings(accept_encoding: str | None) -> list[str]:
+    """Return the encodings of an Accept-Encoding header, the preferred first.
+
+    Encodings with a quality of 0 are not accepted. The wildcard is ignored.
+    """
+    if not accept_encoding:
+        return []
+
+    encodings = []
+    for index, part in enumerate(accept_encoding.split(",")):
+        encoding, _, params = part.partition(";")
+        encoding = encoding.strip().lower()
+        if not encoding or encoding == "*":
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        if quality > 0:
+            encodings.append((-quality, index, encoding))
+    return [encoding for _, _, encoding in sorted(encodings)]
+
+
+class BrotliResponder(IdentityResponder):
+    """A responder that compresses the body with brotli."""
+
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        """Initialize the responder.
+
+        Args:
+            app: The application to wrap.
+            minimum_size: The minimum size of a body to compress.
+            quality: The quality for brotli (0-11).
+        """
+        super().__init__(app, minimum_size)
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        """Compress the body.
+
+        Each chunk of a streaming response is flushed, so it is sent immediately.
+        """
+        body = self._compressor.process(body)
+        if more_body:
+            return body + self._compressor.flush()
+        return body + self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """Middleware that compresses responses with brotli or gzip.
+
+    Responses smaller than minimum_size and responses that already have a
+    Content-Encoding header (precompressed files for example) are not compressed.
+
+    The default levels favour speed: a response is compressed on each request.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The application to wrap.
+            minimum_size: The minimum size of a body to compress.
+            gzip_level: The compression level for gzip (1-9).
+            brotli_quality: The quality for brotli (0-11).
+        """
+        self.app = app
+        self._minimum_size = minimum_size
+        self._gzip_level = gzip_level
+        self._brotli_quality = brotli_quality
+        if not BROTLI_AVAILABLE:
+            logger.info(
+                "Brotli is not installed, responses are only compressed with gzip. "
+                "Install kwai with the compression extra to use brotli."
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Select a responder for the preferred encoding of the client."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        responder: ASGIApp = IdentityResponder(self.app, self._minimum_size)
+        for encoding in accepted_encodings(headers.get("accept-encoding")):
+            if encoding == "br" and BROTLI_AVAILABLE:
+                responder = BrotliResponder(
+                    self.app, self._minimum_size, quality=self._brotli_quality
+                )
+                break
+            if encoding == "gzip":
+                responder = GZipResponder(
+                    self.app, self._minimum_size, compresslevel=self._gzip_level
+                )
+                break
+
+        await responder(scope, receive, send)
@@ -4,15 +4,17 @@ from typing import Annotated, AsyncGenerator
 
 import jwt
 
-from fastapi import Cookie, Depends, HTTPException, status
+from fastapi import Cookie, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.templating import Jinja2Templates
 from jwt import ExpiredSignatureError
 from redis.asyncio import Redis
 
+from kwai.api.response_cache import ResponseCache, create_response_cache
 from kwai.core.db.database import Database
+from kwai.core.events.outbox_publisher import OutboxPublisher
 from kwai.core.events.publisher import Publisher
-from kwai.core.events.redis_bus import RedisBus
+from kwai.core.events.redis_client import create_redis
 from kwai.core.settings import SecuritySettings, Settings, get_settings
 from kwai.core.template.jinja2_engine import Jinja2Engine
 from kwai.modules.identity.tokens.access_token_db_repository import (
@@ -39,9 +41,26 @@ async def create_database(
         await database.close()
 
 
-async def create_templates(settings=Depends(get_settings)) -> Jinja2Templates:
-    """Create the template engine dependency."""
-    return Jinja2Engine(website=settings.website).web_templates
+def get_template_engine(
+    request: Request, settings=Depends(get_settings)
+) -> Jinja2Engine:
+    """Get the shared template engine dependency.
+
+    The engine is created in the lifespan of the application or on first use. The
+    engine keeps the compiled templates, so a template is only compiled once.
+    """
+    template_engine = getattr(request.app.state, "template_engine", None)
+    if template_engine is None:
+        template_engine = Jinja2Engine.create_from_settings(settings)
+        request.app.state.template_engine = template_engine
+    return template_engine
+
+
+def create_templates(
+    template_engine: Annotated[Jinja2Engine, Depends(get_template_engine)],
+) -> Jinja2Templates:
+    """Create the templates dependency for a TemplateResponse."""
+    return template_engine.web_templates
 
 
 async def get_current_user(
@@ -64,17 +83,47 @@ async def get_current_user(
 optional_oauth = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=False)
 
 
-async def get_publisher(
+def get_redis(request: Request, settings=Depends(get_settings)) -> Redis:
+    """Get the shared Redis client dependency.
+
+    The client is created in the lifespan of the application. When the lifespan
+    didn't run (for example when the api is mounted in another application without
+    forwarding the lifespan), the client will be created on first use.
+    """
+    redis = getattr(request.app.state, "redis", None)
+    if redis is None:
+        redis = create_redis(settings.redis)
+        request.app.state.redis = redis
+    return redis
+
+
+def get_response_cache(
+    request: Request,
+    redis: Annotated[Redis, Depends(get_redis)],
     settings=Depends(get_settings),
+) -> ResponseCache:
+    """Get the shared response cache dependency.
+
+    Like the Redis client, the cache is created in the lifespan of the application
+    or on first use.
+    """
+    response_cache = getattr(request.app.state, "response_cache", None)
+    if response_cache is None:
+        response_cache = create_response_cache(settings.response_cache, redis)
+        request.app.state.response_cache = response_cache
+    return response_cache
+
+
+async def get_publisher(
+    database: Annotated[Database, Depends(create_database)],
 ) -> AsyncGenerator[Publisher, None]:
-    """Get the publisher dependency."""
-    redis = Redis(
-        host=settings.redis.host,
-        port=settings.redis.port,
-        password=settings.redis.password,
-    )
-    bus = RedisBus(redis)
-    yield bus
+    """Get the publisher dependency.
+
+    Events are written to the outbox with the database connection of the request.
+    When the events are published within a unit of work, they are only stored when
+    the transaction is committed. The event worker relays them to the event bus.
+    """
+    yield OutboxPublisher(database)
 
 
 async def get_optional_user(
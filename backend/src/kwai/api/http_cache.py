@@ -0,0 +1,167 @@
+"""Module that implements HTTP caching for API resources.
+
+The validators of a response (ETag and Last-Modified) are derived from the
+versions of the collections that are used to create the response. A repository
+increments the version of its collection on each change, so the validators can be
+checked without querying and serializing the resources. The versions are kept in
+memory for a short time, so a request that can be answered from the response cache
+(or with a 304) doesn't need the database.
+
+A response that depends on the current time (for example news items that are
+published or expire at a given time) can change without a change of a collection.
+For these responses a time bucket is added to the validators, so they change at
+least every time_bucket seconds.
+"""
+
+import hashlib
+import time
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, Response, status
+
+from kwai.api.dependencies import create_database, get_response_cache
+from kwai.api.response_cache import ResponseCache
+from kwai.core.db.collection_versions import CollectionVersion, CollectionVersions
+from kwai.core.db.database import Database
+
+
+class ConditionalGet:
+    """A dependency that handles conditional GET requests.
+
+    The ETag, Last-Modified and Cache-Control headers are added to the response.
+    When the ETag matches the If-None-Match header, a 304 (Not Modified) response
+    is returned before the endpoint is executed.
+
+    Responses for anonymous users can be stored by a browser or a shared cache.
+    Responses for a logged-in user are private. A cache must always revalidate a
+    stored response when max_age is expired.
+
+    When cache is True, the responses for anonymous users are also stored in the
+    [response cache][kwai.api.response_cache.ResponseCache] with the ETag as key.
+    This only works for a route of the type
+    [JsonApiRoute][kwai.api.responses.JsonApiRoute] with an endpoint that returns
+    its response model.
+
+    When time_bucket is set, the ETag also changes every time_bucket seconds. Use
+    this for responses that depend on the current time.
+
+    Example:
+        ```py
+        @router.get(
+            "/news_items",
+            dependencies=[Depends(ConditionalGet("news_stories", "applications"))]
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        *collections: str,
+        max_age: int = 0,
+        cache: bool = False,
+        time_bucket: int = 0,
+    ):
+        """Initialize the dependency.
+
+        Args:
+            collections: The names of the collections used to create the response.
+            max_age: The number of seconds a response can be used without
+                revalidation.
+            cache: Store the responses for anonymous users on the server.
+            time_bucket: The maximum number of seconds a response is valid when
+                the collections don't change. 0 means no time limit.
+        """
+        self._collections = collections
+        self._max_age = max_age
+        self._cache = cache
+        self._time_bucket = time_bucket
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        database: Annotated[Database, Depends(create_database)],
+        response_cache: Annotated[ResponseCache, Depends(get_response_cache)],
+    ) -> None:
+        """Add the cache headers and check the If-None-Match header."""
+        versions = await CollectionVersions(database).get_cached(*self._collections)
+        anonymous = "access_token" not in request.cookies
+        bucket = (
+            int(time.time()) // self._time_bucket if self._time_bucket > 0 else None
+        )
+
+        headers = {
+            "ETag": self.create_etag(request, versions, anonymous, bucket),
+            "Cache-Control": (
+                f"public, max-age={self._max_age}, must-revalidate"
+                if anonymous
+                else "private, no-cache"
+            ),
+        }
+        last_modified = [
+            version.updated_at.timestamp
+            for version in versions
+            if not version.updated_at.empty
+        ]
+        if bucket is not None:
+            last_modified.append(
+                datetime.fromtimestamp(bucket * self._time_bucket, tz=timezone.utc)
+            )
+        if last_modified:
+            headers["Last-Modified"] = format_datetime(max(last_modified), usegmt=True)
+
+        if self.matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+
+        response.headers.update(headers)
+
+        if self._cache and anonymous:
+            request.state.response_cache = response_cache
+            request.state.response_cache_key = headers["ETag"].removeprefix("W/")[1:-1]
+
+    @classmethod
+    def create_etag(
+        cls,
+        request: Request,
+        versions: list[CollectionVersion],
+        anonymous: bool,
+        bucket: int | None = None,
+    ) -> str:
+        """Create a weak ETag for the request and the versions of the collections.
+
+        Args:
+            request: The request.
+            versions: The versions of the collections.
+            anonymous: Is the request made by an anonymous user?
+            bucket: The time bucket of the request (None when not used).
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(request.url.path.encode("utf-8"))
+        digest.update(b"?" + request.url.query.encode("utf-8"))
+        digest.update(b"|anonymous" if anonymous else b"|user")
+        for version in versions:
+            digest.update(f"|{version.name}:{version.version}".encode("utf-8"))
+        if bucket is not None:
+            digest.update(f"|time:{bucket}".encode("utf-8"))
+        return f'W/"{digest.hexdigest()}"'
+
+    @classmethod
+    def matches(cls, if_none_match: str | None, etag: str) -> bool:
+        """Check if the ETag matches one of the ETags of If-None-Match.
+
+        The weak comparison is used, as required for If-None-Match.
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        opaque_tag = etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == opaque_tag
+            for tag in if_none_match.split(",")
+        )
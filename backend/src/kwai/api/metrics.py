@@ -0,0 +1,41 @@
+"""Module that defines an endpoint for exposing metrics in the Prometheus format."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from redis.asyncio import Redis
+
+from kwai.api.dependencies import get_current_user, get_redis
+from kwai.core.events.metrics import (
+    EventBusMetrics,
+    collect_group_stats,
+    render_prometheus,
+)
+
+
+router = APIRouter()
+
+
+class PrometheusResponse(PlainTextResponse):
+    """A response that uses the Prometheus text format."""
+
+    media_type = "text/plain; version=0.0.4"
+
+
+@router.get(
+    "/metrics",
+    response_class=PrometheusResponse,
+    include_in_schema=False,
+    dependencies=[Depends(get_current_user)],
+)
+async def get_metrics(redis: Annotated[Redis, Depends(get_redis)]) -> str:
+    """Get the metrics of the event bus.
+
+    The lag and pending messages of each group of each stream are retrieved from
+    Redis. The metrics of the handlers are stored in Redis by the event worker.
+    The metrics are only available for a logged-in user.
+    """
+    return render_prometheus(
+        await collect_group_stats(redis), await EventBusMetrics.load(redis)
+    )
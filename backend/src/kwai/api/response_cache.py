@@ -0,0 +1,176 @@
+"""Module that implements a server-side cache for serialized API responses.
+
+Only responses of public endpoints for anonymous users are cached. The key of a
+response is the ETag created by [ConditionalGet][kwai.api.http_cache.ConditionalGet].
+This ETag contains the path, the query string and the versions of the collections
+used by the endpoint. When a repository changes a collection, the version is
+incremented and the cached responses are not used anymore: they are removed when
+they expire or when the cache is full.
+
+The cache prevents a stampede: when multiple requests for the same missing key
+arrive at the same time, only one request creates the response, the others wait
+for the result (within the same process).
+"""
+
+import asyncio
+import time
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from kwai.core.settings import ResponseCacheSettings
+
+
+class ResponseCache(ABC):
+    """Base class for a cache of serialized responses."""
+
+    def __init__(self, ttl: int = 300):
+        """Initialize the cache.
+
+        Args:
+            ttl: The number of seconds a response is kept in the cache.
+        """
+        self._ttl = ttl
+        self._flights: dict[str, asyncio.Future[bytes]] = {}
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Get the content of a response, None is returned when it is missing."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, content: bytes) -> None:
+        """Store the content of a response."""
+        raise NotImplementedError
+
+    async def get_or_create(
+        self, key: str, create: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """Get the content from the cache, or create and store it when missing.
+
+        Only one coroutine creates the content of a missing key, the other
+        coroutines wait for it. When the creation fails, all waiting coroutines
+        receive the same exception. When the creating coroutine is cancelled, a
+        waiting coroutine takes over.
+        """
+        content = await self.get(key)
+        if content is not None:
+            return content
+
+        while (flight := self._flights.get(key)) is not None:
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+
+        flight = asyncio.get_running_loop().create_future()
+        # Avoid a "Future exception was never retrieved" warning when nobody waits.
+        flight.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._flights[key] = flight
+        try:
+            content = await create()
+            await self.set(key, content)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(content)
+            return content
+        finally:
+            del self._flights[key]
+
+
+class MemoryResponseCache(ResponseCache):
+    """A cache that keeps the responses in the memory of the process.
+
+    The least recently used response is removed when the cache is full.
+    """
+
+    def __init__(self, ttl: int = 300, max_entries: int = 1000):
+        """Initialize the cache.
+
+        Args:
+            ttl: The number of seconds a response is kept in the cache.
+            max_entries: The maximum number of responses in the cache.
+        """
+        super().__init__(ttl)
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return content
+
+    async def set(self, key: str, content: bytes) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, content)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of responses in the cache."""
+        return len(self._entries)
+
+
+class RedisResponseCache(ResponseCache):
+    """A cache that stores the responses in Redis.
+
+    The cache is shared by all processes of the API. Redis removes the responses
+    when they expire. When Redis can't be reached, the cache behaves as if it is
+    empty: the responses are created again, but not stored.
+    """
+
+    def __init__(self, redis: Redis, ttl: int = 300, prefix: str = "kwai/responses/"):
+        """Initialize the cache.
+
+        Args:
+            redis: The Redis client to use.
+            ttl: The number of seconds a response is kept in the cache.
+            prefix: The prefix for the keys in Redis.
+        """
+        super().__init__(ttl)
+        self._redis = redis
+        self._prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await self._redis.get(self._prefix + key)
+        except RedisError as exc:
+            logger.warning(f"Response could not be read from the cache: {exc}")
+            return None
+
+    async def set(self, key: str, content: bytes) -> None:
+        try:
+            await self._redis.set(self._prefix + key, content, ex=self._ttl)
+        except RedisError as exc:
+            logger.warning(f"Response could not be stored in the cache: {exc}")
+
+
+def create_response_cache(
+    settings: ResponseCacheSettings, redis: Redis
+) -> ResponseCache:
+    """Create the response cache for the settings.
+
+    Args:
+        settings: The settings of the cache.
+        redis: The Redis client, used by the redis backend.
+    """
+    if settings.backend == "redis":
+        return RedisResponseCache(redis, ttl=settings.ttl)
+    return MemoryResponseCache(ttl=settings.ttl, max_entries=settings.max_entries)
@@ -0,0 +1,187 @@
+"""Module that defines responses and routes for the API.
+
+FastAPI validates the return value of an endpoint against the response model
+before it is serialized. For JSON:API documents this means that a document, which
+is already built and validated by the presenter, is dumped to a dict, validated
+again and serialized again. The [JsonApiRoute][kwai.api.responses.JsonApiRoute]
+skips these extra steps: when an endpoint returns an instance of its response
+model, the document is serialized directly with
+[JsonApiResponse][kwai.api.responses.JsonApiResponse].
+
+The serialized response can be stored in a
+[ResponseCache][kwai.api.response_cache.ResponseCache] when a dependency sets a
+cache and a key in the state of the request (see
+[ConditionalGet][kwai.api.http_cache.ConditionalGet]).
+
+Large collections can be streamed with
+[JsonApiStreamingResponse][kwai.api.responses.JsonApiStreamingResponse].
+"""
+
+import inspect
+
+from functools import wraps
+from typing import Any, Callable, Coroutine
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import Response
+
+from kwai.core.json_api import DocumentStream
+
+
+_RESPONSE_PARAM_NAME = "_kwai_response"
+_REQUEST_PARAM_NAME = "_kwai_request"
+
+
+class _UncachedResult(Exception):
+    """Raised to skip the cache for a result that is not the response model.
+
+    Concurrent requests for the same key receive the same exception. Only the
+    first request can take the result, the others call the endpoint themselves.
+    """
+
+    def __init__(self, result: Any):
+        super().__init__()
+        self._results = [result]
+
+    def take(self) -> list[Any]:
+        """Return the result once, an empty list is returned after that."""
+        results, self._results = self._results, []
+        return results
+
+
+class JsonApiResponse(JSONResponse):
+    """A JSON response that serializes a Pydantic model without validating it.
+
+    Bytes are considered to be serialized already. Other content is rendered like
+    a JSONResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        return super().render(content)
+
+
+class JsonApiStreamingResponse(StreamingResponse):
+    """A response that streams a JSON:API document.
+
+    The entities are retrieved while the response is sent. FastAPI closes the
+    dependencies before this happens, so the database used by the stream must be
+    closed with a background task:
+
+        return JsonApiStreamingResponse(stream, background=BackgroundTask(db.close))
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        stream: DocumentStream,
+        *,
+        status_code: int = 200,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            stream: The stream of the document.
+            status_code: The status code of the response.
+            background: A task that runs after the response is sent.
+        """
+        super().__init__(stream, status_code=status_code, background=background)
+
+
+class JsonApiRoute(APIRoute):
+    """A route that returns a JsonApiResponse for the response model.
+
+    The response model is still used for the OpenAPI schema. An endpoint
+    that returns something else than an instance of the response model, is
+    handled like a normal FastAPI route. Such a result is never cached.
+
+    FastAPI only applies the status code and headers of the Response parameter
+    (of the endpoint or of a dependency) when it creates the response itself. The
+    route therefore always asks FastAPI for this response and copies the status
+    code and headers to the JsonApiResponse. The headers are also copied to a
+    response returned by the endpoint (a JsonApiStreamingResponse for example).
+
+    Use this route for an APIRouter:
+
+        router = APIRouter(route_class=JsonApiRoute)
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        endpoint = self.dependant.call
+        if (
+            inspect.isclass(self.response_model)
+            and issubclass(self.response_model, BaseModel)
+            and inspect.iscoroutinefunction(endpoint)
+        ):
+            response_param_name = self.dependant.response_param_name
+            if response_param_name is None:
+                self.dependant.response_param_name = _RESPONSE_PARAM_NAME
+            request_param_name = self.dependant.request_param_name
+            if request_param_name is None:
+                self.dependant.request_param_name = _REQUEST_PARAM_NAME
+            self.dependant.call = self._create_endpoint(
+                endpoint, response_param_name, request_param_name
+            )
+        return super().get_route_handler()
+
+    def _create_endpoint(
+        self,
+        endpoint: Callable[..., Coroutine],
+        response_param_name: str | None,
+        request_param_name: str | None,
+    ) -> Callable:
+        """Wrap the endpoint to return a JsonApiResponse for the response model."""
+        response_model = self.response_model
+        status_code = self.status_code or 200
+
+        async def create_content(**kwargs) -> bytes:
+            result = await endpoint(**kwargs)
+            if type(result) is not response_model:
+                raise _UncachedResult(result)
+            return result.__pydantic_serializer__.to_json(result, by_alias=True)
+
+        @wraps(endpoint)
+        async def wrapper(**kwargs):
+            if response_param_name is None:
+                sub_response = kwargs.pop(_RESPONSE_PARAM_NAME)
+            else:
+                sub_response = kwargs[response_param_name]
+            if request_param_name is None:
+                request = kwargs.pop(_REQUEST_PARAM_NAME)
+            else:
+                request = kwargs[request_param_name]
+
+            response_cache = getattr(request.state, "response_cache", None)
+            if response_cache is None:
+                result = await endpoint(**kwargs)
+            else:
+                try:
+                    result = await response_cache.get_or_create(
+                        request.state.response_cache_key,
+                        lambda: create_content(**kwargs),
+                    )
+                except _UncachedResult as exc:
+                    # Handle the result like it is done without a cache.
+                    results = exc.take()
+                    result = results[0] if results else await endpoint(**kwargs)
+
+            if isinstance(result, bytes) or type(result) is response_model:
+                response = JsonApiResponse(
+                    result, status_code=sub_response.status_code or status_code
+                )
+                response.headers.raw.extend(sub_response.headers.raw)
+                return response
+            if isinstance(result, Response):
+                result.headers.raw.extend(sub_response.headers.raw)
+            return result
+
+        return wrapper
@@ -4,12 +4,12 @@ from types import NoneType
 
 from pydantic import BaseModel
 
-from kwai.api.converter import MarkdownConverter
 from kwai.api.schemas.application import ApplicationBaseAttributes
 from kwai.api.schemas.resources import (
     ApplicationResourceIdentifier,
     NewsItemResourceIdentifier,
 )
+from kwai.core.converter import MarkdownConverter
 from kwai.core.json_api import Document, Relationship, ResourceData, ResourceMeta
 from kwai.modules.portal.news.news_item import NewsItemEntity
 
@@ -80,8 +80,12 @@ class NewsItemDocument(Document[NewsItemResource, NewsItemApplicationResource]):
                         locale=text.locale.value,
                         format=text.format.value,
                         title=text.title,
-                        summary=MarkdownConverter().convert(text.summary),
-                        content=MarkdownConverter().convert(text.content)
+                        summary=text.html_summary
+                        or MarkdownConverter().convert(text.summary),
+                        content=(
+                            text.html_content
+                            or MarkdownConverter().convert(text.content)
+                        )
                         if text.content
                         else None,
                         original_summary=text.summary,
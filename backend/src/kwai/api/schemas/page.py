@@ -4,12 +4,12 @@ from types import NoneType
 
 from pydantic import BaseModel
 
-from kwai.api.converter import MarkdownConverter
 from kwai.api.schemas.application import ApplicationBaseAttributes
 from kwai.api.schemas.resources import (
     ApplicationResourceIdentifier,
     PageResourceIdentifier,
 )
+from kwai.core.converter import MarkdownConverter
 from kwai.core.json_api import Document, Relationship, ResourceData, ResourceMeta
 from kwai.modules.portal.pages.page import PageEntity
 
@@ -74,8 +74,12 @@ class PageDocument(Document[PageResource, PageApplicationResource]):
                         locale=text.locale.value,
                         format=text.format.value,
                         title=text.title,
-                        summary=MarkdownConverter().convert(text.summary),
-                        content=MarkdownConverter().convert(text.content)
+                        summary=text.html_summary
+                        or MarkdownConverter().convert(text.summary),
+                        content=(
+                            text.html_content
+                            or MarkdownConverter().convert(text.content)
+                        )
                         if text.content
                         else None,
                         original_summary=text.summary,
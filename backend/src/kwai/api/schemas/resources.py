@@ -51,3 +51,9 @@ class CoachResourceIdentifier(ResourceIdentifier):
     """A JSON:API resource identifier for a coach."""
 
     type: Literal["coaches"] = "coaches"
+
+
+class TrainingGenerationResourceIdentifier(ResourceIdentifier):
+    """A JSON:API resource identifier for generating trainings."""
+
+    type: Literal["training_generations"] = "training_generations"
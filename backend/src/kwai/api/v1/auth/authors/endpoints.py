@@ -5,6 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.responses import JsonApiRoute
 from kwai.api.v1.auth.authors.presenters import JsonApiAuthorsPresenter
 from kwai.core.db.database import Database
 from kwai.core.json_api import PaginationModel
@@ -13,7 +14,7 @@ from kwai.modules.portal.get_authors import GetAuthors, GetAuthorsCommand
 from kwai.modules.portal.repositories.author_db_repository import AuthorDbRepository
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 @router.get(
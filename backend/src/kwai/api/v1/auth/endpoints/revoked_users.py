@@ -5,6 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.responses import JsonApiRoute
 from kwai.api.v1.auth.presenters import JsonApiRevokedUserPresenter
 from kwai.api.v1.auth.schemas.revoked_user import RevokedUserDocument
 from kwai.core.db.database import Database
@@ -18,7 +19,7 @@ from kwai.modules.identity.users.user_account_db_repository import (
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 @router.post(
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from loguru import logger
 
 from kwai.api.dependencies import create_database, get_current_user, get_publisher
+from kwai.api.responses import JsonApiRoute
 from kwai.api.v1.auth.schemas.user_invitation import UserInvitationDocument
 from kwai.core.db.database import Database
 from kwai.core.db.uow import UnitOfWork
@@ -37,7 +38,7 @@ from kwai.modules.identity.users.user import UserEntity
 from kwai.modules.identity.users.user_db_repository import UserDbRepository
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 @router.post(
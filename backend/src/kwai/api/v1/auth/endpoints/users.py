@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from loguru import logger
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.responses import JsonApiRoute
 from kwai.api.v1.auth.presenters import (
     JsonApiUserAccountPresenter,
     JsonApiUserAccountsPresenter,
@@ -38,7 +39,7 @@ from kwai.modules.identity.users.user_account_db_repository import (
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 @router.get(
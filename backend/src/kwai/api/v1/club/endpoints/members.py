@@ -2,48 +2,72 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 
 from kwai.api.dependencies import create_database, get_current_user
-from kwai.api.v1.club.presenters import JsonApiMemberPresenter, JsonApiMembersPresenter
+from kwai.api.responses import JsonApiRoute, JsonApiStreamingResponse
+from kwai.api.v1.club.presenters import JsonApiMemberPresenter
 from kwai.api.v1.club.schemas.member import MemberDocument
-from kwai.core.json_api import PaginationModel
+from kwai.core.domain.repository.cursor import InvalidCursorException
+from kwai.core.json_api import JsonApiStreamPresenter, PaginationModel
 from kwai.modules.club.get_member import GetMember, GetMemberCommand
 from kwai.modules.club.get_members import GetMembers, GetMembersCommand
 from kwai.modules.club.repositories.member_db_repository import MemberDbRepository
+from kwai.modules.club.repositories.member_query import MemberQuery
 from kwai.modules.club.repositories.member_repository import MemberNotFoundException
 from kwai.modules.identity.users.user import UserEntity
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 class MembersFilterModel(BaseModel):
     """Define the JSON:API filter for members."""
 
     enabled: bool = Field(Query(default=True, alias="filter[enabled]"))
-    license_end_month: int = Field(Query(default=0, alias="filter[license_end_month]"))
-    license_end_year: int = Field(Query(default=0, alias="filter[license_end_year]"))
+    license_end_month: int = Field(
+        Query(default=0, alias="filter[license_end_month]", ge=0, le=12)
+    )
+    license_end_year: int = Field(
+        Query(default=0, alias="filter[license_end_year]", ge=0)
+    )
 
 
-@router.get("/members")
+@router.get("/members", response_model=MemberDocument)
 async def get_members(
     pagination: PaginationModel = Depends(PaginationModel),
     members_filter: MembersFilterModel = Depends(MembersFilterModel),
     db=Depends(create_database),
     user: UserEntity = Depends(get_current_user),
-) -> MemberDocument:
-    """Get members."""
-    command = GetMembersCommand(
-        offset=pagination.offset or 0,
-        limit=pagination.limit or 0,
-        active=members_filter.enabled,
-        license_end_year=members_filter.license_end_year,
-        license_end_month=members_filter.license_end_month,
+) -> JsonApiStreamingResponse:
+    """Get members.
+
+    The members are streamed, so all members can be retrieved at once.
+
+    Use page[after] with the next_cursor of the meta to get the next page. The count
+    is only returned for the first page.
+    """
+    presenter = JsonApiStreamPresenter(
+        MemberDocument.create, create_cursor=MemberQuery.create_cursor
     )
-    presenter = JsonApiMembersPresenter()
-    await GetMembers(MemberDbRepository(db), presenter).execute(command)
+    try:
+        command = GetMembersCommand(
+            offset=pagination.offset or 0,
+            limit=pagination.limit or 0,
+            after=pagination.get_cursor(),
+            active=members_filter.enabled,
+            license_end_year=members_filter.license_end_year,
+            license_end_month=members_filter.license_end_month,
+        )
+        await GetMembers(MemberDbRepository(db), presenter).execute(command)
+    except InvalidCursorException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(ex)
+        ) from ex
 
-    return presenter.get_document()
+    return JsonApiStreamingResponse(
+        presenter.get_stream(), background=BackgroundTask(db.close)
+    )
 
 
 @router.get("/members/{uuid}")
@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile,
 from pydantic import BaseModel, Field
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.responses import JsonApiRoute
 from kwai.api.v1.club.presenters import JsonApiUploadMemberPresenter
 from kwai.api.v1.club.schemas.member import MemberDocument
 from kwai.core.db.database import Database
@@ -32,7 +33,7 @@ from kwai.modules.club.repositories.member_db_repository import MemberDbReposito
 from kwai.modules.identity.users.user import UserEntity
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 class UploadMemberModel(BaseModel):
@@ -1,7 +1,7 @@
 """Module that defines presenters for the club api."""
 
 from kwai.api.v1.club.schemas.member import MemberDocument
-from kwai.core.domain.presenter import AsyncPresenter, IterableResult, Presenter
+from kwai.core.domain.presenter import Presenter
 from kwai.core.json_api import Error, ErrorSource, JsonApiPresenter, Meta
 from kwai.modules.club.domain.member import MemberEntity
 from kwai.modules.club.import_members import (
@@ -18,21 +18,6 @@ class JsonApiMemberPresenter(JsonApiPresenter[MemberDocument], Presenter[MemberE
         self._document = MemberDocument.create(member)
 
 
-class JsonApiMembersPresenter(
-    JsonApiPresenter[MemberDocument], AsyncPresenter[IterableResult[MemberEntity]]
-):
-    """A presenter that transform an iterator for members into a JSON:API document."""
-
-    async def present(self, result: IterableResult[MemberEntity]) -> None:
-        self._document = MemberDocument(
-            meta=Meta(count=result.count, offset=result.offset, limit=result.limit),
-            data=[],
-        )
-        async for member in result.iterator:
-            member_document = MemberDocument.create(member)
-            self._document.merge(member_document)
-
-
 class JsonApiUploadMemberPresenter(
     JsonApiPresenter[MemberDocument], Presenter[MemberImportResult]
 ):
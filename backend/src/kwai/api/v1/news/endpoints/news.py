@@ -4,10 +4,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from kwai.api.dependencies import create_database, get_current_user, get_optional_user
+from kwai.api.http_cache import ConditionalGet
+from kwai.api.responses import JsonApiRoute
 from kwai.api.schemas.news_item import NewsItemDocument
+from kwai.core.domain.repository.cursor import InvalidCursorException
 from kwai.core.domain.use_case import TextCommand
 from kwai.core.domain.value_objects.owner import Owner
-from kwai.core.json_api import Meta, PaginationModel
+from kwai.core.json_api import DocumentBuilder, Meta, PaginationModel
 from kwai.modules.identity.users.user import UserEntity
 from kwai.modules.portal.applications.application_db_repository import (
     ApplicationDbRepository,
@@ -17,62 +20,102 @@ from kwai.modules.portal.delete_news_item import DeleteNewsItem, DeleteNewsItemC
 from kwai.modules.portal.get_news_item import GetNewsItem, GetNewsItemCommand
 from kwai.modules.portal.get_news_items import GetNewsItems, GetNewsItemsCommand
 from kwai.modules.portal.news.news_item_db_repository import NewsItemDbRepository
+from kwai.modules.portal.news.news_item_query import NewsItemQuery
 from kwai.modules.portal.news.news_item_repository import NewsItemNotFoundException
 from kwai.modules.portal.update_news_item import UpdateNewsItem, UpdateNewsItemCommand
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 class NewsFilterModel(BaseModel):
     """Define the JSON:API filter for news."""
 
     enabled: bool = Field(Query(default=True, alias="filter[enabled]"))
-    publish_year: int = Field(Query(default=0, alias="filter[publish_year]"))
-    publish_month: int = Field(Query(default=0, alias="filter[publish_month]"))
+    publish_year: int = Field(Query(default=0, alias="filter[publish_year]", ge=0))
+    publish_month: int = Field(
+        Query(default=0, alias="filter[publish_month]", ge=0, le=12)
+    )
     application: str | None = Field(Query(default=None, alias="filter[application]"))
     promoted: bool = Field(Query(default=False, alias="filter[promoted]"))
     author: str | None = Field(Query(default=None, alias="filter[author]"))
 
 
-@router.get("/news_items")
+@router.get(
+    "/news_items",
+    dependencies=[
+        Depends(
+            ConditionalGet("news_stories", "applications", cache=True, time_bucket=60)
+        )
+    ],
+)
 async def get_news_items(
     pagination: PaginationModel = Depends(PaginationModel),
     news_filter: NewsFilterModel = Depends(NewsFilterModel),
     db=Depends(create_database),
     user: UserEntity | None = Depends(get_optional_user),
 ) -> NewsItemDocument:
-    """Get news items."""
+    """Get news items.
+
+    Use page[after] with the next_cursor of the meta to get the next page. The count
+    is only returned for the first page. Promoted news items can't be paginated with
+    page[after], use page[offset] instead.
+    """
     # Only a know user is allowed to see disabled news.
     if user is None and not news_filter.enabled:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
 
-    command = GetNewsItemsCommand(
-        offset=pagination.offset or 0,
-        limit=pagination.limit or 10,
-        enabled=news_filter.enabled,
-        publish_year=news_filter.publish_year,
-        publish_month=news_filter.publish_month,
-        application=news_filter.application,
-        promoted=news_filter.promoted,
-        author_uuid=news_filter.author,
-    )
-    count, news_item_iterator = await GetNewsItems(NewsItemDbRepository(db)).execute(
-        command
-    )
+    if news_filter.promoted and pagination.after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="page[after] can't be used with filter[promoted]",
+        )
+
+    try:
+        command = GetNewsItemsCommand(
+            offset=pagination.offset or 0,
+            after=pagination.get_cursor(),
+            limit=pagination.limit or 10,
+            enabled=news_filter.enabled,
+            publish_year=news_filter.publish_year,
+            publish_month=news_filter.publish_month,
+            application=news_filter.application,
+            promoted=news_filter.promoted,
+            author_uuid=news_filter.author,
+        )
+        count, news_item_iterator = await GetNewsItems(
+            NewsItemDbRepository(db)
+        ).execute(command)
+    except InvalidCursorException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(ex)
+        ) from ex
 
-    result = NewsItemDocument(
-        meta=Meta(count=count, offset=command.offset, limit=command.limit), data=[]
+    builder = DocumentBuilder(
+        NewsItemDocument,
+        meta=Meta(count=count, offset=command.offset, limit=command.limit),
     )
 
+    news_item = None
     async for news_item in news_item_iterator:
-        news_document = NewsItemDocument.create(news_item)
-        result.merge(news_document)
+        builder.add(NewsItemDocument.create(news_item))
 
-    return result
+    if len(builder) == command.limit and not command.promoted:
+        builder.meta = builder.meta.with_next_cursor(
+            NewsItemQuery.create_cursor(news_item)
+        )
 
+    return builder.build()
 
-@router.get("/news_items/{id}")
+
+@router.get(
+    "/news_items/{id}",
+    dependencies=[
+        Depends(
+            ConditionalGet("news_stories", "applications", cache=True, time_bucket=60)
+        )
+    ],
+)
 async def get_news_item(
     id: int,
     db=Depends(create_database),
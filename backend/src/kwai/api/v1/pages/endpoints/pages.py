@@ -4,10 +4,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.http_cache import ConditionalGet
+from kwai.api.responses import JsonApiRoute
 from kwai.api.schemas.page import PageDocument
 from kwai.core.domain.use_case import TextCommand
 from kwai.core.domain.value_objects.owner import Owner
-from kwai.core.json_api import Meta, PaginationModel
+from kwai.core.json_api import DocumentBuilder, Meta, PaginationModel
 from kwai.modules.identity.users.user import UserEntity
 from kwai.modules.portal.applications.application_db_repository import (
     ApplicationDbRepository,
@@ -24,7 +26,7 @@ from kwai.modules.portal.pages.page_repository import PageNotFoundException
 from kwai.modules.portal.update_page import UpdatePage, UpdatePageCommand
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 class PageFilter(BaseModel):
@@ -33,7 +35,10 @@ class PageFilter(BaseModel):
     application: str | None = Field(Query(default=None, alias="filter[application]"))
 
 
-@router.get("/pages")
+@router.get(
+    "/pages",
+    dependencies=[Depends(ConditionalGet("pages", "applications", cache=True))],
+)
 async def get_pages(
     pagination: PaginationModel = Depends(PaginationModel),
     page_filter: PageFilter = Depends(PageFilter),
@@ -47,19 +52,22 @@ async def get_pages(
     )
     count, page_iterator = await GetPages(PageDbRepository(db)).execute(command)
 
-    result = PageDocument(
+    builder = DocumentBuilder(
+        PageDocument,
         meta=Meta(count=count, offset=command.offset, limit=command.limit),
-        data=[],
-        included=set(),
+        with_included=True,
     )
 
     async for page in page_iterator:
-        result.merge(PageDocument.create(page))
+        builder.add(PageDocument.create(page))
 
-    return result
+    return builder.build()
 
 
-@router.get("/pages/{id}")
+@router.get(
+    "/pages/{id}",
+    dependencies=[Depends(ConditionalGet("pages", "applications", cache=True))],
+)
 async def get_page(
     id: int,
     db=Depends(create_database),
@@ -3,8 +3,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.http_cache import ConditionalGet
+from kwai.api.responses import JsonApiRoute
 from kwai.api.schemas.application import ApplicationDocument
-from kwai.core.json_api import Meta
+from kwai.core.json_api import DocumentBuilder, Meta
 from kwai.modules.identity.users.user import UserEntity
 from kwai.modules.portal.applications.application_db_repository import (
     ApplicationDbRepository,
@@ -20,10 +22,13 @@ from kwai.modules.portal.update_application import (
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
-@router.get("/applications")
+@router.get(
+    "/applications",
+    dependencies=[Depends(ConditionalGet("applications", cache=True))],
+)
 async def get_applications(
     db=Depends(create_database),
 ) -> ApplicationDocument:
@@ -33,14 +38,17 @@ async def get_applications(
         ApplicationDbRepository(db)
     ).execute(command)
 
-    document = ApplicationDocument(meta=Meta(count=count), data=[])
+    builder = DocumentBuilder(ApplicationDocument, meta=Meta(count=count))
     async for application in application_iterator:
-        document.merge(ApplicationDocument.create(application))
+        builder.add(ApplicationDocument.create(application))
 
-    return document
+    return builder.build()
 
 
-@router.get("/applications/{id}")
+@router.get(
+    "/applications/{id}",
+    dependencies=[Depends(ConditionalGet("applications", cache=True))],
+)
 async def get_application(
     id: int,
     db=Depends(create_database),
@@ -3,17 +3,26 @@
 from fastapi import APIRouter, Depends
 
 from kwai.api.dependencies import create_database
+from kwai.api.http_cache import ConditionalGet
+from kwai.api.responses import JsonApiRoute
 from kwai.api.schemas.news_item import NewsItemDocument
 from kwai.core.db.database import Database
-from kwai.core.json_api import Meta, PaginationModel
+from kwai.core.json_api import DocumentBuilder, Meta, PaginationModel
 from kwai.modules.portal.get_news_items import GetNewsItems, GetNewsItemsCommand
 from kwai.modules.portal.news.news_item_db_repository import NewsItemDbRepository
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
-@router.get("/news")
+@router.get(
+    "/news",
+    dependencies=[
+        Depends(
+            ConditionalGet("news_stories", "applications", cache=True, time_bucket=60)
+        )
+    ],
+)
 async def get_news(
     pagination: PaginationModel = Depends(PaginationModel),
     db: Database = Depends(create_database),
@@ -30,12 +39,12 @@ async def get_news(
         command
     )
 
-    result = NewsItemDocument(
-        meta=Meta(count=count, offset=command.offset, limit=command.limit), data=[]
+    builder = DocumentBuilder(
+        NewsItemDocument,
+        meta=Meta(count=count, offset=command.offset, limit=command.limit),
     )
 
     async for news_item in news_item_iterator:
-        news_document = NewsItemDocument.create(news_item)
-        result.merge(news_document)
+        builder.add(NewsItemDocument.create(news_item))
 
-    return result
+    return builder.build()
@@ -4,8 +4,10 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.responses import JsonApiRoute, JsonApiStreamingResponse
 from kwai.api.v1.teams.presenters import (
     JsonApiMembersPresenter,
     JsonApiTeamMemberPresenter,
@@ -35,7 +37,7 @@ from kwai.modules.teams.update_team import UpdateTeam, UpdateTeamCommand
 from kwai.modules.training.teams.team_repository import TeamNotFoundException
 
 
-router = APIRouter(tags=["teams"])
+router = APIRouter(tags=["teams"], route_class=JsonApiRoute)
 
 
 @router.get("/teams")
@@ -55,13 +57,16 @@ class TeamMemberFilterModel(BaseModel):
     team: str | None = Field(Query(default=None, alias="filter[team]"))
 
 
-@router.get("/teams/members")
+@router.get("/teams/members", response_model=TeamMemberDocument)
 async def get_members(
     database: Annotated[Database, Depends(create_database)],
     pagination: Annotated[PaginationModel, Depends(PaginationModel)],
     team_filter: Annotated[TeamMemberFilterModel, Depends(TeamMemberFilterModel)],
-) -> TeamMemberDocument:
-    """Get all members that can be part of a team."""
+) -> JsonApiStreamingResponse:
+    """Get all members that can be part of a team.
+
+    The members are streamed, so all members can be retrieved at once.
+    """
     presenter = JsonApiMembersPresenter()
     if team_filter.team is not None:
         if ":" in team_filter.team:
@@ -98,7 +103,9 @@ async def get_members(
     else:
         command = GetMembersCommand(offset=pagination.offset, limit=pagination.limit)
     await GetMembers(MemberDbRepository(database), presenter).execute(command)
-    return presenter.get_document()
+    return JsonApiStreamingResponse(
+        presenter.get_stream(), background=BackgroundTask(database.close)
+    )
 
 
 @router.get("/teams/{id}")
@@ -2,7 +2,12 @@
 
 from kwai.api.v1.teams.schemas import TeamDocument, TeamMemberDocument
 from kwai.core.domain.presenter import AsyncPresenter, IterableResult, Presenter
-from kwai.core.json_api import JsonApiPresenter, Meta
+from kwai.core.json_api import (
+    DocumentBuilder,
+    JsonApiPresenter,
+    JsonApiStreamPresenter,
+    Meta,
+)
 from kwai.modules.teams.domain.team import TeamEntity
 from kwai.modules.teams.domain.team_member import MemberEntity, TeamMember
 
@@ -20,28 +25,22 @@ class JsonApiTeamsPresenter(
     """A presenter that transforms an iterator of teams into a JSON:API document."""
 
     async def present(self, result: IterableResult[TeamEntity]) -> None:
-        self._document = TeamDocument(
+        builder = DocumentBuilder(
+            TeamDocument,
             meta=Meta(count=result.count, offset=result.offset, limit=result.limit),
-            data=[],
         )
         async for team in result.iterator:
-            team_document = TeamDocument.create(team)
-            self._document.merge(team_document)
+            builder.add(TeamDocument.create(team))
+        self._document = builder.build()
 
 
-class JsonApiMembersPresenter(
-    JsonApiPresenter[TeamMemberDocument], AsyncPresenter[IterableResult[MemberEntity]]
-):
-    """A presenter that transforms an iterator of members into a TeamMember document."""
+class JsonApiMembersPresenter(JsonApiStreamPresenter[MemberEntity]):
+    """A presenter that streams an iterator of members as a TeamMember document."""
 
-    async def present(self, result: IterableResult[MemberEntity]) -> None:
-        self._document = TeamMemberDocument(
-            meta=Meta(count=result.count, offset=result.offset, limit=result.limit),
-            data=[],
+    def __init__(self) -> None:
+        super().__init__(
+            lambda member: TeamMemberDocument.create(TeamMember(member=member))
         )
-        async for member in result.iterator:
-            team_member_document = TeamMemberDocument.create(TeamMember(member=member))
-            self._document.merge(team_member_document)
 
 
 class JsonApiTeamMembersPresenter(
@@ -50,13 +49,12 @@ class JsonApiTeamMembersPresenter(
     """A presenter that transforms team members into a JSON:API document."""
 
     def present(self, team: TeamEntity) -> None:
-        self._document = TeamMemberDocument(
-            meta=Meta(count=len(team.members)),
-            data=[],
+        builder = DocumentBuilder(
+            TeamMemberDocument, meta=Meta(count=len(team.members))
         )
         for member in team.members.values():
-            team_member_document = TeamMemberDocument.create(member, team)
-            self._document.merge(team_member_document)
+            builder.add(TeamMemberDocument.create(member, team))
+        self._document = builder.build()
 
 
 class JsonApiTeamMemberPresenter(
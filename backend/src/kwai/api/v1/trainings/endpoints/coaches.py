@@ -5,6 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 
 from kwai.api.dependencies import create_database
+from kwai.api.responses import JsonApiRoute
 from kwai.api.v1.trainings.schemas.coach import CoachDocument
 from kwai.core.db.database import Database
 from kwai.core.json_api import Meta
@@ -12,7 +13,7 @@ from kwai.modules.training.coaches.coach_db_repository import CoachDbRepository
 from kwai.modules.training.get_coaches import GetCoaches, GetCoachesCommand
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 @router.get("/trainings/coaches")
@@ -3,13 +3,14 @@
 from fastapi import APIRouter, Depends
 
 from kwai.api.dependencies import create_database
+from kwai.api.responses import JsonApiRoute
 from kwai.api.v1.trainings.schemas.team import TeamDocument
 from kwai.core.json_api import Meta
 from kwai.modules.training.get_teams import GetTeams
 from kwai.modules.training.teams.team_db_repository import TeamDbRepository
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 @router.get("/trainings/teams")
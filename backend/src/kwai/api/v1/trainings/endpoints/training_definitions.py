@@ -3,11 +3,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.responses import JsonApiRoute
 from kwai.api.v1.trainings.endpoints.trainings import TrainingsFilterModel
 from kwai.api.v1.trainings.schemas.training import TrainingDocument
 from kwai.api.v1.trainings.schemas.training_definition import (
     TrainingDefinitionDocument,
+    TrainingGenerationDocument,
 )
+from kwai.core.db.uow import UnitOfWork
 from kwai.core.domain.value_objects.owner import Owner
 from kwai.core.json_api import Meta, PaginationModel
 from kwai.modules.identity.users.user import UserEntity
@@ -21,6 +24,10 @@ from kwai.modules.training.delete_training_definition import (
     DeleteTrainingDefinition,
     DeleteTrainingDefinitionCommand,
 )
+from kwai.modules.training.generate_trainings import (
+    GenerateTrainings,
+    GenerateTrainingsCommand,
+)
 from kwai.modules.training.get_training_definition import (
     GetTrainingDefinition,
     GetTrainingDefinitionCommand,
@@ -44,7 +51,7 @@ from kwai.modules.training.update_training_definition import (
 )
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 @router.get("/training_definitions")
@@ -259,3 +266,53 @@ async def get_trainings(
         document.merge(TrainingDocument.create(training))
 
     return document
+
+
+@router.post(
+    "/training_definitions/{training_definition_id}/trainings",
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "Training definition was not found."}
+    },
+)
+async def generate_trainings(
+    training_definition_id: int,
+    resource: TrainingGenerationDocument,
+    db=Depends(create_database),
+    user: UserEntity = Depends(get_current_user),
+) -> TrainingDocument:
+    """Generate the trainings of a training definition for a range of dates.
+
+    Dates that already have a training of the definition are skipped.
+    """
+    attributes = resource.data.attributes
+    command = GenerateTrainingsCommand(
+        definition=training_definition_id,
+        start_date=attributes.start_date.isoformat(),
+        end_date=attributes.end_date.isoformat(),
+        skip_dates=[skip_date.isoformat() for skip_date in attributes.skip_dates],
+        locale=attributes.locale,
+    )
+    try:
+        async with UnitOfWork(db):
+            trainings = await GenerateTrainings(
+                TrainingDbRepository(db),
+                TrainingDefinitionDbRepository(db),
+                Owner(id=user.id, uuid=user.uuid, name=user.name),
+            ).execute(command)
+    except TrainingDefinitionNotFoundException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(ex)
+        ) from ex
+    except ValueError as ve:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+        ) from ve
+
+    document: TrainingDocument = TrainingDocument(
+        meta=Meta(count=len(trainings)), data=[]
+    )
+    for training in trainings:
+        document.merge(TrainingDocument.create(training))
+
+    return document
@@ -4,12 +4,17 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 
 from kwai.api.dependencies import create_database, get_current_user
+from kwai.api.http_cache import ConditionalGet
+from kwai.api.responses import JsonApiRoute, JsonApiStreamingResponse
 from kwai.api.v1.trainings.schemas.training import TrainingDocument
+from kwai.api.v1.trainings.schemas.training_calendar import TrainingCalendarDocument
+from kwai.core.domain.repository.cursor import InvalidCursorException
 from kwai.core.domain.use_case import TextCommand
 from kwai.core.domain.value_objects.owner import Owner
-from kwai.core.json_api import Meta, PaginationModel
+from kwai.core.json_api import DocumentStream, Meta, PaginationModel
 from kwai.modules.identity.users.user import UserEntity
 from kwai.modules.training.coaches.coach_db_repository import CoachDbRepository
 from kwai.modules.training.coaches.coach_repository import CoachNotFoundException
@@ -19,6 +24,10 @@ from kwai.modules.training.create_training import (
 )
 from kwai.modules.training.delete_training import DeleteTraining, DeleteTrainingCommand
 from kwai.modules.training.get_training import GetTraining, GetTrainingCommand
+from kwai.modules.training.get_training_calendar import (
+    GetTrainingCalendar,
+    GetTrainingCalendarCommand,
+)
 from kwai.modules.training.get_trainings import GetTrainings, GetTrainingsCommand
 from kwai.modules.training.teams.team_db_repository import TeamDbRepository
 from kwai.modules.training.training_command import Coach
@@ -29,20 +38,21 @@ from kwai.modules.training.trainings.training_definition_db_repository import (
 from kwai.modules.training.trainings.training_definition_repository import (
     TrainingDefinitionNotFoundException,
 )
+from kwai.modules.training.trainings.training_query import TrainingQuery
 from kwai.modules.training.trainings.training_repository import (
     TrainingNotFoundException,
 )
 from kwai.modules.training.update_training import UpdateTraining, UpdateTrainingCommand
 
 
-router = APIRouter()
+router = APIRouter(route_class=JsonApiRoute)
 
 
 class TrainingsFilterModel(BaseModel):
     """Define the JSON:API filter for trainings."""
 
     year: int | None = Field(Query(default=None, alias="filter[year]"))
-    month: int | None = Field(Query(default=None, alias="filter[month]"))
+    month: int | None = Field(Query(default=None, alias="filter[month]", ge=1, le=12))
     start: datetime | None = Field(Query(default=None, alias="filter[start]"))
     end: datetime | None = Field(Query(default=None, alias="filter[end]"))
     active: bool = Field(Query(default=True, alias="filter[active]"))
@@ -52,6 +62,10 @@ class TrainingsFilterModel(BaseModel):
 
 @router.get(
     "/trainings",
+    response_model=TrainingDocument,
+    dependencies=[
+        Depends(ConditionalGet("trainings", "training_definitions", "coaches", "teams"))
+    ],
     responses={
         status.HTTP_404_NOT_FOUND: {
             "description": "Coach or Training definition was not found."
@@ -62,21 +76,27 @@ async def get_trainings(
     pagination: PaginationModel = Depends(PaginationModel),
     trainings_filter: TrainingsFilterModel = Depends(TrainingsFilterModel),
     db=Depends(create_database),
-) -> TrainingDocument:
-    """Get all trainings."""
-    command = GetTrainingsCommand(
-        offset=pagination.offset or 0,
-        limit=pagination.limit,
-        year=trainings_filter.year,
-        month=trainings_filter.month,
-        start=trainings_filter.start,
-        end=trainings_filter.end,
-        active=trainings_filter.active,
-        coach=trainings_filter.coach,
-        definition=trainings_filter.definition,
-    )
+) -> JsonApiStreamingResponse:
+    """Get all trainings.
+
+    The trainings are streamed, so all trainings of a year can be retrieved at once.
 
+    Use page[after] with the next_cursor of the meta to get the next page. The count
+    is only returned for the first page.
+    """
     try:
+        command = GetTrainingsCommand(
+            offset=pagination.offset or 0,
+            limit=pagination.limit,
+            after=pagination.get_cursor(),
+            year=trainings_filter.year,
+            month=trainings_filter.month,
+            start=trainings_filter.start,
+            end=trainings_filter.end,
+            active=trainings_filter.active,
+            coach=trainings_filter.coach,
+            definition=trainings_filter.definition,
+        )
         count, training_iterator = await GetTrainings(
             TrainingDbRepository(db),
             CoachDbRepository(db),
@@ -90,18 +110,74 @@ async def get_trainings(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(ex)
         ) from ex
+    except InvalidCursorException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(ex)
+        ) from ex
 
-    document: TrainingDocument = TrainingDocument(
-        meta=Meta(count=count, offset=command.offset, limit=command.limit), data=[]
+    stream = DocumentStream(
+        training_iterator,
+        TrainingDocument.create,
+        meta=Meta(count=count, offset=command.offset, limit=command.limit),
+        create_cursor=TrainingQuery.create_cursor,
     )
-    async for training in training_iterator:
-        document.merge(TrainingDocument.create(training))
+    return JsonApiStreamingResponse(stream, background=BackgroundTask(db.close))
+
+
+class TrainingCalendarFilterModel(BaseModel):
+    """Define the JSON:API filter for the training calendar."""
+
+    year: int | None = Field(Query(default=None, alias="filter[year]", ge=1))
+    month: int | None = Field(Query(default=None, alias="filter[month]", ge=1, le=12))
+    start: datetime | None = Field(Query(default=None, alias="filter[start]"))
+    end: datetime | None = Field(Query(default=None, alias="filter[end]"))
+    active: bool = Field(Query(default=True, alias="filter[active]"))
+    locale: str = Field(Query(default="nl", alias="filter[locale]"))
+
+
+@router.get(
+    "/trainings/calendar",
+    dependencies=[Depends(ConditionalGet("trainings", cache=True))],
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "description": "A year, or a start and end date is required."
+        }
+    },
+)
+async def get_training_calendar(
+    calendar_filter: TrainingCalendarFilterModel = Depends(TrainingCalendarFilterModel),
+    db=Depends(create_database),
+) -> TrainingCalendarDocument:
+    """Get the trainings for a calendar.
+
+    Only the data needed to show a training in a calendar is returned: the title,
+    start and end date, location, cancelled flag and the ids of the teams. Use
+    filter[year] and filter[month] for a month view. The response of a month for
+    anonymous users is cached until a training changes.
+    """
+    command = GetTrainingCalendarCommand(
+        year=calendar_filter.year,
+        month=calendar_filter.month,
+        start=calendar_filter.start,
+        end=calendar_filter.end,
+        active=calendar_filter.active,
+        locale=calendar_filter.locale,
+    )
+    try:
+        items = await GetTrainingCalendar(TrainingDbRepository(db)).execute(command)
+    except ValueError as ve:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)
+        ) from ve
 
-    return document
+    return TrainingCalendarDocument.create(items)
 
 
 @router.get(
     "/trainings/{training_id}",
+    dependencies=[
+        Depends(ConditionalGet("trainings", "training_definitions", "coaches", "teams"))
+    ],
     responses={status.HTTP_404_NOT_FOUND: {"description": "Training was not found."}},
 )
 async def get_training(
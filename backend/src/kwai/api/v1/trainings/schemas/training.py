@@ -5,7 +5,6 @@ from typing import Annotated
 
 from pydantic import BaseModel, Field
 
-from kwai.api.converter import MarkdownConverter
 from kwai.api.schemas.resources import (
     CoachResourceIdentifier,
     TeamResourceIdentifier,
@@ -17,6 +16,7 @@ from kwai.api.v1.trainings.schemas.training_definition import (
     TrainingDefinitionDocument,
     TrainingDefinitionResource,
 )
+from kwai.core.converter import MarkdownConverter
 from kwai.core.json_api import Document, Relationship, ResourceData
 from kwai.modules.training.trainings.training import TrainingEntity
 
@@ -105,8 +105,12 @@ class TrainingDocument(Document[TrainingResource, TrainingInclude]):
                         locale=text.locale.value,
                         format=text.format.value,
                         title=text.title,
-                        summary=MarkdownConverter().convert(text.summary),
-                        content=MarkdownConverter().convert(text.content)
+                        summary=text.html_summary
+                        or MarkdownConverter().convert(text.summary),
+                        content=(
+                            text.html_content
+                            or MarkdownConverter().convert(text.content)
+                        )
                         if text.content
                         else None,
                         original_summary=text.summary,
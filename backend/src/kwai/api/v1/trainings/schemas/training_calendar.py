@@ -0,0 +1,74 @@
+"""Schemas for the training calendar."""
+
+from types import NoneType
+
+from pydantic import BaseModel
+
+from kwai.api.schemas.resources import (
+    TeamResourceIdentifier,
+    TrainingResourceIdentifier,
+)
+from kwai.core.domain.value_objects.timestamp import Timestamp
+from kwai.core.json_api import Document, Meta, Relationship, ResourceData
+from kwai.modules.training.trainings.training_calendar_query import (
+    TrainingCalendarItem,
+)
+
+
+class TrainingCalendarAttributes(BaseModel):
+    """Attributes for a training in a calendar."""
+
+    title: str
+    start_date: str
+    end_date: str
+    location: str
+    cancelled: bool
+
+
+class TrainingCalendarRelationships(BaseModel):
+    """Relationships of a training in a calendar."""
+
+    teams: Relationship[TeamResourceIdentifier]
+
+
+class TrainingCalendarResource(
+    TrainingResourceIdentifier,
+    ResourceData[TrainingCalendarAttributes, TrainingCalendarRelationships],
+):
+    """A JSON:API resource for a training in a calendar.
+
+    The id is the id of the training, so the full training can be retrieved with
+    /trainings/{id}.
+    """
+
+
+class TrainingCalendarDocument(Document[TrainingCalendarResource, NoneType]):
+    """A JSON:API document for the trainings of a calendar."""
+
+    @classmethod
+    def create(cls, items: list[TrainingCalendarItem]) -> "TrainingCalendarDocument":
+        """Create a document from the calendar items."""
+        return TrainingCalendarDocument(
+            meta=Meta(count=len(items)),
+            data=[
+                TrainingCalendarResource(
+                    id=str(item.id),
+                    attributes=TrainingCalendarAttributes(
+                        title=item.title,
+                        start_date=str(Timestamp.create_utc(item.start_date)),
+                        end_date=str(Timestamp.create_utc(item.end_date)),
+                        location=item.location,
+                        cancelled=item.cancelled,
+                    ),
+                    relationships=TrainingCalendarRelationships(
+                        teams=Relationship[TeamResourceIdentifier](
+                            data=[
+                                TeamResourceIdentifier(id=str(team_id))
+                                for team_id in item.team_ids
+                            ]
+                        )
+                    ),
+                )
+                for item in items
+            ],
+        )
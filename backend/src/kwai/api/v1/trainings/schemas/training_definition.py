@@ -1,10 +1,13 @@
 """Module for the training definition schema."""
 
-from pydantic import BaseModel
+from datetime import date
+
+from pydantic import BaseModel, Field
 
 from kwai.api.schemas.resources import (
     TeamResourceIdentifier,
     TrainingDefinitionResourceIdentifier,
+    TrainingGenerationResourceIdentifier,
 )
 from kwai.api.v1.trainings.schemas.team import TeamAttributes, TeamResource
 from kwai.core.json_api import Document, Relationship, ResourceData, ResourceMeta
@@ -83,3 +86,26 @@ class TrainingDefinitionDocument(Document[TrainingDefinitionResource, TeamResour
             )
 
         return TrainingDefinitionDocument(data=data, included=included)
+
+
+class TrainingGenerationAttributes(BaseModel):
+    """Attributes for generating the trainings of a training definition."""
+
+    start_date: date
+    end_date: date
+    skip_dates: list[date] = Field(
+        default_factory=list,
+        description="Dates without a training, like holidays.",
+    )
+    locale: str = "nl"
+
+
+class TrainingGenerationResource(
+    TrainingGenerationResourceIdentifier,
+    ResourceData[TrainingGenerationAttributes, None],
+):
+    """A JSON:API resource for generating trainings."""
+
+
+class TrainingGenerationDocument(Document[TrainingGenerationResource, None]):
+    """A JSON:API document for generating the trainings of a training definition."""
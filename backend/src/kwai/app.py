@@ -1,12 +1,18 @@
 """Module that creates a FastAPI application for the API and Frontend."""
 
-from contextlib import asynccontextmanager
+import asyncio
 
-from fastapi import FastAPI
+from contextlib import AsyncExitStack, asynccontextmanager
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from loguru import logger
+from starlette.routing import Mount
 
 from kwai.api.app import create_api
+from kwai.core.settings import get_settings
 from kwai.frontend.app import create_frontend
+from kwai.warm_up import wait_for_database, warm_up
 
 
 APP_NAME = "kwai"
@@ -14,9 +20,40 @@ APP_NAME = "kwai"
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Log the start/stop of the application."""
+    """Log the start/stop of the application.
+
+    Starlette does not run the lifespan of mounted applications, so the lifespan
+    of each mounted FastAPI application is entered here.
+
+    After the start, the worker is warmed up in a background task. The worker
+    reports that it is ready (see /ready) when the warm-up is finished and the
+    database can be reached. Without a warm-up, the worker only waits for the
+    database.
+    """
     logger.info(f"{APP_NAME} is starting")
-    yield
+    app.state.ready = False
+    async with AsyncExitStack() as stack:
+        for route in app.routes:
+            if isinstance(route, Mount) and isinstance(route.app, FastAPI):
+                await stack.enter_async_context(
+                    route.app.router.lifespan_context(route.app)
+                )
+
+        settings = get_settings()
+
+        async def run_warm_up():
+            if settings.warm_up.enabled:
+                await warm_up(app, app.state.api_app, settings)
+            else:
+                await wait_for_database(settings)
+            app.state.ready = True
+
+        warm_up_task = asyncio.create_task(run_warm_up())
+
+        yield
+
+        if not warm_up_task.done():
+            warm_up_task.cancel()
     logger.warning(f"{APP_NAME} has ended!")
 
 
@@ -24,7 +61,21 @@ def create_app() -> FastAPI:
     """Create the FastAPI application for API and frontend."""
     main_app = FastAPI(title=APP_NAME, lifespan=lifespan)
 
+    @main_app.get("/ready", include_in_schema=False)
+    def ready(request: Request) -> JSONResponse:
+        """Return 200 when the worker is ready, 503 while it is warming up.
+
+        A worker is ready when the warm-up is done and the database can be reached.
+        """
+        if getattr(request.app.state, "ready", False):
+            return JSONResponse({"status": "ready"})
+        return JSONResponse(
+            {"status": "warming up"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
     api_app = create_api()
+    main_app.state.api_app = api_app
     main_app.mount("/api", api_app)
 
     frontend_app = create_frontend()
@@ -2,7 +2,8 @@
 
 from .bus import app as bus
 from .db import app as db
+from .frontend import app as frontend
 from .identity import app as identity
 
 
-__all__ = ["bus", "db", "identity"]
+__all__ = ["bus", "db", "frontend", "identity"]
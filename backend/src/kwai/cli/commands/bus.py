@@ -1,23 +1,33 @@
-"""bus contains subcommands for the event bus."""
+"""bus contains subcommands for the event bus.
 
+The modules for Redis and the event bus are imported by the commands that need
+them, so the cli starts fast.
+"""
+
+import asyncio
 import os
 
 from asyncio import run
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import inject
 import typer
 
-from redis import RedisError
-from redis.asyncio import Redis
 from rich import print
+from rich.live import Live
+from rich.table import Table
 from rich.tree import Tree
 from typer import Typer
 
-from kwai.core.events.stream import RedisStream
 from kwai.core.settings import ENV_SETTINGS_FILE, get_settings
 
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from kwai.core.events.stream import RedisStream
+
+
 def check():
     """Check if the environment variable is set. If not, stop the cli."""
     if ENV_SETTINGS_FILE not in os.environ:
@@ -33,7 +43,7 @@ def check():
 app = Typer(pretty_exceptions_short=True, callback=check)
 
 
-async def _create_groups_tree(stream_: RedisStream) -> Tree:
+async def _create_groups_tree(stream_: "RedisStream") -> Tree:
     tree = Tree("Groups:")
     groups_ = await stream_.get_groups()
     for group_info in groups_.values():
@@ -69,6 +79,12 @@ def test_command():
 
     When a connection was successful, a PING command will be sent to the redis server.
     """
+    from redis import RedisError
+    from redis.asyncio import Redis
+
+    from kwai.cli import dependencies
+
+    dependencies.configure()
 
     @inject.autoparams()
     async def execute(redis: Redis):
@@ -95,6 +111,13 @@ def groups_command(
     delete: Optional[bool] = typer.Option(default=False, help="Delete the group?"),
 ):
     """Command for showing groups of a stream."""
+    from redis import RedisError
+    from redis.asyncio import Redis
+
+    from kwai.cli import dependencies
+    from kwai.core.events.stream import RedisStream
+
+    dependencies.configure()
 
     @inject.autoparams()
     async def execute(redis: Redis):
@@ -155,6 +178,13 @@ def streams_command(groups: bool = typer.Option(False, help="List all groups")):
     Args:
         groups: List all groups of a stream or not? Default is False.
     """
+    from redis import RedisError
+    from redis.asyncio import Redis
+
+    from kwai.cli import dependencies
+    from kwai.core.events.stream import RedisStream
+
+    dependencies.configure()
 
     @inject.autoparams()
     async def execute(redis: Redis):
@@ -182,6 +212,13 @@ def stream_command(  # noqa
         name: The name of the stream.
         messages: List all messages or not? Default is False.
     """
+    from redis import RedisError
+    from redis.asyncio import Redis
+
+    from kwai.cli import dependencies
+    from kwai.core.events.stream import RedisStream
+
+    dependencies.configure()
 
     async def create_message_tree(stream: RedisStream) -> Tree:
         tree = Tree("Messages:")
@@ -240,3 +277,85 @@ def stream_command(  # noqa
             raise typer.Exit(code=1) from None
 
     run(execute())
+
+
+async def _create_stats_table(redis: "Redis") -> Table:
+    from kwai.core.events.metrics import EventBusMetrics, collect_group_stats
+
+    handlers = {
+        (handler.stream, handler.group): handler
+        for handler in await EventBusMetrics.load(redis)
+    }
+    table = Table(
+        "Stream",
+        "Group",
+        "Consumers",
+        "Pending",
+        "Lag",
+        "Handled",
+        "Failures",
+        "Avg. duration (ms)",
+        title="Event bus",
+    )
+    for stats in await collect_group_stats(redis):
+        handler = handlers.get((stats.stream, stats.group))
+        if handler is None or handler.count == 0:
+            handled = failures = duration = "-"
+        else:
+            handled = str(handler.count)
+            failures = str(handler.failures)
+            duration = f"{handler.sum / handler.count * 1000:.1f}"
+        table.add_row(
+            stats.stream,
+            stats.group,
+            str(stats.consumers),
+            str(stats.pending),
+            str(stats.lag),
+            handled,
+            failures,
+            duration,
+        )
+    return table
+
+
+@app.command(name="stats", help="Show statistics of all streams and groups.")
+def stats_command(
+    watch: int = typer.Option(
+        0, help="Refresh the statistics every n seconds. 0 shows them only once."
+    ),
+):
+    """Command for showing the statistics of the event bus.
+
+    For each group of a stream, the number of pending messages, the lag (messages
+    not yet delivered) and the metrics of the handler are shown. The metrics of the
+    handlers are stored by the event worker.
+
+    Args:
+        watch: Refresh the statistics every n seconds. 0 shows them only once.
+    """
+    from redis import RedisError
+    from redis.asyncio import Redis
+
+    from kwai.cli import dependencies
+
+    dependencies.configure()
+
+    @inject.autoparams()
+    async def execute(redis: Redis):
+        try:
+            table = await _create_stats_table(redis)
+            if watch <= 0:
+                print(table)
+                return
+            with Live(table, auto_refresh=False) as live:
+                while True:
+                    await asyncio.sleep(watch)
+                    live.update(await _create_stats_table(redis), refresh=True)
+        except RedisError as ex:
+            print("Could not retrieve the statistics!")
+            raise typer.Exit(code=1) from ex
+
+    try:
+        run(execute())
+    except KeyboardInterrupt:
+        pass
@@ -1,4 +1,8 @@
-"""db contains subcommands for the database."""
+"""db contains subcommands for the database.
+
+The modules for the database are imported by the commands that need them, so
+the cli starts fast.
+"""
 
 import os
 
@@ -10,7 +14,6 @@ import typer
 from rich import print
 from typer import Typer
 
-from kwai.core.db.database import Database
 from kwai.core.settings import ENV_SETTINGS_FILE, get_settings
 
 
@@ -52,6 +55,10 @@ def show(password: bool = typer.Option(False, help="Show the password")):
 @app.command(help="Test the database connection.")
 def test():
     """Command for testing the database connection."""
+    from kwai.cli import dependencies
+    from kwai.core.db.database import Database
+
+    dependencies.configure()
 
     @inject.autoparams()
     async def _main(database: Database):
@@ -69,3 +76,66 @@ def test():
         )
 
     run(_main())
+
+
+@app.command(help="Render the HTML of all stored texts.")
+def render(
+    force: bool = typer.Option(False, help="Also render texts that have HTML"),
+    batch_size: int = typer.Option(100, help="The number of texts in a batch"),
+):
+    """Command for rendering the HTML of news items, pages and trainings.
+
+    The HTML of a text is stored when the text is saved. Use this command to render
+    the HTML of existing texts.
+
+    Args:
+        force: render all texts, also the texts that already have HTML.
+        batch_size: the number of texts to render in one transaction.
+    """
+    from kwai.cli import dependencies
+    from kwai.core.db.database import Database
+    from kwai.core.db.text_renderer import TextRenderer
+    from kwai.modules.portal.news.news_tables import (
+        NewsItemsTable,
+        NewsItemTextsTable,
+    )
+    from kwai.modules.portal.pages.page_tables import PageContentsTable, PagesTable
+    from kwai.modules.training.trainings.training_tables import (
+        TrainingContentsTable,
+        TrainingsTable,
+    )
+
+    dependencies.configure()
+
+    @inject.autoparams()
+    async def _main(database: Database):
+        """Closure for handling the async code."""
+        try:
+            for table, id_column, collection in (
+                (NewsItemTextsTable, "news_id", NewsItemsTable),
+                (PageContentsTable, "page_id", PagesTable),
+                (TrainingContentsTable, "training_id", TrainingsTable),
+            ):
+                count = 0
+                renderer = TextRenderer(
+                    database,
+                    table.table_name,
+                    id_column,
+                    collection=collection.table_name,
+                    batch_size=batch_size,
+                )
+                async for rendered in renderer.render(force):
+                    count += rendered
+                    print(f"{table.table_name}: {count} texts rendered")
+                print(
+                    f"[bold green]Success! [/bold green] {table.table_name}: "
+                    f"{count} texts rendered."
+                )
+        except Exception as ex:
+            print("[bold red]Failed! [/bold red] Could not render the texts!")
+            print(ex)
+            raise typer.Exit(code=1) from None
+        finally:
+            await database.close()
+
+    run(_main())
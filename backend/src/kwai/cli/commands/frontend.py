@@ -0,0 +1,60 @@
+"""frontend contains subcommands for the frontend applications."""
+
+import os
+
+from pathlib import Path
+
+import typer
+
+from rich import print
+from typer import Typer
+
+from kwai.api.compression import BROTLI_AVAILABLE
+from kwai.core.settings import ENV_SETTINGS_FILE, get_settings
+from kwai.frontend.precompress import precompress
+
+
+def check():
+    """Check if the environment variable is set. If not, stop the cli."""
+    if ENV_SETTINGS_FILE not in os.environ:
+        print(
+            f"[bold red]Please set env variable {ENV_SETTINGS_FILE} to "
+            f"the configuration file.[/bold red]"
+        )
+        raise typer.Exit(code=1) from None
+    env_file = os.environ[ENV_SETTINGS_FILE]
+    print(f"Settings will be loaded from [bold green]{env_file}[/bold green].")
+
+
+app = Typer(pretty_exceptions_short=True, callback=check)
+
+
+@app.command(help="Create precompressed files for the frontend applications.")
+def compress(
+    minimum_size: int = typer.Option(1024, help="Minimum size of a file to compress"),
+):
+    """Command for creating the gzip and brotli files of the dist folders.
+
+    Run this command after a new build of the frontend applications is installed.
+    Brotli files are only created when the compression extra is installed.
+
+    Args:
+        minimum_size: Files smaller than this size are not compressed.
+    """
+    if not BROTLI_AVAILABLE:
+        print(
+            "[bold yellow]Warning![/bold yellow] Brotli files are not created, "
+            "install kwai with the compression extra."
+        )
+    settings = get_settings()
+    for application in settings.frontend.apps:
+        dist_path = Path(settings.frontend.path) / "apps" / application.name / "dist"
+        if not dist_path.is_dir():
+            print(f"[bold yellow]Skipped![/bold yellow] {dist_path} does not exist.")
+            continue
+
+        count = sum(1 for _ in precompress(dist_path, minimum_size))
+        print(
+            f"[bold green]Success! [/bold green] {application.name}: "
+            f"{count} files compressed."
+        )
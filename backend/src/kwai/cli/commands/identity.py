@@ -15,14 +15,7 @@ import typer
 from rich import print
 from typer import Typer
 
-from kwai.core.db.database import Database
-from kwai.core.db.uow import UnitOfWork
-from kwai.core.domain.exceptions import UnprocessableException
 from kwai.core.settings import ENV_SETTINGS_FILE
-from kwai.modules.identity.create_user import CreateUser, CreateUserCommand
-from kwai.modules.identity.users.user_account_db_repository import (
-    UserAccountDbRepository,
-)
 
 
 def check():
@@ -63,6 +56,16 @@ def create(
         last_name: The lastname of the new user
         password: The password of the new user
     """
+    from kwai.cli import dependencies
+    from kwai.core.db.database import Database
+    from kwai.core.db.uow import UnitOfWork
+    from kwai.core.domain.exceptions import UnprocessableException
+    from kwai.modules.identity.create_user import CreateUser, CreateUserCommand
+    from kwai.modules.identity.users.user_account_db_repository import (
+        UserAccountDbRepository,
+    )
+
+    dependencies.configure()
 
     @inject.autoparams()
     async def _main(database: Database):
@@ -0,0 +1,105 @@
+"""Module that defines an interface for a document converter."""
+
+import hashlib
+import threading
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+import markdown
+
+
+class DocumentConverter(ABC):
+    """Interface for a document converter.
+
+    A converter will convert a certain format (markdown for example) into HTML.
+    """
+
+    @abstractmethod
+    def convert(self, content: str) -> str:
+        """Convert a string to HTML."""
+        raise NotImplementedError
+
+
+class HtmlCache:
+    """A bounded LRU cache for converted HTML.
+
+    The key is a hash of the content, so the cache does not keep the
+    original content in memory.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: The maximum number of entries in the cache.
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return len(self._entries)
+
+    @classmethod
+    def create_key(cls, content: str, *extensions: str) -> bytes:
+        """Create a key from the content and the extensions used to convert it."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("|".join(extensions).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(content.encode("utf-8"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> str | None:
+        """Return the HTML for the key, or None when it is not cached."""
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+            return html
+
+    def set(self, key: bytes, html: str) -> None:
+        """Cache the HTML, and remove the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class MarkdownConverter(DocumentConverter):
+    """Converter for converting markdown into HTML.
+
+    The converted HTML is cached for all instances. A Markdown parser is created
+    once per thread and reused for all conversions.
+    """
+
+    extensions = ("tables",)
+    cache = HtmlCache()
+    _local = threading.local()
+
+    def convert(self, content: str) -> str:
+        """Convert markdown to HTML."""
+        key = HtmlCache.create_key(content, *self.extensions)
+        html = self.cache.get(key)
+        if html is None:
+            html = self._get_parser().reset().convert(content)
+            self.cache.set(key, html)
+        return html
+
+    @classmethod
+    def _get_parser(cls) -> markdown.Markdown:
+        """Return the Markdown parser of the current thread."""
+        if not hasattr(cls._local, "parsers"):
+            cls._local.parsers = {}
+        parser = cls._local.parsers.get(cls.extensions)
+        if parser is None:
+            parser = markdown.Markdown(extensions=list(cls.extensions))
+            cls._local.parsers[cls.extensions] = parser
+        return parser
@@ -0,0 +1,166 @@
+"""Module that defines version counters for collections of entities.
+
+A repository increments the version of its collection when an entity is created,
+updated or deleted. The version is changed with the same database connection, so
+it is part of the same transaction as the change of the entity. The name of a
+collection is the name of the main table of the entity.
+
+The versions can be used to validate cached data without querying the collection
+itself. To avoid a query for each validation, the versions can be kept in memory
+for a short time (see CollectionVersions.get_cached). An increment removes the
+version from the memory of the process. Other processes use the new version when
+the version in their memory is expired.
+"""
+
+import time
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sql_smith.functions import express
+
+from kwai.core.db.database import Database
+from kwai.core.db.table_row import TableRow
+from kwai.core.domain.value_objects.timestamp import Timestamp
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class CollectionVersion:
+    """The version of a collection.
+
+    Attributes:
+        name: The name of the collection.
+        version: The version, incremented on each change of the collection.
+        updated_at: The timestamp of the last change.
+    """
+
+    name: str
+    version: int = 0
+    updated_at: Timestamp = field(default_factory=Timestamp)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class CollectionVersionRow(TableRow):
+    """Represent a row of the collection_versions table."""
+
+    __table_name__ = "collection_versions"
+
+    name: str
+    version: int
+    updated_at: datetime | None
+
+    def create_version(self) -> CollectionVersion:
+        """Create a collection version from the row."""
+        return CollectionVersion(
+            name=self.name,
+            version=self.version,
+            updated_at=Timestamp.create_utc(self.updated_at),
+        )
+
+
+class CollectionVersionCache:
+    """Keeps the versions of collections in memory for a short time."""
+
+    def __init__(self, ttl: float = 2.0):
+        """Initialize the cache.
+
+        Args:
+            ttl: The number of seconds a version is kept.
+        """
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, CollectionVersion]] = {}
+
+    def get(self, name: str) -> CollectionVersion | None:
+        """Get the version of a collection, None is returned when it is missing."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        expires_at, version = entry
+        if expires_at < time.monotonic():
+            del self._entries[name]
+            return None
+        return version
+
+    def set(self, *versions: CollectionVersion) -> None:
+        """Store the versions."""
+        expires_at = time.monotonic() + self._ttl
+        for version in versions:
+            self._entries[version.name] = (expires_at, version)
+
+    def invalidate(self, *names: str) -> None:
+        """Remove the versions of the collections."""
+        for name in names:
+            self._entries.pop(name, None)
+
+    def clear(self) -> None:
+        """Remove all versions."""
+        self._entries.clear()
+
+
+# The versions that are kept in the memory of this process.
+collection_version_cache = CollectionVersionCache()
+
+
+class CollectionVersions:
+    """Get and increment the versions of collections."""
+
+    def __init__(self, database: Database):
+        self._database = database
+
+    async def get(self, *names: str) -> list[CollectionVersion]:
+        """Get the versions of the collections.
+
+        A collection without a version gets version 0.
+        """
+        query = (
+            Database.create_query_factory()
+            .select(*CollectionVersionRow.get_aliases())
+            .from_(CollectionVersionRow.__table_name__)
+            .where(CollectionVersionRow.field("name").in_(*names))
+        )
+        versions = {}
+        async for row in self._database.fetch(query):
+            version = CollectionVersionRow.map(row).create_version()
+            versions[version.name] = version
+        return [versions.get(name, CollectionVersion(name=name)) for name in names]
+
+    async def get_cached(self, *names: str) -> list[CollectionVersion]:
+        """Get the versions of the collections, using the versions in memory.
+
+        Only the versions that are not in memory are retrieved from the database.
+        A version can be outdated for a short time when it is changed by another
+        process.
+        """
+        versions = {
+            name: version
+            for name in names
+            if (version := collection_version_cache.get(name)) is not None
+        }
+        missing = [name for name in names if name not in versions]
+        if missing:
+            missing_versions = await self.get(*missing)
+            collection_version_cache.set(*missing_versions)
+            versions.update((version.name, version) for version in missing_versions)
+        return [versions[name] for name in names]
+
+    async def increment(self, *names: str) -> None:
+        """Increment the versions of the collections.
+
+        The changes are not committed, this is up to the caller. The versions are
+        removed from the memory of this process.
+        """
+        collection_version_cache.invalidate(*names)
+        now = Timestamp.create_now().timestamp
+        for name in names:
+            query = (
+                Database.create_query_factory()
+                .update(CollectionVersionRow.__table_name__)
+                .set({"version": express("version + 1"), "updated_at": now})
+                .where(CollectionVersionRow.field("name").eq(name))
+            )
+            result = await self._database.execute(query)
+            if result.rowcount == 0:
+                await self._database.insert(
+                    CollectionVersionRow.__table_name__,
+                    CollectionVersionRow(name=name, version=1, updated_at=now),
+                )
@@ -1,9 +1,11 @@
 """Module that implements a query for a database."""
 
 from abc import abstractmethod
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Literal, Sequence
 
-from sql_smith.functions import alias, func
+from sql_smith.functions import alias, field, func, group
+from sql_smith.interfaces import CriteriaInterface
+from sql_smith.query import Query as CompiledQuery
 from sql_smith.query import SelectQuery
 
 from kwai.core.db.database import Database
@@ -63,3 +65,103 @@ class DatabaseQuery(Query):
         self._query.columns(*self.columns)
 
         return self._database.fetch(self._query)
+
+
+def create_keyset_condition(
+    keys: Sequence[tuple[str, Literal["ASC", "DESC"]]], values: Sequence[Any]
+) -> CriteriaInterface:
+    """Create a condition that selects the rows after the values of a sort key.
+
+    This condition is used for keyset pagination. For a sort key (a ASC, b ASC)
+    and values (x, y) the condition is:
+
+        a >= x AND (a > x OR (a = x AND b > y))
+
+    The first part is redundant, but it allows the database to use an index on the
+    sort key for a range scan.
+
+    Args:
+        keys: The columns of the sort key with their sort direction.
+        values: The values of the last row of the previous page.
+    """
+
+    def compare(column: str, direction: str, value: Any, inclusive: bool = False):
+        column_field = field(column)
+        if direction == "ASC":
+            return column_field.gte(value) if inclusive else column_field.gt(value)
+        return column_field.lte(value) if inclusive else column_field.lt(value)
+
+    def after(index: int) -> CriteriaInterface:
+        column, direction = keys[index]
+        condition = compare(column, direction, values[index])
+        if index == len(keys) - 1:
+            return condition
+        return condition.or_(
+            group(field(column).eq(values[index]).and_(group(after(index + 1))))
+        )
+
+    if len(keys) == 1:
+        return after(0)
+
+    column, direction = keys[0]
+    return compare(column, direction, values[0], inclusive=True).and_(group(after(0)))
+
+
+def create_date_range_condition(
+    column: str, year: int, month: int | None = None
+) -> CriteriaInterface:
+    """Create a condition for the rows with a date in the given year or month.
+
+    The condition is a half-open range (column >= start AND column < end). Unlike
+    YEAR() and MONTH() on the column, this allows the database to use an index on
+    the column.
+
+    Args:
+        column: The name of the date column.
+        year: The year.
+        month: The month (1-12). When None, the whole year is selected.
+
+    Raises:
+        ValueError: when the month is not between 1 and 12.
+    """
+    if month is None:
+        start = f"{year:04d}-01-01"
+        end = f"{year + 1:04d}-01-01"
+    elif 1 <= month <= 12:
+        start = f"{year:04d}-{month:02d}-01"
+        if month == 12:
+            end = f"{year + 1:04d}-01-01"
+        else:
+            end = f"{year:04d}-{month + 1:02d}-01"
+    else:
+        raise ValueError(f"Invalid month: {month}")
+
+    return group(field(column).gte(start).and_(field(column).lt(end)))
+
+
+class SelectForUpdate:
+    """A SELECT query that locks the selected rows (SELECT ... FOR UPDATE).
+
+    The rows stay locked until the transaction ends, so the query must be executed
+    within a unit of work. With skip_locked, rows that are locked by another
+    transaction are skipped instead of waited for. This allows multiple processes
+    to consume rows of the same table without handling a row twice.
+    """
+
+    def __init__(self, query: SelectQuery, *, skip_locked: bool = False):
+        """Initialize the query.
+
+        Args:
+            query: The SELECT query.
+            skip_locked: Skip the rows that are locked by another transaction.
+        """
+        self._query = query
+        self._skip_locked = skip_locked
+
+    def compile(self) -> CompiledQuery:
+        """Compile the query."""
+        compiled_query = self._query.compile()
+        sql = compiled_query.sql + " FOR UPDATE"
+        if self._skip_locked:
+            sql += " SKIP LOCKED"
+        return CompiledQuery(sql, compiled_query.params)
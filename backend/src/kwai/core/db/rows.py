@@ -68,6 +68,8 @@ class TextRow:
         user_id: The id of the author
         created_at: the timestamp of creation
         updated_at: the timestamp of the last modification
+        html_summary: The summary rendered as HTML
+        html_content: The content rendered as HTML
     """
 
     locale: str
@@ -78,6 +80,8 @@ class TextRow:
     user_id: int
     created_at: datetime
     updated_at: datetime | None
+    html_summary: str | None = None
+    html_content: str | None = None
 
     def create_text(self, author: Owner) -> LocaleText:
         """Create a LocaleText value object from a row.
@@ -96,4 +100,6 @@ class TextRow:
                 created_at=Timestamp.create_utc(self.created_at),
                 updated_at=Timestamp.create_utc(self.updated_at),
             ),
+            html_summary=self.html_summary,
+            html_content=self.html_content,
         )
@@ -0,0 +1,115 @@
+"""Module that defines a renderer for the HTML of stored texts.
+
+The HTML of a text is rendered when the text is saved. The renderer is used to
+(re)render the HTML of texts that are already stored, for example after the HTML
+columns are added or when the markdown extensions are changed.
+"""
+
+from typing import AsyncIterator
+
+from sql_smith.functions import field, group
+
+from kwai.core.converter import MarkdownConverter
+from kwai.core.db.collection_versions import CollectionVersions
+from kwai.core.db.database import Database
+
+
+class TextRenderer:
+    """Render the HTML of all texts of a content table in batches.
+
+    The rows are processed in order of their primary key (id and locale), so a
+    batch never needs an offset. The version of the collection is incremented with
+    each batch, so cached responses with the old HTML are no longer used.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        table_name: str,
+        id_column: str,
+        *,
+        collection: str,
+        batch_size: int = 100,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            database: The database to use.
+            table_name: The name of the content table.
+            id_column: The column that refers to the entity of the text.
+            collection: The name of the collection of the entity.
+            batch_size: The number of rows to render in one transaction.
+        """
+        self._database = database
+        self._table_name = table_name
+        self._id_column = id_column
+        self._collection = collection
+        self._batch_size = batch_size
+
+    async def render(self, force: bool = False) -> AsyncIterator[int]:
+        """Render the texts and yield the number of rendered rows for each batch.
+
+        Args:
+            force: When False, only texts without HTML are rendered.
+        """
+        converter = MarkdownConverter()
+        last_key = None
+        while True:
+            rows = [row async for row in self._fetch_batch(last_key, force)]
+            if len(rows) == 0:
+                return
+
+            for row in rows:
+                query = (
+                    self._database.create_query_factory()
+                    .update(self._table_name)
+                    .set(
+                        {
+                            "html_summary": converter.convert(row["summary"]),
+                            "html_content": converter.convert(row["content"])
+                            if row["content"]
+                            else None,
+                        }
+                    )
+                    .where(
+                        field(self._id_column)
+                        .eq(row[self._id_column])
+                        .and_(field("locale").eq(row["locale"]))
+                    )
+                )
+                await self._database.execute(query)
+            await CollectionVersions(self._database).increment(self._collection)
+            await self._database.commit()
+
+            last_key = (rows[-1][self._id_column], rows[-1]["locale"])
+            yield len(rows)
+
+    def _fetch_batch(
+        self, last_key: tuple[int, str] | None, force: bool
+    ) -> AsyncIterator[dict]:
+        """Fetch the next batch of rows."""
+        query = (
+            self._database.create_query_factory()
+            .select(self._id_column, "locale", "summary", "content")
+            .from_(self._table_name)
+            .order_by(self._id_column)
+            .order_by("locale")
+            .limit(self._batch_size)
+        )
+        if last_key is not None:
+            query = query.and_where(
+                group(
+                    field(self._id_column)
+                    .gt(last_key[0])
+                    .or_(
+                        group(
+                            field(self._id_column)
+                            .eq(last_key[0])
+                            .and_(field("locale").gt(last_key[1]))
+                        )
+                    )
+                )
+            )
+        if not force:
+            query = query.and_where(field("html_summary").is_null())
+        return self._database.fetch(query)
@@ -7,9 +7,12 @@ from typing import AsyncIterator
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class IterableResult[T]:
-    """A dataclass used to represent a result with multiple entities."""
+    """A dataclass used to represent a result with multiple entities.
 
-    count: int
+    The count can be None when it is not calculated.
+    """
+
+    count: int | None
     offset: int = 0
     limit: int = 0
     iterator: AsyncIterator[T]
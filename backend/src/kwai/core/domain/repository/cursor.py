@@ -0,0 +1,86 @@
+"""Module that defines a cursor for keyset pagination.
+
+A cursor contains the values of the sort key of the last entity of a page. The next
+page starts after these values, so a query doesn't need to skip rows with an
+offset: a deep page costs the same as the first page.
+
+A cursor is encoded as an opaque token, so it can be used in a URL.
+"""
+
+import base64
+import binascii
+import json
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+class InvalidCursorException(Exception):
+    """Raised when a token can't be decoded into a cursor."""
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    """The values of the sort key of the last entity of a page.
+
+    Attributes:
+        values: The values of the sort key, for example a date and an id.
+    """
+
+    values: tuple[int | str, ...]
+
+    @classmethod
+    def create(cls, *values: int | str) -> "Cursor":
+        """Create a cursor from the values of the sort key."""
+        return Cursor(values=values)
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque token."""
+        data = json.dumps(self.values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """Decode a token into a cursor.
+
+        Raises:
+            InvalidCursorException: when the token is not a valid cursor.
+        """
+        try:
+            data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            values = json.loads(data)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as ex:
+            raise InvalidCursorException(f"Invalid cursor: {token}") from ex
+
+        if not isinstance(values, list) or not all(
+            isinstance(value, int | str) and not isinstance(value, bool)
+            for value in values
+        ):
+            raise InvalidCursorException(f"Invalid cursor: {token}")
+        return Cursor(values=tuple(values))
+
+    def unpack(self, *types: type) -> tuple[Any, ...]:
+        """Return the values after checking them against the expected types.
+
+        A value for a datetime type is converted from its string representation.
+
+        Raises:
+            InvalidCursorException: when the values don't match the types.
+        """
+        if len(self.values) != len(types):
+            raise InvalidCursorException("The cursor doesn't match the sort key")
+
+        values = []
+        for value, type_ in zip(self.values, types, strict=True):
+            if type_ is datetime and isinstance(value, str):
+                try:
+                    value = datetime.fromisoformat(value)
+                except ValueError as ex:
+                    raise InvalidCursorException(
+                        "The cursor doesn't match the sort key"
+                    ) from ex
+            if not isinstance(value, type_):
+                raise InvalidCursorException("The cursor doesn't match the sort key")
+            values.append(value)
+        return tuple(values)
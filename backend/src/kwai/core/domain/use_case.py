@@ -47,9 +47,13 @@ class EntityResult[T](UseCaseResult):
 
 
 class UseCaseBrowseResult(NamedTuple):
-    """A named tuple for a use case that returns a result of browsing entities."""
+    """A named tuple for a use case that returns a result of browsing entities.
 
-    count: int
+    The count can be None when it is not calculated, for example for the next pages
+    of a keyset pagination.
+    """
+
+    count: int | None
     iterator: AsyncIterator
 
 
@@ -37,6 +37,8 @@ class LocaleText:
         summary: The summary of the content.
         author: The author of the content.
         traceable_time: The creation and modification timestamp of the content.
+        html_summary: The summary rendered as HTML, when it was stored.
+        html_content: The content rendered as HTML, when it was stored.
     """
 
     locale: Locale
@@ -46,6 +48,8 @@ class LocaleText:
     summary: str
     author: Owner
     traceable_time: TraceableTime = field(default_factory=TraceableTime)
+    html_summary: str | None = None
+    html_content: str | None = None
 
 
 class Text:
@@ -0,0 +1,147 @@
+"""Module that defines codecs for serializing the data of a message on a stream.
+
+The content type of the codec is stored together with the data of a message. This
+makes it possible to decode a message, even when the stream contains messages that
+are encoded with another codec. Messages without a content type are JSON encoded.
+
+orjson and msgpack are optional: the codecs that depend on these packages can only
+be used when the events-fast extra is installed (pip install kwai[events-fast]).
+"""
+
+import json
+
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]
+
+
+_EXTRA_MISSING = "{package} is not installed, install kwai with the events-fast extra"
+
+
+class EventCodecException(ValueError):
+    """Raised when data can't be encoded or decoded."""
+
+
+class EventCodec(ABC):
+    """Interface for a codec."""
+
+    content_type: ClassVar[str]
+
+    @abstractmethod
+    def encode(self, data: dict[str, Any]) -> bytes:
+        """Encode the data."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, data: bytes) -> dict[str, Any]:
+        """Decode the data.
+
+        Raises:
+            EventCodecException: when the data can't be decoded.
+        """
+        raise NotImplementedError
+
+
+class JsonCodec(EventCodec):
+    """A codec that uses the json module of the standard library."""
+
+    content_type = "application/json"
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        try:
+            return json.loads(data)
+        except ValueError as ex:
+            raise EventCodecException(str(ex)) from ex
+
+
+class OrjsonCodec(EventCodec):
+    """A codec that uses orjson.
+
+    The result is JSON, so messages can also be decoded with the JsonCodec.
+    """
+
+    content_type = "application/json"
+
+    def __init__(self):
+        """Initialize the codec.
+
+        Raises:
+            EventCodecException: when orjson is not installed.
+        """
+        if orjson is None:
+            raise EventCodecException(_EXTRA_MISSING.format(package="orjson"))
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data)
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as ex:
+            raise EventCodecException(str(ex)) from ex
+
+
+class MsgpackCodec(EventCodec):
+    """A codec that uses msgpack."""
+
+    content_type = "application/msgpack"
+
+    def __init__(self):
+        """Initialize the codec.
+
+        Raises:
+            EventCodecException: when msgpack is not installed.
+        """
+        if msgpack is None:
+            raise EventCodecException(_EXTRA_MISSING.format(package="msgpack"))
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return msgpack.packb(data)
+
+    def decode(self, data: bytes) -> dict[str, Any]:
+        try:
+            return msgpack.unpackb(data)
+        except (ValueError, msgpack.UnpackException) as ex:
+            raise EventCodecException(str(ex)) from ex
+
+
+def create_json_codec() -> EventCodec:
+    """Return the fastest available JSON codec."""
+    if orjson is None:
+        return JsonCodec()
+    return OrjsonCodec()
+
+
+_json_codec = create_json_codec()
+_msgpack_codec = MsgpackCodec() if msgpack is not None else None
+
+
+def get_codec(content_type: str | None) -> EventCodec:
+    """Return a codec that can decode data with the given content type.
+
+    Args:
+        content_type: The content type. None means JSON.
+
+    Raises:
+        EventCodecException: when there is no codec available for the content type.
+    """
+    if content_type is None or content_type == JsonCodec.content_type:
+        return _json_codec
+    if content_type == MsgpackCodec.content_type:
+        if _msgpack_codec is None:
+            raise EventCodecException(_EXTRA_MISSING.format(package="msgpack"))
+        return _msgpack_codec
+    raise EventCodecException(f"No codec available for {content_type}")
@@ -33,8 +33,11 @@ async def create_database(
 def create_template_engine(
     settings: Settings,
 ) -> TemplateEngine:
-    """Create the template engine dependency."""
-    return Jinja2Engine(website=settings.website)
+    """Create the template engine dependency.
+
+    The engine is bound as a singleton, so all tasks share the compiled templates.
+    """
+    return Jinja2Engine.create_from_settings(settings)
 
 
 @inject.autoparams()
@@ -55,7 +58,7 @@ def create_mailer(settings: Settings) -> Mailer:
 def _configure_dependencies(binder: Binder):
     binder.bind_to_provider(Settings, get_settings)
     binder.bind_to_provider(Database, create_database)
-    binder.bind_to_provider(TemplateEngine, create_template_engine)
+    binder.bind_to_constructor(TemplateEngine, create_template_engine)
     binder.bind_to_provider(Mailer, create_mailer)
 
 
@@ -3,7 +3,8 @@
 import dataclasses
 
 from dataclasses import dataclass
-from typing import ClassVar
+from functools import cached_property
+from typing import Any, ClassVar, Self
 
 from kwai.core.domain.value_objects.timestamp import Timestamp
 
@@ -30,6 +31,22 @@ class EventMeta:
         """Return the full name of the event."""
         return f"kwai/{self.version}/{self.module}/{self.name}"
 
+    @cached_property
+    def data(self) -> dict[str, str]:
+        """Return the metadata as dict.
+
+        The dict is only created once, don't change it.
+        """
+        return dataclasses.asdict(self)
+
+    def matches(self, data: dict[str, Any]) -> bool:
+        """Check if serialized metadata belongs to this metadata."""
+        return (
+            data.get("version", "v1") == self.version
+            and data.get("module") == self.module
+            and data.get("name") == self.name
+        )
+
 
 @dataclass(kw_only=True, frozen=True)
 class Event:
@@ -42,8 +59,23 @@ class Event:
         """Returns a dict that can be used to serialize the event."""
         return {
             "meta": {
-                **dataclasses.asdict(self.__class__.meta),
+                **self.__class__.meta.data,
                 "date": str(Timestamp.create_now()),
             },
             "data": {**dataclasses.asdict(self)},
         }
+
+    @classmethod
+    def create_from_data(cls, data: dict[str, Any]) -> Self:
+        """Create the event from serialized data (for example read from a stream).
+
+        Raises:
+            ValueError: when the data belongs to another event or to another version
+                of the event.
+        """
+        if not cls.meta.matches(data.get("meta", {})):
+            raise ValueError(
+                f"Data with meta {data.get('meta')} can't be used to create "
+                f"an event for {cls.meta.full_name}"
+            )
+        return cls(**data["data"])
@@ -0,0 +1,35 @@
+"""Module that implements a publisher that keeps the events in memory.
+
+This publisher can be used as a test double for use cases that publish events.
+"""
+
+from kwai.core.events.event import Event
+from kwai.core.events.publisher import Publisher
+
+
+class MemoryPublisher(Publisher):
+    """A publisher that stores all published events in a list."""
+
+    def __init__(self):
+        self._events: list[tuple[str, Event]] = []
+
+    @property
+    def events(self) -> list[Event]:
+        """Return all published events."""
+        return [event for _, event in self._events]
+
+    @property
+    def ids(self) -> list[str]:
+        """Return the ids of all published events."""
+        return [id_ for id_, _ in self._events]
+
+    def _append(self, event: Event) -> str:
+        id_ = f"{len(self._events) + 1}-0"
+        self._events.append((id_, event))
+        return id_
+
+    async def publish(self, event: Event):
+        self._append(event)
+
+    async def publish_many(self, *events: Event) -> list[str]:
+        return [self._append(event) for event in events]
@@ -0,0 +1,308 @@
+"""Module that defines metrics for the event bus.
+
+There are two kinds of metrics:
+
++ Metrics of the streams and groups (length, pending messages, lag, ...). These are
+  retrieved from Redis.
++ Metrics of the handlers (duration, failures). These are collected by the event
+  worker. Each worker stores a snapshot of its metrics in Redis, so that the API
+  and the CLI can report them. The snapshot expires when the worker stops storing
+  it. When loaded, the snapshots of all workers are summed.
+"""
+
+import json
+import os
+import socket
+
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+from redis.asyncio import Redis
+
+from kwai.core.events.stream import RedisStream
+
+
+HANDLER_METRICS_KEY = "kwai/metrics/handlers"
+
+# The maximum number of entries counted when Redis can't report the lag.
+MAX_LAG_COUNT = 10_000
+
+# The number of seconds a snapshot of a worker is kept after it was stored.
+HANDLER_METRICS_TTL = 60
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(kw_only=True, slots=True)
+class HandlerMetrics:
+    """Metrics for the handler of a group.
+
+    Attributes:
+        stream: The name of the stream.
+        group: The name of the group (the handler).
+        buckets: The upper bounds (in seconds) of the histogram buckets.
+        bucket_counts: The number of observations per bucket (not cumulative).
+        count: The number of handled messages.
+        sum: The total duration of all handled messages.
+        failures: The number of messages that were not handled successfully.
+            These messages stay pending and will be retried.
+    """
+
+    stream: str
+    group: str
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    bucket_counts: list[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+    failures: int = 0
+
+    def __post_init__(self):
+        """Initialize the bucket counts when they are not set."""
+        if len(self.bucket_counts) == 0:
+            self.bucket_counts = [0] * len(self.buckets)
+
+    def observe(self, duration: float, success: bool = True):
+        """Observe the duration of a handled message."""
+        self.count += 1
+        self.sum += duration
+        if not success:
+            self.failures += 1
+        for index, bound in enumerate(self.buckets):
+            if duration <= bound:
+                self.bucket_counts[index] += 1
+                break
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict."""
+        return {
+            "stream": self.stream,
+            "group": self.group,
+            "buckets": list(self.buckets),
+            "bucket_counts": self.bucket_counts,
+            "count": self.count,
+            "sum": self.sum,
+            "failures": self.failures,
+        }
+
+    def merge(self, other: "HandlerMetrics"):
+        """Add the observations of other metrics of the same handler.
+
+        Raises:
+            ValueError: Raised when the buckets are not the same.
+        """
+        if self.buckets != other.buckets:
+            raise ValueError(
+                f"Buckets of {self.stream}|{self.group} are not the same, "
+                "metrics can't be merged."
+            )
+        self.bucket_counts = [
+            count + other_count
+            for count, other_count in zip(
+                self.bucket_counts, other.bucket_counts, strict=True
+            )
+        ]
+        self.count += other.count
+        self.sum += other.sum
+        self.failures += other.failures
+
+    @classmethod
+    def create_from_dict(cls, data: dict[str, Any]) -> Self:
+        """Create the metrics from a dict."""
+        return cls(
+            stream=data["stream"],
+            group=data["group"],
+            buckets=tuple(data["buckets"]),
+            bucket_counts=list(data["bucket_counts"]),
+            count=data["count"],
+            sum=data["sum"],
+            failures=data["failures"],
+        )
+
+
+class EventBusMetrics:
+    """Collects the metrics of the handlers in the event worker."""
+
+    def __init__(self, worker: str | None = None, ttl: int = HANDLER_METRICS_TTL):
+        """Initialize the metrics.
+
+        Args:
+            worker: The name of the worker. Default is host:pid.
+            ttl: The number of seconds a stored snapshot is kept.
+        """
+        self._worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+        self._ttl = ttl
+        self._handlers: dict[tuple[str, str], HandlerMetrics] = {}
+
+    @property
+    def handlers(self) -> list[HandlerMetrics]:
+        """Return the metrics of all handlers."""
+        return list(self._handlers.values())
+
+    def observe(self, stream: str, group: str, duration: float, success: bool):
+        """Observe a handled message."""
+        key = (stream, group)
+        if key not in self._handlers:
+            self._handlers[key] = HandlerMetrics(stream=stream, group=group)
+        self._handlers[key].observe(duration, success)
+
+    async def store(self, redis: Redis):
+        """Store a snapshot of the metrics in Redis.
+
+        The snapshot is stored in a hash per worker, which expires when the worker
+        doesn't store it again within the ttl.
+        """
+        if len(self._handlers) == 0:
+            return
+        key = f"{HANDLER_METRICS_KEY}/{self._worker}"
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                key,
+                mapping={
+                    f"{stream}|{group}": json.dumps(metrics.to_dict())
+                    for (stream, group), metrics in self._handlers.items()
+                },
+            )
+            pipe.expire(key, self._ttl)
+            await pipe.execute()
+
+    @classmethod
+    async def load(cls, redis: Redis) -> list[HandlerMetrics]:
+        """Load the metrics that are stored by the event workers.
+
+        The metrics of the same handler are summed over all workers.
+        """
+        handlers: dict[tuple[str, str], HandlerMetrics] = {}
+        async for key in redis.scan_iter(match=f"{HANDLER_METRICS_KEY}/*"):
+            values = await redis.hgetall(key)
+            for value in values.values():
+                metrics = HandlerMetrics.create_from_dict(json.loads(value))
+                handler_key = (metrics.stream, metrics.group)
+                if handler_key in handlers:
+                    handlers[handler_key].merge(metrics)
+                else:
+                    handlers[handler_key] = metrics
+        return list(handlers.values())
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class GroupStats:
+    """Statistics of a group of a stream.
+
+    Attributes:
+        stream: The name of the stream.
+        length: The number of entries on the stream.
+        last_entry_id: The id of the last entry on the stream.
+        group: The name of the group.
+        consumers: The number of consumers of the group.
+        pending: The number of messages delivered, but not yet acknowledged.
+        last_delivered_id: The id of the last message delivered to the group.
+        lag: The number of messages not yet delivered to the group.
+    """
+
+    stream: str
+    length: int
+    last_entry_id: str
+    group: str
+    consumers: int
+    pending: int
+    last_delivered_id: str
+    lag: int
+
+
+async def collect_group_stats(redis: Redis) -> list[GroupStats]:
+    """Collect the statistics of all groups of all streams."""
+    result = []
+    async for stream_name in redis.scan_iter(type_="STREAM"):
+        stream = RedisStream(redis, stream_name.decode("utf-8"))
+        info = await stream.info()
+        if info is None:
+            continue
+        for group in (await stream.get_groups()).values():
+            lag = group.lag
+            if lag is None:
+                lag = await stream.count_entries_after(
+                    group.last_delivered_id, limit=MAX_LAG_COUNT
+                )
+            result.append(
+                GroupStats(
+                    stream=stream.name,
+                    length=info.length,
+                    last_entry_id=info.last_entry,
+                    group=group.name,
+                    consumers=group.consumers,
+                    pending=group.pending,
+                    last_delivered_id=group.last_delivered_id,
+                    lag=lag,
+                )
+            )
+    return result
+
+
+def _labels(**labels: str) -> str:
+    """Format labels for the Prometheus text format."""
+    formatted = []
+    for name, value in labels.items():
+        value = value.replace("\\", "\\\\").replace('"', '\\"')
+        formatted.append(f'{name}="{value}"')
+    return "{" + ",".join(formatted) + "}"
+
+
+def render_prometheus(
+    group_stats: list[GroupStats], handlers: list[HandlerMetrics]
+) -> str:
+    """Render the metrics in the Prometheus text format."""
+    lines: list[str] = []
+
+    def add_gauge(name: str, help_: str, values: list[tuple[str, int | float]]):
+        lines.append(f"# HELP {name} {help_}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(f"{name}{labels} {value}" for labels, value in values)
+
+    streams = {stats.stream: stats.length for stats in group_stats}
+    add_gauge(
+        "kwai_bus_stream_length",
+        "Number of entries on the stream.",
+        [(_labels(stream=stream), length) for stream, length in streams.items()],
+    )
+    for name, attribute, help_ in (
+        ("kwai_bus_group_consumers", "consumers", "Number of consumers."),
+        ("kwai_bus_group_pending", "pending", "Number of unacknowledged messages."),
+        ("kwai_bus_group_lag", "lag", "Number of messages not yet delivered."),
+    ):
+        add_gauge(
+            name,
+            help_,
+            [
+                (
+                    _labels(stream=stats.stream, group=stats.group),
+                    getattr(stats, attribute),
+                )
+                for stats in group_stats
+            ],
+        )
+
+    name = "kwai_bus_handler_duration_seconds"
+    lines.append(f"# HELP {name} Duration of handling a message.")
+    lines.append(f"# TYPE {name} histogram")
+    for handler in handlers:
+        cumulative = 0
+        for bound, count in zip(handler.buckets, handler.bucket_counts, strict=True):
+            cumulative += count
+            labels = _labels(stream=handler.stream, group=handler.group, le=str(bound))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _labels(stream=handler.stream, group=handler.group, le="+Inf")
+        lines.append(f"{name}_bucket{labels} {handler.count}")
+        labels = _labels(stream=handler.stream, group=handler.group)
+        lines.append(f"{name}_sum{labels} {handler.sum}")
+        lines.append(f"{name}_count{labels} {handler.count}")
+
+    name = "kwai_bus_handler_failures_total"
+    lines.append(f"# HELP {name} Number of messages that failed and will be retried.")
+    lines.append(f"# TYPE {name} counter")
+    lines.extend(
+        f"{name}{_labels(stream=handler.stream, group=handler.group)} "
+        f"{handler.failures}"
+        for handler in handlers
+    )
+
+    return "\n".join(lines) + "\n"
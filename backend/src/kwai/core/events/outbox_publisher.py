@@ -0,0 +1,81 @@
+"""Module that implements a publisher that writes events to an outbox table.
+
+The outbox is written with the same database connection as the use case. When the
+publisher is used within a unit of work, the event is only stored when the
+transaction is committed. A relay is responsible for moving the events from the
+outbox to the event bus.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Self
+
+from kwai.core.db.database import Database
+from kwai.core.db.table_row import TableRow
+from kwai.core.domain.value_objects.timestamp import Timestamp
+from kwai.core.events.codec import create_json_codec
+from kwai.core.events.event import Event
+from kwai.core.events.publisher import Publisher
+
+
+_codec = create_json_codec()
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class OutboxRow(TableRow):
+    """Represent a row of the event outbox table.
+
+    Attributes:
+        id: The id of the row.
+        stream: The name of the stream the event must be published to.
+        data: The serialized (JSON) event.
+        created_at: The timestamp of creation.
+    """
+
+    __table_name__ = "event_outbox"
+
+    id: int
+    stream: str
+    data: str
+    created_at: datetime
+
+    @classmethod
+    def persist(cls, event: Event) -> Self:
+        """Persist an event into an outbox row."""
+        return cls(
+            id=0,
+            stream=event.meta.full_name,
+            data=_codec.encode(event.data).decode("utf-8"),
+            created_at=Timestamp.create_now().timestamp,
+        )
+
+
+class OutboxPublisher(Publisher):
+    """A publisher that stores events in the outbox table."""
+
+    def __init__(self, database: Database):
+        self._database = database
+
+    async def publish(self, event: Event):
+        await self._database.insert(OutboxRow.__table_name__, OutboxRow.persist(event))
+
+    async def publish_many(self, *events: Event) -> list[str]:
+        """Store all events, each with its own insert.
+
+        The returned ids are the ids of the outbox rows. The stream ids are only
+        known when the events are relayed.
+
+        A multi-row insert only returns the id of the first row, and the ids of
+        the other rows are not always consecutive (innodb_autoinc_lock_mode 2, the
+        default of MySQL 8, can interleave them with concurrent inserts). Each row
+        is inserted on its own, so the id of each event is known. Within a unit of
+        work, the inserts are committed together.
+        """
+        return [
+            str(
+                await self._database.insert(
+                    OutboxRow.__table_name__, OutboxRow.persist(event)
+                )
+            )
+            for event in events
+        ]
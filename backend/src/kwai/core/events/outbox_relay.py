@@ -0,0 +1,110 @@
+"""Module that implements a relay for moving events from the outbox to Redis."""
+
+import asyncio
+
+from loguru import logger
+from redis.asyncio import Redis
+from sql_smith.functions import field
+
+from kwai.core.db.database import Database
+from kwai.core.db.database_query import SelectForUpdate
+from kwai.core.db.uow import UnitOfWork
+from kwai.core.events.codec import JsonCodec
+from kwai.core.events.outbox_publisher import OutboxRow
+from kwai.core.events.stream import CONTENT_TYPE_FIELD, DATA_FIELD
+
+
+class OutboxRelay:
+    """Relay events from the outbox table to Redis streams.
+
+    Events are read in batches. All events of a batch are added to their stream
+    with one pipeline. The rows are only removed from the outbox after Redis
+    accepted the batch, which results in an at-least-once delivery.
+
+    Each event process runs a relay. The rows of a batch are locked until they are
+    removed, and locked rows are skipped by the other relays, so an event is only
+    relayed by one process.
+
+    Attributes:
+        _database: The database containing the outbox.
+        _redis: The Redis client.
+        _batch_size: The maximum number of events to relay at once.
+        _interval: Seconds to wait when the outbox is empty.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        redis: Redis,
+        *,
+        batch_size: int = 100,
+        interval: float = 1.0,
+    ):
+        self._database = database
+        self._redis = redis
+        self._batch_size = batch_size
+        self._interval = interval
+        self._is_stopping = asyncio.Event()
+
+    async def relay(self) -> int:
+        """Relay one batch of events.
+
+        Returns:
+            The number of relayed events.
+        """
+        query = SelectForUpdate(
+            Database.create_query_factory()
+            .select(*OutboxRow.get_aliases())
+            .from_(OutboxRow.__table_name__)
+            .order_by(OutboxRow.column("id"))
+            .limit(self._batch_size),
+            skip_locked=True,
+        )
+        async with UnitOfWork(self._database):
+            rows = [OutboxRow.map(row) async for row in self._database.fetch(query)]
+            if len(rows) == 0:
+                return 0
+
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for row in rows:
+                    pipe.xadd(
+                        row.stream,
+                        {
+                            DATA_FIELD: row.data,
+                            CONTENT_TYPE_FIELD: JsonCodec.content_type,
+                        },
+                    )
+                await pipe.execute()
+
+            await self._database.execute(
+                Database.create_query_factory()
+                .delete(OutboxRow.__table_name__)
+                .where(field("id").in_(*[row.id for row in rows]))
+            )
+
+        logger.info(f"Relayed {len(rows)} event(s) from the outbox.")
+        return len(rows)
+
+    async def run(self):
+        """Relay events until the relay is cancelled.
+
+        When a full batch was relayed, the next batch is relayed immediately.
+        """
+        while not self._is_stopping.is_set():
+            try:
+                count = await self.relay()
+            except asyncio.CancelledError:
+                return
+            except Exception as ex:
+                logger.warning(f"Relaying the outbox failed: {ex!r}")
+                count = 0
+
+            if count < self._batch_size:
+                try:
+                    await asyncio.sleep(self._interval)
+                except asyncio.CancelledError:
+                    return
+
+    def cancel(self):
+        """Cancel the relay."""
+        self._is_stopping.set()
@@ -14,3 +14,11 @@ class Publisher:
     @abstractmethod
     async def publish(self, event: Event):
         """Publish an event."""
+
+    @abstractmethod
+    async def publish_many(self, *events: Event) -> list[str]:
+        """Publish multiple events at once.
+
+        Returns:
+            The ids assigned to the events, in the same order as the events.
+        """
@@ -1,52 +1,113 @@
 """Module for defining a publisher using Redis."""
 
 import asyncio
+import time
+
+from collections import defaultdict
 
 from loguru import logger
 from redis.asyncio import Redis
 
+from kwai.core.events.codec import EventCodec
 from kwai.core.events.consumer import RedisConsumer
 from kwai.core.events.event import Event
 from kwai.core.events.event_router import EventRouter
+from kwai.core.events.metrics import EventBusMetrics
 from kwai.core.events.publisher import Publisher
 from kwai.core.events.stream import RedisMessage, RedisStream
 from kwai.core.events.subscriber import Subscriber
 
 
 class RedisBus(Publisher, Subscriber):
-    """An event bus using Redis streams."""
+    """An event bus using Redis streams.
+
+    Attributes:
+        _redis: The Redis client.
+        _codec: The codec used to encode the events. When not set, the fastest
+            available JSON codec is used.
+        _metrics: When set, the duration and result of each handled message will be
+            observed.
+    """
 
-    def __init__(self, redis: Redis):
+    def __init__(
+        self,
+        redis: Redis,
+        codec: EventCodec | None = None,
+        metrics: EventBusMetrics | None = None,
+    ):
         self._redis = redis
+        self._codec = codec
+        self._metrics = metrics
         self._consumers: list[RedisConsumer] = []
 
     async def publish(self, event: Event):
         stream_name = event.meta.full_name
         logger.info(f"Publishing event to {stream_name}")
-        stream = RedisStream(self._redis, stream_name)
+        stream = RedisStream(self._redis, stream_name, self._codec)
         await stream.add(RedisMessage(data=event.data))
 
+    async def publish_many(self, *events: Event) -> list[str]:
+        """Publish multiple events with one pipeline.
+
+        The events are grouped by stream, so all events of a stream are added
+        after each other. The order of the events within a stream is kept.
+        """
+        streams: dict[str, list[int]] = defaultdict(list)
+        for index, event in enumerate(events):
+            streams[event.meta.full_name].append(index)
+
+        order: list[int] = []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for stream_name, indexes in streams.items():
+                logger.info(f"Publishing {len(indexes)} event(s) to {stream_name}")
+                stream = RedisStream(self._redis, stream_name, self._codec)
+                for index in indexes:
+                    pipe.xadd(
+                        stream_name,
+                        stream.encode(RedisMessage(data=events[index].data)),
+                    )
+                order.extend(indexes)
+            message_ids = await pipe.execute()
+
+        ids = [""] * len(events)
+        for index, message_id in zip(order, message_ids, strict=True):
+            ids[index] = message_id.decode("utf-8")
+        return ids
+
     def subscribe(self, event_router: EventRouter) -> None:
         stream_name = event_router.event.meta.full_name
+        group_name = event_router.callback.__qualname__
         logger.info(f"Subscribing for {stream_name}")
         self._consumers.append(
             RedisConsumer(
                 RedisStream(self._redis, stream_name),
-                event_router.callback.__qualname__,
-                RedisBus._create_event_trigger(event_router),
+                group_name,
+                RedisBus._create_event_trigger(event_router, group_name, self._metrics),
             )
         )
 
     @classmethod
-    def _create_event_trigger(cls, event_router: EventRouter):
+    def _create_event_trigger(
+        cls,
+        event_router: EventRouter,
+        group_name: str,
+        metrics: EventBusMetrics | None = None,
+    ):
         """Create an event trigger."""
+        stream_name = event_router.event.meta.full_name
 
         async def trigger(message: RedisMessage) -> bool:
             with logger.contextualize(
-                stream=event_router.event.meta.full_name,
+                stream=stream_name,
                 message_id=message.id,
             ):
-                return await event_router.execute(message.data)
+                start = time.perf_counter()
+                result = await event_router.execute(message.data)
+                if metrics is not None:
+                    metrics.observe(
+                        stream_name, group_name, time.perf_counter() - start, result
+                    )
+                return result
 
         return trigger
 
@@ -0,0 +1,29 @@
+"""Module for creating a Redis client that uses a connection pool."""
+
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from kwai.core.settings import RedisSettings
+
+
+def create_redis(settings: RedisSettings) -> Redis:
+    """Create a Redis client backed by a connection pool.
+
+    The client is meant to be shared: create it once (for example in the lifespan of
+    an application) and reuse it. Closing the client with aclose will also disconnect
+    all connections of the pool.
+
+    When all connections of the pool are in use, a command waits for a free
+    connection (at most pool_timeout seconds) instead of failing.
+
+    Args:
+        settings: The settings for Redis.
+    """
+    pool = BlockingConnectionPool(
+        host=settings.host,
+        port=settings.port,
+        password=settings.password,
+        max_connections=settings.max_connections,
+        timeout=settings.pool_timeout,
+        health_check_interval=settings.health_check_interval,
+    )
+    return Redis.from_pool(pool)
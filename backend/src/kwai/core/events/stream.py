@@ -1,15 +1,18 @@
 """Define a Redis stream."""
 
-import json
-
 from dataclasses import dataclass, field
-from json import JSONDecodeError
 from typing import Any
 
 import redis.exceptions
 
 from redis.asyncio import Redis
 
+from kwai.core.events.codec import EventCodec, EventCodecException, get_codec
+
+
+CONTENT_TYPE_FIELD = b"content-type"
+DATA_FIELD = b"data"
+
 
 @dataclass(kw_only=True, frozen=True, slots=True)
 class RedisStreamInfo:
@@ -22,12 +25,17 @@ class RedisStreamInfo:
 
 @dataclass(kw_only=True, frozen=True, slots=True)
 class RedisGroupInfo:
-    """Dataclass with information about a redis stream group."""
+    """Dataclass with information about a redis stream group.
+
+    lag is the number of entries that are not yet delivered to the group. It is None
+    when Redis can't determine the lag (or when Redis is older than version 7).
+    """
 
     name: str
     consumers: int
     pending: int
     last_delivered_id: str
+    lag: int | None = None
 
 
 class RedisMessageException(Exception):
@@ -71,16 +79,17 @@ class RedisMessage:
         stream_name = message[0].decode("utf-8")
         message = message[1]  # This is a list with all returned tuple entries
         message_id = message[0][0].decode("utf-8")
-        if b"data" in message[0][1]:
+        fields = message[0][1]
+        if DATA_FIELD in fields:
+            content_type = fields.get(CONTENT_TYPE_FIELD)
             try:
-                json.loads(message[0][1][b"data"])
-            except JSONDecodeError as ex:
+                codec = get_codec(
+                    None if content_type is None else content_type.decode("utf-8")
+                )
+                data = codec.decode(fields[DATA_FIELD])
+            except EventCodecException as ex:
                 raise RedisMessageException(stream_name, message_id, str(ex)) from ex
-            return RedisMessage(
-                stream=stream_name,
-                id=message_id,
-                data=json.loads(message[0][1][b"data"]),
-            )
+            return RedisMessage(stream=stream_name, id=message_id, data=data)
         raise RedisMessageException(
             stream_name, message_id, "No data key found in redis message"
         )
@@ -92,14 +101,18 @@ class RedisStream:
     Attributes:
         _redis: Redis connection.
         _stream_name: Name of the Redis stream.
+        _codec: The codec used to encode the data of a message.
 
     A stream will be created when a first group is created or when a first message is
     added.
     """
 
-    def __init__(self, redis_: Redis, stream_name: str):
+    def __init__(
+        self, redis_: Redis, stream_name: str, codec: EventCodec | None = None
+    ):
         self._redis = redis_
         self._stream_name = stream_name
+        self._codec = codec or get_codec(None)
 
     @property
     def name(self) -> str:
@@ -125,14 +138,22 @@ class RedisStream:
             The original message. When the id of the message was a *, the id returned
             from redis will be set.
 
-        The data will be serialized to JSON. The field 'data' will be used to store
-        this JSON.
+        The data will be serialized with the codec of the stream. The field 'data'
+        will be used to store the serialized data, the field 'content-type' contains
+        the content type of the codec.
         """
         message_id = await self._redis.xadd(
-            self._stream_name, {"data": json.dumps(message.data)}, id=message.id
+            self._stream_name, self.encode(message), id=message.id
         )
         return RedisMessage(id=message_id.decode("utf-8"), data=message.data)
 
+    def encode(self, message: RedisMessage) -> dict[bytes, bytes]:
+        """Return the fields to store on the stream for the given message."""
+        return {
+            DATA_FIELD: self._codec.encode(message.data),
+            CONTENT_TYPE_FIELD: self._codec.content_type.encode("utf-8"),
+        }
+
     async def consume(
         self,
         group_name: str,
@@ -163,6 +184,19 @@ class RedisStream:
 
         return RedisMessage.create_from_redis(messages)
 
+    async def count_entries_after(self, id_: str, limit: int = 10_000) -> int:
+        """Return the number of entries with an id greater than the given id.
+
+        Args:
+            id_: The id to start counting from (exclusive).
+            limit: The maximum number of entries to count. When there are more
+                entries, limit is returned.
+        """
+        entries = await self._redis.xrange(
+            self._stream_name, min=f"({id_}", max="+", count=limit
+        )
+        return len(entries)
+
     async def create_group(self, group_name: str, id_: str = "$") -> bool:
         """Create a group (if it doesn't exist yet).
 
@@ -227,6 +261,7 @@ class RedisStream:
                 consumers=group["consumers"],
                 pending=group["pending"],
                 last_delivered_id=group["last-delivered-id"].decode("utf-8"),
+                lag=group.get("lag"),
             )
 
         return result
@@ -1,6 +1,6 @@
 """Module that defines some JSON:API related models."""
 
-from typing import Any, Self, cast
+from typing import Any, AsyncIterator, Callable, Self, cast
 
 from fastapi import Query
 from pydantic import (
@@ -13,6 +13,9 @@ from pydantic import (
 from pydantic.json_schema import JsonSchemaValue, SkipJsonSchema
 from pydantic_core import CoreSchema
 
+from kwai.core.domain.presenter import AsyncPresenter, IterableResult
+from kwai.core.domain.repository.cursor import Cursor
+
 
 class ResourceIdentifier(BaseModel):
     """A JSON:API resource identifier."""
@@ -67,6 +70,9 @@ class Meta(BaseModel):
         limit: The maximum number of returned resources (pagination)
 
     A limit of 0, means there was no limit was set.
+
+    For keyset pagination, next_cursor contains the token to use for page[after]
+    to get the next page.
     """
 
     model_config = ConfigDict(extra="allow")
@@ -75,6 +81,10 @@ class Meta(BaseModel):
     offset: int | None = None
     limit: int | None = None
 
+    def with_next_cursor(self, cursor: Cursor) -> "Meta":
+        """Return a copy with the token of the cursor for the next page."""
+        return self.model_copy(update={"next_cursor": cursor.encode()})
+
 
 class ErrorSource(BaseModel):
     """Defines the model for an error source."""
@@ -161,9 +171,9 @@ class MultipleDocument[R, I](BaseDocument[I]):
             self.data += other.data
         if other.included is not None:
             if self.included is None:
-                self.included = other.included
+                self.included = set(other.included)
             else:
-                self.included = self.included.union(other.included)
+                self.included.update(other.included)
 
 
 class Document[R, I](BaseModel):
@@ -241,24 +251,224 @@ class Document[R, I](BaseModel):
         self.data.append(cast(Any, other.data))
         if other.included is not None:
             if self.included is None:
-                self.included = other.included
+                self.included = set(other.included)
             else:
-                self.included = self.included.union(other.included)
+                self.included.update(other.included)
+
+
+class DocumentBuilder[D: BaseModel]:
+    """Build a JSON:API document with multiple resources.
+
+    The resources are collected in a list and the included resources are
+    deduplicated with a dict using (type, id) as key. The document is only created
+    (and validated) once, when build is called. This keeps building a document
+    linear in the number of (included) resources.
+
+    Example:
+        ```py
+        builder = DocumentBuilder(TrainingDocument, meta=Meta(count=count))
+        async for training in trainings:
+            builder.add(TrainingDocument.create(training))
+        document = builder.build()
+        ```
+    """
+
+    def __init__(
+        self,
+        document_class: type[D],
+        *,
+        meta: Meta | None = None,
+        with_included: bool = False,
+    ):
+        """Initialize the builder.
+
+        Args:
+            document_class: The class of the document to build.
+            meta: The meta of the document.
+            with_included: When True, included will always be part of the document,
+                even when there are no included resources.
+        """
+        self._document_class = document_class
+        self._meta = meta
+        self._data: list[Any] = []
+        self._included: dict[tuple[str, str | None], Any] | None = (
+            {} if with_included else None
+        )
+
+    @property
+    def meta(self) -> Meta | None:
+        """Return the meta of the document."""
+        return self._meta
+
+    @meta.setter
+    def meta(self, meta: Meta | None) -> None:
+        """Set the meta of the document."""
+        self._meta = meta
+
+    def __len__(self) -> int:
+        """Return the number of resources added to the builder."""
+        return len(self._data)
+
+    def add(self, document: Any) -> None:
+        """Add the resource(s) and included resources of a document."""
+        if isinstance(document.data, list):
+            self._data.extend(document.data)
+        else:
+            self._data.append(document.data)
+        if document.included is not None:
+            self.include(*document.included)
+
+    def include(self, *resources: Any) -> None:
+        """Add included resources.
+
+        A resource with the same type and id as an already included resource is
+        ignored.
+        """
+        if self._included is None:
+            self._included = {}
+        for resource in resources:
+            self._included.setdefault((resource.type, resource.id), resource)
+
+    def build(self) -> D:
+        """Create the document."""
+        return self._document_class(
+            meta=self._meta,
+            data=self._data,
+            included=None if self._included is None else set(self._included.values()),
+        )
+
+
+class DocumentStream[T]:
+    """Stream a JSON:API document with multiple resources.
+
+    The document is written as JSON while the entities are retrieved from the
+    iterator: first the resources, then the included resources and the meta.
+    Only the included resources (deduplicated on type and id) and a buffer of
+    chunk_size bytes are kept in memory, so memory does not grow with the number
+    of resources.
+
+    Example:
+        ```py
+        stream = DocumentStream(
+            trainings, TrainingDocument.create, meta=Meta(count=count)
+        )
+        async for chunk in stream:
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        iterator: AsyncIterator[T],
+        create_document: Callable[[T], Any],
+        *,
+        meta: Meta | None = None,
+        create_cursor: Callable[[T], Cursor] | None = None,
+        with_included: bool = False,
+        chunk_size: int = 65536,
+    ):
+        """Initialize the stream.
+
+        Args:
+            iterator: The iterator that yields the entities.
+            create_document: A function that creates a document for an entity.
+            meta: The meta of the document.
+            create_cursor: A function that creates the cursor for the entities
+                after an entity. When the page is full (the number of entities
+                equals the limit of meta), the token of the cursor of the last entity
+                is added as next_cursor to the meta.
+            with_included: When True, included will always be part of the document,
+                even when there are no included resources.
+            chunk_size: The stream yields chunks of (at least) this size.
+        """
+        self._iterator = iterator
+        self._create_document = create_document
+        self._meta = meta
+        self._create_cursor = create_cursor
+        self._with_included = with_included
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the document in chunks of JSON."""
+        buffer = bytearray(b'{"data":[')
+        included: dict[tuple[str, str | None], Any] | None = (
+            {} if self._with_included else None
+        )
+        separator = b""
+        entity = None
+        entity_count = 0
+        async for entity in self._iterator:
+            entity_count += 1
+            document = self._create_document(entity)
+            resources = (
+                document.data if isinstance(document.data, list) else [document.data]
+            )
+            for resource in resources:
+                buffer += separator
+                buffer += resource.__pydantic_serializer__.to_json(
+                    resource, by_alias=True
+                )
+                separator = b","
+            if document.included is not None:
+                if included is None:
+                    included = {}
+                for resource in document.included:
+                    included.setdefault((resource.type, resource.id), resource)
+            if len(buffer) >= self._chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += b"]"
+        if included is not None:
+            buffer += b',"included":['
+            buffer += b",".join(
+                resource.__pydantic_serializer__.to_json(resource, by_alias=True)
+                for resource in included.values()
+            )
+            buffer += b"]"
+        meta = self._meta
+        if (
+            meta is not None
+            and self._create_cursor is not None
+            and meta.limit
+            and entity_count == meta.limit
+        ):
+            meta = meta.with_next_cursor(self._create_cursor(entity))
+        if meta is not None:
+            buffer += b',"meta":'
+            buffer += meta.__pydantic_serializer__.to_json(meta, by_alias=True)
+        buffer += b"}"
+        yield bytes(buffer)
 
 
 class PaginationModel(BaseModel):
     """A model for pagination query parameters.
 
-    Use this as a dependency on a route. This will handle the page[offset]
-    and page[limit] query parameters.
+    Use this as a dependency on a route. This will handle the page[offset],
+    page[limit] and page[after] query parameters.
+
+    page[after] is an opaque token for keyset pagination. The token for the next
+    page is returned as next_cursor in the meta of a document.
 
     Attributes:
         offset: The value of the page[offset] query parameter. Default is None.
         limit: The value of the page[limit] query parameter. Default is None.
+        after: The value of the page[after] query parameter. Default is None.
     """
 
     offset: int | None = Field(Query(default=None, alias="page[offset]"))
     limit: int | None = Field(Query(default=None, alias="page[limit]"))
+    after: str | None = Field(Query(default=None, alias="page[after]"))
+
+    def get_cursor(self) -> Cursor | None:
+        """Return the cursor of page[after].
+
+        Raises:
+            InvalidCursorException: when page[after] is not a valid token.
+        """
+        if self.after is None:
+            return None
+        return Cursor.decode(self.after)
 
 
 class JsonApiPresenter[D]:
@@ -270,3 +480,43 @@ class JsonApiPresenter[D]:
     def get_document(self) -> D | None:
         """Return the JSON:API document."""
         return self._document
+
+
+class JsonApiStreamPresenter[T](AsyncPresenter[IterableResult[T]]):
+    """A presenter that streams an iterable result as a JSON:API document.
+
+    The entities are not retrieved when the result is presented, but when the
+    stream is iterated.
+    """
+
+    def __init__(
+        self,
+        create_document: Callable[[T], Any],
+        *,
+        create_cursor: Callable[[T], Cursor] | None = None,
+        with_included: bool = False,
+    ) -> None:
+        """Initialize the presenter.
+
+        Args:
+            create_document: A function that creates a document for an entity.
+            create_cursor: A function that creates the cursor for the next page.
+            with_included: When True, included will always be part of the document.
+        """
+        self._create_document = create_document
+        self._create_cursor = create_cursor
+        self._with_included = with_included
+        self._stream: DocumentStream[T] | None = None
+
+    async def present(self, result: IterableResult[T]) -> None:
+        self._stream = DocumentStream(
+            result.iterator,
+            self._create_document,
+            meta=Meta(count=result.count, offset=result.offset, limit=result.limit),
+            create_cursor=self._create_cursor,
+            with_included=self._with_included,
+        )
+
+    def get_stream(self) -> DocumentStream[T] | None:
+        """Return the stream of the JSON:API document."""
+        return self._stream
@@ -4,9 +4,9 @@ import os
 import tomllib
 
 from functools import lru_cache
+from pathlib import Path
 from typing import Annotated, Any, Literal, Optional, Union
 
-from anyio import Path
 from pydantic import BaseModel, Field
 
 
@@ -138,6 +138,8 @@ class LoggerSettings(BaseModel):
     level: str = "DEBUG"
     retention: str = "7 days"
     rotation: str = "1 day"
+    enqueue: bool = True  # Write the log records in a separate thread
+    access_log_sample_rate: float = 1.0  # Fraction of successful requests to log
 
 
 class EmailSettings(BaseModel):
@@ -158,9 +160,42 @@ class RedisSettings(BaseModel):
     host: str = "127.0.0.1"
     port: int = 6379
     password: str | None = None
+    max_connections: int = 10
+    pool_timeout: int = 20  # seconds to wait for a free connection of the pool
+    health_check_interval: int = 30  # seconds
     logger: LoggerSettings | None = None
 
 
+class ResponseCacheSettings(BaseModel):
+    """Settings for the cache of API responses."""
+
+    backend: Literal["memory", "redis"] = "memory"
+    ttl: int = 300  # seconds
+    max_entries: int = 1000  # Only used by the memory backend
+
+
+class TemplateSettings(BaseModel):
+    """Settings for the template engine."""
+
+    # Store compiled templates, so a new process doesn't need to compile them again.
+    bytecode_cache: bool = True
+    # The folder for the compiled templates. When not set, a folder in the temporary
+    # directory is used.
+    bytecode_cache_path: str | None = None
+    # Check if a template file is changed before using the compiled template.
+    auto_reload: bool = False
+
+
+class WarmUpSettings(BaseModel):
+    """Settings for the warm-up of a worker."""
+
+    enabled: bool = True
+    # Paths of GET requests that are sent to the application during the warm-up.
+    requests: list[str] = Field(default_factory=list)
+    # Seconds between two attempts to connect to the database.
+    retry_interval: int = 5
+
+
 class GoogleSSOSettings(BaseModel):
     """Settings for Google SSO."""
 
@@ -201,6 +236,12 @@ class Settings(BaseModel):
 
     redis: RedisSettings
 
+    response_cache: ResponseCacheSettings = ResponseCacheSettings()
+
+    template: TemplateSettings = TemplateSettings()
+
+    warm_up: WarmUpSettings = WarmUpSettings()
+
 
 @lru_cache
 def get_settings() -> Settings:
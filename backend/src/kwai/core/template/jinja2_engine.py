@@ -1,34 +1,53 @@
 """Modules that implements the template engine interface for jinja2."""
 
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from fastapi import Request
-from fastapi.templating import Jinja2Templates
 from jinja2 import (
+    BytecodeCache,
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     PackageLoader,
     PrefixLoader,
     TemplatesNotFound,
     select_autoescape,
 )
 
+from kwai.core.settings import Settings
+
 from .jinja2_template import Jinja2Template
 from .template import Template
 from .template_engine import TemplateEngine, TemplateNotFoundException
 
 
+if TYPE_CHECKING:
+    from fastapi.templating import Jinja2Templates
+
+
 JINJA2_FILE_EXTENSION = ".jinja2"
 
 
 class Jinja2Engine(TemplateEngine):
     """Implements the TemplateEngine interface for Jinja2."""
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        *,
+        bytecode_cache: BytecodeCache | None = None,
+        auto_reload: bool = True,
+        **kwargs,
+    ):
         """Construct a Jinja2Engine.
 
-        kwargs will be merged to the variables that are used to render a template.
-        Use it for variables that are used in all templates.
+        A template is compiled once and reused by all renders. Create one engine
+        for a process and share it.
+
+        Args:
+            bytecode_cache: A cache for storing the compiled templates.
+            auto_reload: Check if a template is changed before it is used.
+            kwargs: These will be merged to the variables that are used to render a
+                template. Use it for variables that are used in all templates.
         """
         self._env = Environment(
             loader=ChoiceLoader(
@@ -49,17 +68,50 @@ class Jinja2Engine(TemplateEngine):
                 default=True,
             ),
             extensions=["jinja2.ext.do"],
+            bytecode_cache=bytecode_cache,
+            auto_reload=auto_reload,
         )
         self._variables = kwargs
+        self._web_templates: "Jinja2Templates | None" = None
+
+    @classmethod
+    def create_from_settings(cls, settings: Settings) -> "Jinja2Engine":
+        """Create an engine for the given settings."""
+        bytecode_cache = None
+        if settings.template.bytecode_cache:
+            if settings.template.bytecode_cache_path is None:
+                bytecode_cache = FileSystemBytecodeCache()
+            else:
+                cache_path = Path(settings.template.bytecode_cache_path)
+                cache_path.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = FileSystemBytecodeCache(str(cache_path))
+        return cls(
+            bytecode_cache=bytecode_cache,
+            auto_reload=settings.template.auto_reload,
+            website=settings.website,
+        )
 
     @property
-    def web_templates(self) -> Jinja2Templates:
-        """Return templates that can be used with a TemplateResponse."""
+    def web_templates(self) -> "Jinja2Templates":
+        """Return templates that can be used with a TemplateResponse.
+
+        FastAPI is imported here, so the event worker doesn't need to import it.
+        """
+        if self._web_templates is None:
+            from fastapi.templating import Jinja2Templates
+
+            def app_context(request) -> dict[str, Any]:
+                return self._variables
 
-        def app_context(request: Request) -> dict[str, Any]:
-            return self._variables
+            self._web_templates = Jinja2Templates(
+                env=self._env, context_processors=[app_context]
+            )
+        return self._web_templates
 
-        return Jinja2Templates(env=self._env, context_processors=[app_context])
+    def compile(self, *template_names: str) -> None:
+        """Compile the given templates, so the first render doesn't need to."""
+        for template_name in template_names:
+            self._env.get_template(template_name)
 
     def create(self, template_file_path: str) -> Template:
         """Create a jinja2 template."""
@@ -10,8 +10,12 @@ import inject
 from loguru import logger
 from redis.asyncio import Redis
 
+from kwai.core.db.database import Database
 from kwai.core.events import dependencies
+from kwai.core.events.metrics import EventBusMetrics
+from kwai.core.events.outbox_relay import OutboxRelay
 from kwai.core.events.redis_bus import RedisBus
+from kwai.core.events.redis_client import create_redis
 from kwai.core.settings import LoggerSettings, Settings
 from kwai.events.v1 import router
 
@@ -55,27 +59,49 @@ def shutdown(sig, frame):
         task.cancel()
 
 
+async def store_metrics(metrics: EventBusMetrics, redis: Redis, interval: int = 10):
+    """Store the metrics of the handlers periodically in Redis."""
+    while True:
+        try:
+            await asyncio.sleep(interval)
+            await metrics.store(redis)
+        except asyncio.CancelledError:
+            return
+        except Exception as ex:
+            logger.warning(f"Storing the metrics failed: {ex!r}")
+
+
 @inject.autoparams()
 async def main(settings: Settings):
     """Main program."""
-    redis = Redis(
-        host=settings.redis.host,
-        port=settings.redis.port,
-        password=settings.redis.password,
-    )
+    redis = create_redis(settings.redis)
 
     if settings.redis.logger:
         configure_logger(settings.redis.logger)
 
-    bus = RedisBus(redis)
+    metrics = EventBusMetrics()
+    bus = RedisBus(redis, metrics=metrics)
     for route_element in router:
         bus.subscribe(route_element)
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         asyncio.get_running_loop().add_signal_handler(sig, shutdown, sig, None)
 
+    database = Database(settings.db)
+    relay = OutboxRelay(database, redis)
+
     logger.info("Starting the event bus.")
-    await bus.run()
+    relay_task = asyncio.create_task(relay.run())
+    metrics_task = asyncio.create_task(store_metrics(metrics, redis))
+    try:
+        await bus.run()
+    finally:
+        relay.cancel()
+        metrics_task.cancel()
+        await relay_task
+        await metrics_task
+        await database.close()
+        await redis.aclose()
 
 
 if __name__ == "__main__":
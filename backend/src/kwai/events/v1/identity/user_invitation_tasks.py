@@ -40,7 +40,9 @@ async def email_user_invitation_task(
     template_engine: TemplateEngine,
 ):
     """Task for sending the user invitation email."""
-    command = MailUserInvitationCommand(uuid=event["data"]["uuid"])
+    command = MailUserInvitationCommand(
+        uuid=UserInvitationCreatedEvent.create_from_data(event).uuid
+    )
 
     try:
         async with UnitOfWork(database):
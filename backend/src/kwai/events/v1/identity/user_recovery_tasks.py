@@ -40,7 +40,9 @@ async def email_user_recovery_task(
     template_engine: TemplateEngine,
 ):
     """Actor for sending a user recovery mail."""
-    command = MailUserRecoveryCommand(uuid=event["data"]["uuid"])
+    command = MailUserRecoveryCommand(
+        uuid=UserRecoveryCreatedEvent.create_from_data(event).uuid
+    )
 
     try:
         async with UnitOfWork(database):
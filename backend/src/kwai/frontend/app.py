@@ -1,16 +1,43 @@
 """Module that defines a sub application for handling the frontend."""
 
-import uuid
-
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import Depends, FastAPI, Request, status
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from fastapi import Depends, FastAPI, status
+from fastapi.responses import FileResponse, RedirectResponse
 from loguru import logger
 
+from kwai.api.access_log import AccessLogMiddleware
 from kwai.core.settings import Settings, get_settings
+from kwai.core.template.jinja2_engine import Jinja2Engine
 from kwai.frontend.apps import application_routers
+from kwai.frontend.manifest_registry import get_manifest_path, manifest_registry
+
+
+# The entry of all applications, see index.jinja2
+APPLICATION_ENTRY = "src/index.ts"
+
+
+def warm_manifests(settings: Settings) -> None:
+    """Load the manifests and the asset indexes of all applications.
+
+    Nothing is loaded when the frontend runs in test mode, because then the Vite
+    server is used.
+    """
+    if settings.frontend.test:
+        return
+
+    for app in settings.frontend.apps:
+        manifest_path = get_manifest_path(Path(settings.frontend.path), app.name)
+        try:
+            manifest = manifest_registry.get(app.name, manifest_path)
+            manifest.resolve(APPLICATION_ENTRY)
+            manifest.get_asset_index(manifest_path.parent.parent)
+        except FileNotFoundError:
+            logger.warning(f"Manifest file {manifest_path} not found")
+        except ValueError as ex:
+            logger.warning(f"Manifest file {manifest_path} is invalid: {ex}")
 
 
 def get_default_app(settings: Annotated[Settings, Depends(get_settings)]) -> str:
@@ -21,37 +48,29 @@ def get_default_app(settings: Annotated[Settings, Depends(get_settings)]) -> str
     raise ValueError("No default app defined in settings.")
 
 
-def create_frontend():
-    """Create the frontend."""
-    frontend_app = FastAPI()
-
-    @frontend_app.middleware("http")
-    async def log(request: Request, call_next):
-        """Middleware for logging the requests."""
-        request_id = str(uuid.uuid4())
-        with logger.contextualize(request_id=request_id):
-            logger.info(f"{request.url} - {request.method} - Request started")
-
-            response = None  # Make pylint happy...
-            try:
-                response = await call_next(request)
-            except Exception as ex:
-                logger.error(f"{request.url} - Request failed: {ex}")
-                logger.exception(ex)
-                response = JSONResponse(
-                    content={
-                        "detail": str(ex),
-                    },
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
-            finally:
-                response.headers["X-Request-ID"] = request_id
-                logger.info(
-                    f"{request.url} - {request.method} - Request ended: "
-                    f"{response.status_code}"
-                )
-
-            return response
+def create_frontend(settings: Settings | None = None) -> FastAPI:
+    """Create the frontend.
+
+    Args:
+        settings: Settings to use in this application.
+    """
+    if settings is None:
+        settings = get_settings()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Warm the manifest registry and the template engine on startup."""
+        warm_manifests(settings)
+        app.state.template_engine = Jinja2Engine.create_from_settings(settings)
+        app.state.template_engine.compile("index.jinja2")
+        yield
+
+    frontend_app = FastAPI(lifespan=lifespan)
+
+    frontend_app.add_middleware(
+        AccessLogMiddleware,
+        sample_rate=settings.logger.access_log_sample_rate if settings.logger else 1.0,
+    )
 
     for router in application_routers:
         frontend_app.include_router(router, prefix="/apps")
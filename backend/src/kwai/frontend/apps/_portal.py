@@ -7,8 +7,9 @@ from fastapi import APIRouter, Depends, Request
 from fastapi.templating import Jinja2Templates
 
 from kwai.api.dependencies import create_templates
+from kwai.frontend.asset_index import AssetResponse
 from kwai.frontend.dependencies import ViteDependency
-from kwai.frontend.etag_file_response import EtagFileResponse
+from kwai.frontend.shell import create_shell_response
 from kwai.frontend.vite import Vite
 
 
@@ -26,22 +27,8 @@ async def get_app(
     templates: Annotated[Jinja2Templates, Depends(create_templates)],
     vite: Annotated[Vite, Depends(_portal_vite_dependency)],
 ):
-    asset_file_path = vite.get_asset_path(path)
-    if asset_file_path is not None:
-        return EtagFileResponse(asset_file_path)
-
-    url = request.url_for(APP_NAME, path="")
-    if "x-forwarded-proto" in request.headers:
-        url = url.replace(scheme=request.headers["x-forwarded-proto"])
-
-    return templates.TemplateResponse(
-        request,
-        name="index.jinja2",
-        context={
-            "application": {
-                "name": APP_NAME,
-                "url": str(url),
-            },
-            "vite": vite,
-        },
-    )
+    asset = vite.get_asset(path)
+    if asset is not None:
+        return AssetResponse(asset, request.headers.get("accept-encoding"))
+
+    return create_shell_response(request, APP_NAME, templates, vite)
@@ -0,0 +1,210 @@
+"""Module that defines an index of the files of a dist folder.
+
+The index is built once for a build of an application. Serving a file from the
+index doesn't need a stat call, nor an ETag calculation.
+
+Vite adds a hash of the content to the names of the files in the assets folder.
+The content of these files never changes, so they can be cached by a browser
+forever.
+"""
+
+import os
+
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from hashlib import md5
+from mimetypes import guess_type
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from kwai.api.compression import accepted_encodings
+from kwai.api.http_cache import ConditionalGet
+from kwai.frontend.precompress import PRECOMPRESSED_EXTENSIONS
+
+
+# The folder of the files with a hashed name.
+HASHED_ASSETS_FOLDER = "assets"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class AssetFile:
+    """A file on disk with the values for the headers of a response.
+
+    Attributes:
+        path: The path of the file.
+        stat: The result of the stat call, when the index was built.
+        etag: The ETag of the file.
+        last_modified: The value for the Last-Modified header.
+    """
+
+    path: Path
+    stat: os.stat_result
+    etag: str
+    last_modified: str
+
+    @classmethod
+    def create(cls, path: Path) -> "AssetFile":
+        """Create an asset file for the given path."""
+        stat = path.stat()
+        # The same ETag as FileResponse.
+        etag_base = str(stat.st_mtime) + "-" + str(stat.st_size)
+        return AssetFile(
+            path=path,
+            stat=stat,
+            etag=f'"{md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"',
+            last_modified=formatdate(stat.st_mtime, usegmt=True),
+        )
+
+    @property
+    def size(self) -> int:
+        """Return the size of the file."""
+        return self.stat.st_size
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Asset:
+    """A file of a dist folder.
+
+    Attributes:
+        file: The file.
+        media_type: The content type of the file.
+        immutable: True when the content of the file never changes.
+        encodings: The precompressed versions of the file for each encoding.
+    """
+
+    file: AssetFile
+    media_type: str
+    immutable: bool = False
+    encodings: dict[str, AssetFile] = field(default_factory=dict)
+
+    def select(self, accept_encoding: str | None) -> tuple[AssetFile, str | None]:
+        """Select the file for the preferred encoding of the client.
+
+        Returns:
+            The file and its encoding (None when not compressed).
+        """
+        if self.encodings:
+            for encoding in accepted_encodings(accept_encoding):
+                if encoding in self.encodings:
+                    return self.encodings[encoding], encoding
+        return self.file, None
+
+
+class AssetIndex:
+    """An index that maps the relative path of a file to an asset."""
+
+    def __init__(self, assets: dict[str, Asset]):
+        """Initialize the index.
+
+        Args:
+            assets: The assets, with the relative (posix) path as key.
+        """
+        self._assets = assets
+
+    def __len__(self) -> int:
+        """Return the number of assets."""
+        return len(self._assets)
+
+    def get(self, path: str | Path) -> Asset | None:
+        """Return the asset for a path relative to the dist folder.
+
+        None is returned when the file is not in the index.
+        """
+        if isinstance(path, Path):
+            path = path.as_posix()
+        return self._assets.get(path)
+
+    @classmethod
+    def build(cls, dist_path: Path) -> "AssetIndex":
+        """Build the index for all files of a dist folder.
+
+        A precompressed file (.br, .gz) is added as an encoding of the original
+        file. The .vite folder (with the manifest) is skipped.
+        """
+        assets: dict[str, Asset] = {}
+        if not dist_path.is_dir():
+            return cls(assets)
+
+        compressed_suffixes = set(PRECOMPRESSED_EXTENSIONS.values())
+        for directory, directories, files in os.walk(dist_path):
+            directories[:] = [name for name in directories if name != ".vite"]
+            for name in files:
+                path = Path(directory) / name
+                if path.suffix in compressed_suffixes and (
+                    path.with_name(path.stem).is_file()
+                ):
+                    continue
+
+                relative_path = path.relative_to(dist_path).as_posix()
+                encodings = {}
+                for encoding, extension in PRECOMPRESSED_EXTENSIONS.items():
+                    compressed_path = path.with_name(name + extension)
+                    if compressed_path.is_file():
+                        encodings[encoding] = AssetFile.create(compressed_path)
+                assets[relative_path] = Asset(
+                    file=AssetFile.create(path),
+                    media_type=guess_type(name)[0] or "text/plain",
+                    immutable=relative_path.startswith(HASHED_ASSETS_FOLDER + "/"),
+                    encodings=encodings,
+                )
+
+        return cls(assets)
+
+
+class AssetResponse(FileResponse):
+    """A response for an asset of the index.
+
+    The headers are taken from the index, so the file is not checked again. Range
+    requests are handled by FileResponse. A 304 is returned when If-None-Match
+    matches the ETag.
+    """
+
+    def __init__(self, asset: Asset, accept_encoding: str | None = None):
+        """Initialize the response.
+
+        Args:
+            asset: The asset to send.
+            accept_encoding: The Accept-Encoding header of the request.
+        """
+        self._asset_file, encoding = asset.select(accept_encoding)
+        headers = {
+            "cache-control": IMMUTABLE_CACHE_CONTROL if asset.immutable else "no-cache"
+        }
+        if asset.encodings:
+            headers["vary"] = "Accept-Encoding"
+        if encoding is not None:
+            headers["content-encoding"] = encoding
+        super().__init__(
+            self._asset_file.path,
+            headers=headers,
+            media_type=asset.media_type,
+            stat_result=self._asset_file.stat,
+        )
+
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        """Set the headers with the values of the index."""
+        self.headers.setdefault("content-length", str(stat_result.st_size))
+        self.headers.setdefault("last-modified", self._asset_file.last_modified)
+        self.headers.setdefault("etag", self._asset_file.etag)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the file, or a 304 when the ETag matches."""
+        headers = Headers(scope=scope)
+        if ConditionalGet.matches(headers.get("if-none-match"), self._asset_file.etag):
+            response = Response(
+                status_code=304,
+                headers={
+                    name: self.headers[name]
+                    for name in ("cache-control", "etag", "vary")
+                    if name in self.headers
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        await super().__call__(scope, receive, send)
@@ -6,6 +6,7 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 
 from kwai.core.settings import Settings, get_settings
+from kwai.frontend.manifest_registry import get_manifest_path, manifest_registry
 from kwai.frontend.vite import DevelopmentVite, ProductionVite, Vite
 
 
@@ -39,21 +40,19 @@ class ViteDependency:
                 )
             return DevelopmentVite(app_setting.vite_server)
 
-        manifest_path = (
-            Path(settings.frontend.path)
-            / "apps"
-            / self._application_name
-            / "dist"
-            / ".vite"
-            / "manifest.json"
+        manifest_path = get_manifest_path(
+            Path(settings.frontend.path), self._application_name
         )
-        if not manifest_path.exists():
+        try:
+            manifest = manifest_registry.get(self._application_name, manifest_path)
+        except FileNotFoundError as ex:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Manifest file {manifest_path} not found",
-            )
+            ) from ex
 
         return ProductionVite(
             manifest_path,
             Path(settings.frontend.path) / "apps" / self._application_name,
+            manifest,
         )
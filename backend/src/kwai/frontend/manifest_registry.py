@@ -0,0 +1,176 @@
+"""Module that defines a process-wide registry for the manifests of Vite.
+
+Parsing a manifest and walking the import graph of its entries is done once for
+each application. A manifest is reloaded when the modification time of the file
+changes, for example after a new build of the frontend. The index of the files
+of the dist folder is kept with the manifest, so it is also rebuilt after a new
+build.
+"""
+
+import os
+import threading
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from kwai.frontend.asset_index import AssetIndex
+from kwai.frontend.manifest import Chunk, Manifest
+
+
+def get_manifest_path(frontend_path: Path, application_name: str) -> Path:
+    """Return the path of the manifest file of an application."""
+    return (
+        frontend_path / "apps" / application_name / "dist" / ".vite" / "manifest.json"
+    )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ResolvedEntries:
+    """The files needed to load the entries of a manifest.
+
+    The files are relative to the dist folder of the application.
+
+    Attributes:
+        scripts: The files of the entry chunks.
+        css: The css files of all imported chunks.
+        preloads: The javascript files of the imported chunks that are no entry.
+    """
+
+    scripts: tuple[str, ...]
+    css: tuple[str, ...]
+    preloads: tuple[str, ...]
+
+
+class ApplicationManifest:
+    """A loaded manifest with a cache of the resolved entries."""
+
+    def __init__(self, manifest: Manifest, file_path: Path, mtime_ns: int = 0):
+        """Initialize the application manifest.
+
+        Args:
+            manifest: The parsed manifest.
+            file_path: The path of the manifest file.
+            mtime_ns: The modification time of the manifest file when it was loaded.
+        """
+        self._manifest = manifest
+        self._file_path = file_path
+        self._mtime_ns = mtime_ns
+        self._resolved: dict[tuple[str, ...], ResolvedEntries] = {}
+        self._asset_index: AssetIndex | None = None
+
+    @classmethod
+    def load(cls, file_path: Path) -> "ApplicationManifest":
+        """Load the manifest from a file."""
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        return cls(Manifest.load_from_file(file_path), file_path, mtime_ns)
+
+    @property
+    def file_path(self) -> Path:
+        """Return the path of the manifest file."""
+        return self._file_path
+
+    @property
+    def mtime_ns(self) -> int:
+        """Return the modification time of the manifest file when it was loaded."""
+        return self._mtime_ns
+
+    def resolve(self, *entries: str) -> ResolvedEntries:
+        """Return the files needed to load the given entries.
+
+        The result is cached, so the import graph is only walked once.
+
+        Raises:
+            ValueError: when an entry is not an entry point of the manifest.
+        """
+        resolved = self._resolved.get(entries)
+        if resolved is None:
+            chunks = self._find_imported_chunks(*entries)
+            resolved = ResolvedEntries(
+                scripts=tuple(chunk.file for chunk in chunks.values() if chunk.entry),
+                css=tuple(css for chunk in chunks.values() for css in chunk.css),
+                preloads=tuple(
+                    chunk.file
+                    for chunk in chunks.values()
+                    if chunk.file.endswith(".js") and not chunk.entry
+                ),
+            )
+            self._resolved[entries] = resolved
+        return resolved
+
+    def get_asset_index(self, dist_path: Path) -> AssetIndex:
+        """Return the index of the files of the dist folder.
+
+        The index is built on first use.
+        """
+        if self._asset_index is None:
+            self._asset_index = AssetIndex.build(dist_path)
+        return self._asset_index
+
+    def _find_imported_chunks(self, *entries: str) -> dict[str, Chunk]:
+        chunks = {}
+
+        for entry in entries:
+            if not self._manifest.has_chunk(entry):
+                raise ValueError(f"{entry} is not a chunk in {self._file_path}")
+
+            chunk = self._manifest.get_chunk(entry)
+            if not chunk.entry:
+                raise ValueError(f"{entry} is not an entry point in {self._file_path}")
+
+            chunks[entry] = chunk
+
+            # Copy the list: the chunks of the manifest are shared.
+            imports = list(chunk.imports)
+            while imports:
+                import_ = imports.pop()
+                if import_ not in chunks:
+                    import_chunk = self._manifest.get_chunk(import_)
+                    chunks[import_] = import_chunk
+                    imports.extend(import_chunk.imports)
+
+        return chunks
+
+
+class ManifestRegistry:
+    """A registry with the loaded manifest of each application."""
+
+    def __init__(self):
+        self._manifests: dict[str, ApplicationManifest] = {}
+        self._lock = threading.Lock()
+
+    def get(self, application_name: str, file_path: Path) -> ApplicationManifest:
+        """Return the manifest of an application.
+
+        The manifest is (re)loaded when it is not loaded yet, when the path has
+        changed or when the file is modified since it was loaded.
+
+        Raises:
+            FileNotFoundError: when the manifest file does not exist.
+        """
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        manifest = self._manifests.get(application_name)
+        if (
+            manifest is not None
+            and manifest.file_path == file_path
+            and manifest.mtime_ns == mtime_ns
+        ):
+            return manifest
+
+        with self._lock:
+            manifest = self._manifests.get(application_name)
+            if (
+                manifest is None
+                or manifest.file_path != file_path
+                or manifest.mtime_ns != mtime_ns
+            ):
+                manifest = ApplicationManifest.load(file_path)
+                self._manifests[application_name] = manifest
+            return manifest
+
+    def clear(self) -> None:
+        """Remove all loaded manifests."""
+        with self._lock:
+            self._manifests.clear()
+
+
+manifest_registry = ManifestRegistry()
@@ -0,0 +1,87 @@
+"""Module that creates precompressed versions of the files of a dist folder.
+
+The compressed files are stored next to the original file with the extension
+.gz or .br. [AssetResponse][kwai.frontend.asset_index.AssetResponse]
+sends these files to clients that accept the encoding, so the files are
+compressed only once with the highest compression level.
+"""
+
+import gzip
+
+from pathlib import Path
+from typing import Iterator
+
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+# The extensions of precompressed files for each content encoding.
+PRECOMPRESSED_EXTENSIONS = {"br": ".br", "gzip": ".gz"}
+
+COMPRESSIBLE_SUFFIXES = (
+    ".css",
+    ".html",
+    ".js",
+    ".json",
+    ".map",
+    ".mjs",
+    ".svg",
+    ".txt",
+    ".xml",
+)
+
+
+def _compress(content: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(content, quality=11)
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def precompress(dist_path: Path, minimum_size: int = 1024) -> Iterator[Path]:
+    """Create the compressed files for all compressible files of a dist folder.
+
+    A compressed file is only (re)created when it is older than the original file.
+    A compressed file that is not smaller than the original file is not kept.
+    Brotli files are only created when the compression extra is installed.
+
+    Args:
+        dist_path: The dist folder.
+        minimum_size: Files smaller than this size are not compressed.
+
+    Yields:
+        The path of each created file.
+    """
+    encodings = [
+        encoding
+        for encoding in PRECOMPRESSED_EXTENSIONS
+        if encoding != "br" or brotli is not None
+    ]
+    for path in sorted(dist_path.rglob("*")):
+        if path.suffix not in COMPRESSIBLE_SUFFIXES or not path.is_file():
+            continue
+        stat = path.stat()
+        if stat.st_size < minimum_size:
+            continue
+
+        content = None
+        for encoding in encodings:
+            compressed_path = path.with_name(
+                path.name + PRECOMPRESSED_EXTENSIONS[encoding]
+            )
+            if (
+                compressed_path.is_file()
+                and compressed_path.stat().st_mtime >= stat.st_mtime
+            ):
+                continue
+
+            if content is None:
+                content = path.read_bytes()
+            compressed = _compress(content, encoding)
+            if len(compressed) >= len(content):
+                compressed_path.unlink(missing_ok=True)
+                continue
+            compressed_path.write_bytes(compressed)
+            yield compressed_path
@@ -0,0 +1,154 @@
+"""Module that serves the HTML shell of a frontend application.
+
+The shell (index.jinja2) only depends on the application, the manifest, the
+website settings and the url of the application. In production, it is rendered
+once for each application and url and the HTML is reused for all next requests.
+A rendered shell is discarded when the manifest of the application is reloaded.
+"""
+
+import threading
+
+from dataclasses import dataclass
+from hashlib import md5
+
+from fastapi import Request, Response, status
+from fastapi.templating import Jinja2Templates
+
+from kwai.api.http_cache import ConditionalGet
+from kwai.frontend.manifest_registry import ApplicationManifest
+from kwai.frontend.vite import ProductionVite, Vite
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RenderedShell:
+    """The rendered HTML of an application shell.
+
+    Attributes:
+        content: The HTML.
+        etag: A strong ETag for the HTML.
+        manifest: The manifest that was used to render the HTML.
+    """
+
+    content: bytes
+    etag: str
+    manifest: ApplicationManifest
+
+
+class ShellCache:
+    """A cache for the rendered shells, keyed by application and url.
+
+    The url is part of the key, because it contains the host of the request. To
+    protect against a flood of requests with other hosts, the number of shells is
+    limited. When the cache is full, a shell for a new key is not stored.
+    """
+
+    def __init__(self, max_entries: int = 100):
+        """Initialize the cache.
+
+        Args:
+            max_entries: The maximum number of shells to store.
+        """
+        self._shells: dict[tuple[str, str], RenderedShell] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(
+        self, application_name: str, url: str, manifest: ApplicationManifest
+    ) -> RenderedShell | None:
+        """Return the rendered shell.
+
+        None is returned when the shell is not rendered yet, or when it was
+        rendered with another manifest.
+        """
+        shell = self._shells.get((application_name, url))
+        if shell is None or shell.manifest is not manifest:
+            return None
+        return shell
+
+    def set(
+        self,
+        application_name: str,
+        url: str,
+        manifest: ApplicationManifest,
+        content: bytes,
+    ) -> RenderedShell:
+        """Store the rendered shell."""
+        shell = RenderedShell(
+            content=content,
+            etag=f'"{md5(content, usedforsecurity=False).hexdigest()}"',
+            manifest=manifest,
+        )
+        key = (application_name, url)
+        with self._lock:
+            if key in self._shells or len(self._shells) < self._max_entries:
+                self._shells[key] = shell
+        return shell
+
+    def clear(self) -> None:
+        """Remove all rendered shells."""
+        with self._lock:
+            self._shells.clear()
+
+
+shell_cache = ShellCache()
+
+
+def get_application_url(request: Request, application_name: str) -> str:
+    """Return the url of the application.
+
+    The scheme of the X-Forwarded-Proto header is used, when available.
+    """
+    url = request.url_for(application_name, path="")
+    if "x-forwarded-proto" in request.headers:
+        url = url.replace(scheme=request.headers["x-forwarded-proto"])
+    return str(url)
+
+
+def _render(
+    request: Request,
+    application_name: str,
+    url: str,
+    templates: Jinja2Templates,
+    vite: Vite,
+) -> Response:
+    return templates.TemplateResponse(
+        request,
+        name="index.jinja2",
+        context={
+            "application": {
+                "name": application_name,
+                "url": url,
+            },
+            "vite": vite,
+        },
+    )
+
+
+def create_shell_response(
+    request: Request,
+    application_name: str,
+    templates: Jinja2Templates,
+    vite: Vite,
+) -> Response:
+    """Return the response with the HTML shell of an application.
+
+    In production, the rendered shell is cached and sent with an ETag. A 304 is
+    returned when the ETag matches If-None-Match. In development, the shell is
+    rendered on each request.
+    """
+    url = get_application_url(request, application_name)
+
+    manifest = vite.manifest if isinstance(vite, ProductionVite) else None
+    if manifest is None:
+        return _render(request, application_name, url, templates, vite)
+
+    shell = shell_cache.get(application_name, url, manifest)
+    if shell is None:
+        response = _render(request, application_name, url, templates, vite)
+        shell = shell_cache.set(application_name, url, manifest, response.body)
+
+    headers = {"ETag": shell.etag, "Cache-Control": "no-cache"}
+    if ConditionalGet.matches(request.headers.get("if-none-match"), shell.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=shell.content, media_type="text/html", headers=headers)
@@ -3,7 +3,8 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-from kwai.frontend.manifest import Chunk, Manifest
+from kwai.frontend.asset_index import Asset
+from kwai.frontend.manifest_registry import ApplicationManifest, ResolvedEntries
 
 
 class Vite(ABC):
@@ -30,8 +31,8 @@ class Vite(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_asset_path(self, asset_path: Path) -> Path | None:
-        """Return the path for an asset.
+    def get_asset(self, asset_path: Path) -> Asset | None:
+        """Return the asset for a path.
 
         None is returned when the file should not be processed. This is the case
         in the development environment, because Vite will serve the assets.
@@ -77,19 +78,26 @@ class DevelopmentVite(Vite):
     def get_preloads(self, base_url: str) -> list[str]:
         return []
 
-    def get_asset_path(self, asset_path: Path) -> Path | None:
+    def get_asset(self, asset_path: Path) -> Asset | None:
         return None
 
 
 class ProductionVite(Vite):
     """Vite implementation for production."""
 
-    def __init__(self, manifest_filepath: Path, base_path: Path):
+    def __init__(
+        self,
+        manifest_filepath: Path,
+        base_path: Path,
+        manifest: ApplicationManifest | None = None,
+    ):
         """Initialize the production Vite runtime.
 
         Args:
             manifest_filepath: Path to the manifest file.
             base_path: Path to the dist folder.
+            manifest: An already loaded manifest. When not passed, the manifest
+                file is loaded on init.
 
         !!! Note
             base_path is the path where the dist folder of an application is installed
@@ -97,68 +105,37 @@ class ProductionVite(Vite):
         """
         self._manifest_filepath: Path = manifest_filepath
         self._base_path: Path = base_path
-        self._manifest: Manifest | None = None
-        self._imported_chunks: dict[str, Chunk] = {}  # chunks imported by the entries
+        self._manifest: ApplicationManifest | None = manifest
+        self._resolved: ResolvedEntries | None = None
 
-    def init(self, *entries: str):
-        """Load the manifest file."""
-        self._manifest = Manifest.load_from_file(self._manifest_filepath)
-        self._imported_chunks = self._find_imported_chunks(*entries)
+    @property
+    def manifest(self) -> ApplicationManifest | None:
+        """Return the manifest, when it is loaded."""
+        return self._manifest
 
-    def get_scripts(self, base_url: str) -> list[str]:
-        scripts = []
+    def init(self, *entries: str):
+        """Resolve the files needed for the entries.
 
-        for chunk in self._imported_chunks.values():
-            if chunk.entry:
-                scripts.append(base_url + chunk.file)
+        The manifest file is loaded when no manifest was passed.
+        """
+        if self._manifest is None:
+            self._manifest = ApplicationManifest.load(self._manifest_filepath)
+        self._resolved = self._manifest.resolve(*entries)
 
-        return scripts
+    def get_scripts(self, base_url: str) -> list[str]:
+        return [base_url + file for file in self._resolved.scripts]
 
     def get_css(self, base_url: str) -> list[str]:
-        styles = []
-        for chunk in self._imported_chunks.values():
-            for css in chunk.css:
-                styles.append(base_url + css)
-        return styles
+        return [base_url + css for css in self._resolved.css]
 
     def get_preloads(self, base_url: str) -> list[str]:
-        preloads = []
-
-        for chunk in self._imported_chunks.values():
-            if chunk.file.endswith(".js") and not chunk.entry:
-                preloads.append(base_url + chunk.file)
-
-        return preloads
+        return [base_url + file for file in self._resolved.preloads]
 
-    def _find_imported_chunks(self, *entries: str) -> dict[str, Chunk]:
-        chunks = {}
+    def get_asset(self, path: Path) -> Asset | None:
+        """Return the asset from the index of the dist folder.
 
-        for entry in entries:
-            if not self._manifest.has_chunk(entry):
-                raise ValueError(f"{entry} is not a chunk in {self._manifest_filepath}")
-
-            chunk = self._manifest.get_chunk(entry)
-            if not chunk.entry:
-                raise ValueError(
-                    f"{entry} is not an entry point in {self._manifest_filepath}"
-                )
-
-            chunks[entry] = chunk
-
-            imports = chunk.imports
-            while imports:
-                import_ = imports.pop()
-                if import_ not in chunks:
-                    import_chunk = self._manifest.get_chunk(import_)
-                    chunks[import_] = import_chunk
-                    imports.extend(import_chunk.imports)
-
-        return chunks
-
-    def get_asset_path(self, path: Path) -> Path | None:
-        dist_path = self._base_path / "dist"
-        asset_file = dist_path / path
-        if asset_file.is_relative_to(dist_path) and asset_file.is_file():
-            return asset_file
-
-        return None
+        The index is built on first use and is kept with the manifest.
+        """
+        if self._manifest is None:
+            self._manifest = ApplicationManifest.load(self._manifest_filepath)
+        return self._manifest.get_asset_index(self._base_path / "dist").get(path)
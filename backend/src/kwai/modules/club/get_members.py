@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 
 from kwai.core.domain.presenter import AsyncPresenter, IterableResult
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.value_objects.date import Date
 from kwai.modules.club.domain.member import MemberEntity
 from kwai.modules.club.repositories.member_repository import MemberRepository
@@ -15,6 +16,7 @@ class GetMembersCommand:
     Attributes:
         limit: the max. number of elements to return. Default is None, which means all.
         offset: Offset to use. Default is None.
+        after: Only return members after this cursor (keyset pagination).
         active: When true (the default), only return the active members.
         license_end_month: Only return members with a license ending in the given month.
         license_end_year: Only return members with a license ending in the given year.
@@ -22,6 +24,7 @@ class GetMembersCommand:
 
     limit: int | None = None
     offset: int | None = None
+    after: Cursor | None = None
     active: bool = True
     license_end_month: int = 0
     license_end_year: int = 0
@@ -47,8 +50,14 @@ class GetMembers:
     async def execute(self, command: GetMembersCommand):
         """Execute the use case.
 
+        The number of members is only calculated for the first page, when there is
+        no cursor.
+
         Args:
             command: the input for this use case.
+
+        Raises:
+            InvalidCursorException: Raised when the cursor is not valid.
         """
         query = self._repo.create_query()
 
@@ -60,9 +69,15 @@ class GetMembers:
                 command.license_end_month, command.license_end_year or Date.today().year
             )
 
+        count = None
+        if command.after is None:
+            count = await query.count()
+        else:
+            query = query.filter_after(command.after)
+
         await self._presenter.present(
             IterableResult(
-                count=await query.count(),
+                count=count,
                 limit=command.limit,
                 offset=command.offset,
                 iterator=self._repo.get_all(query, command.limit, command.offset),
@@ -1,5 +1,6 @@
 """Module for defining a coach repository using a database."""
 
+from kwai.core.db.collection_versions import CollectionVersions
 from kwai.core.db.database import Database
 from kwai.core.domain.entity import Entity
 from kwai.modules.club.domain.coach import CoachEntity, CoachIdentifier
@@ -17,7 +18,9 @@ class CoachDbRepository(CoachRepository):
         new_coach_id = await self._database.insert(
             CoachRow.__table_name__, CoachRow.persist(coach)
         )
+        await CollectionVersions(self._database).increment(CoachRow.__table_name__)
         return Entity.replace(coach, id_=CoachIdentifier(new_coach_id))
 
     async def delete(self, coach: CoachEntity):
         await self._database.delete(coach.id.value, CoachRow.__table_name__)
+        await CollectionVersions(self._database).increment(CoachRow.__table_name__)
@@ -1,13 +1,18 @@
 """Module that implements a MemberQuery for a database."""
 
 from dataclasses import dataclass
-from typing import Self
+from typing import Any, AsyncIterator, Self
 
-from sql_smith.functions import alias, criteria, func, group, literal, on
+from sql_smith.functions import alias, on
 
 from kwai.core.db.database import Database
-from kwai.core.db.database_query import DatabaseQuery
+from kwai.core.db.database_query import (
+    DatabaseQuery,
+    create_date_range_condition,
+    create_keyset_condition,
+)
 from kwai.core.db.table_row import JoinedTableRow
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.value_objects.unique_id import UniqueId
 from kwai.modules.club.domain.member import MemberEntity, MemberIdentifier
 from kwai.modules.club.repositories._tables import (
@@ -84,18 +89,13 @@ class MemberDbQuery(MemberQuery, DatabaseQuery):
     def filter_by_license_date(
         self, license_end_month: int, license_end_year: int
     ) -> Self:
-        condition = criteria(
-            "{} = {}",
-            func("YEAR", MemberRow.column("license_end_date")),
-            literal(license_end_year),
-        ).and_(
-            criteria(
-                "{} = {}",
-                func("MONTH", MemberRow.column("license_end_date")),
-                literal(license_end_month),
-            ),
+        self._query.and_where(
+            create_date_range_condition(
+                MemberRow.column("license_end_date"),
+                license_end_year,
+                license_end_month,
+            )
         )
-        self._query.and_where(group(condition))
         return self
 
     def filter_by_active(self) -> Self:
@@ -105,3 +105,17 @@ class MemberDbQuery(MemberQuery, DatabaseQuery):
     def filter_by_uuid(self, uuid: UniqueId) -> Self:
         self._query.and_where(MemberRow.field("uuid").eq(str(uuid)))
         return self
+
+    def fetch(
+        self, limit: int | None = None, offset: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        # The members are ordered on id, which is required for keyset pagination.
+        self._query.order_by(MemberRow.column("id"))
+        return super().fetch(limit, offset)
+
+    def filter_after(self, cursor: Cursor) -> Self:
+        (id_,) = cursor.unpack(int)
+        self._query.and_where(
+            create_keyset_condition([(MemberRow.column("id"), "ASC")], [id_])
+        )
+        return self
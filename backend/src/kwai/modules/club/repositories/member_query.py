@@ -3,9 +3,10 @@
 from abc import ABC, abstractmethod
 from typing import Self
 
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.repository.query import Query
 from kwai.core.domain.value_objects.unique_id import UniqueId
-from kwai.modules.club.domain.member import MemberIdentifier
+from kwai.modules.club.domain.member import MemberEntity, MemberIdentifier
 
 
 class MemberQuery(Query, ABC):
@@ -32,3 +33,19 @@ class MemberQuery(Query, ABC):
     @abstractmethod
     def filter_by_uuid(self, uuid: UniqueId) -> Self:
         """Filter on the uuid."""
+
+    @abstractmethod
+    def filter_after(self, cursor: Cursor) -> Self:
+        """Filter on the members after the cursor.
+
+        The members are ordered on their id. The cursor contains the id of a
+        member (see [create_cursor][kwai.modules.club.repositories.member_query.MemberQuery.create_cursor]).
+
+        Raises:
+            InvalidCursorException: when the cursor is not a cursor for members.
+        """
+
+    @staticmethod
+    def create_cursor(member: MemberEntity) -> Cursor:
+        """Create a cursor for the members after the given member."""
+        return Cursor.create(member.id.value)
@@ -2,6 +2,7 @@
 
 from typing import AsyncIterator
 
+from kwai.core.db.collection_versions import CollectionVersions
 from kwai.core.db.database import Database
 from kwai.core.domain.entity import Entity
 from kwai.modules.portal.applications.application import (
@@ -70,6 +71,7 @@ class ApplicationDbRepository(ApplicationRepository):
         new_id = await self._database.insert(
             ApplicationsTable.table_name, ApplicationRow.persist(application)
         )
+        await CollectionVersions(self._database).increment(ApplicationsTable.table_name)
         await self._database.commit()
         return Entity.replace(application, id_=ApplicationIdentifier(new_id))
 
@@ -79,8 +81,10 @@ class ApplicationDbRepository(ApplicationRepository):
             ApplicationsTable.table_name,
             ApplicationRow.persist(application),
         )
+        await CollectionVersions(self._database).increment(ApplicationsTable.table_name)
         await self._database.commit()
 
     async def delete(self, application: ApplicationEntity) -> None:
         await self._database.delete(application.id.value, ApplicationsTable.table_name)
+        await CollectionVersions(self._database).increment(ApplicationsTable.table_name)
         await self._database.commit()
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.use_case import UseCaseBrowseResult
 from kwai.core.domain.value_objects.unique_id import UniqueId
 from kwai.modules.portal.news.news_item_repository import NewsItemRepository
@@ -13,11 +14,13 @@ class GetNewsItemsCommand:
 
     Attributes:
         offset: Offset to use. Default is None.
+        after: Only return news items after this cursor (keyset pagination).
         limit: The max. number of elements to return. Default is None, which means all.
         enabled: When False, also news items that are not activated will be returned.
     """
 
     offset: int | None = None
+    after: Cursor | None = None
     limit: int | None = None
     enabled: bool = True
     publish_year: int = 0
@@ -47,8 +50,13 @@ class GetNewsItems:
         Args:
             command: The input for this use case.
 
+        Raises:
+            InvalidCursorException: Raised when the cursor is not valid.
+
         Returns:
             A tuple with the number of entities and an iterator for news item entities.
+            The number of entities is only calculated for the first page, when
+            there is no cursor.
         """
         query = self._repo.create_query()
 
@@ -57,7 +65,7 @@ class GetNewsItems:
 
         if command.publish_year > 0:
             query.filter_by_publication_date(
-                command.publish_year, command.publish_month
+                command.publish_year, command.publish_month or None
             )
 
         if command.promoted:
@@ -71,8 +79,14 @@ class GetNewsItems:
 
         query.order_by_publication_date()
 
+        count = None
+        if command.after is None:
+            count = await query.count()
+        else:
+            query.filter_after(command.after)
+
         return UseCaseBrowseResult(
-            count=await query.count(),
+            count=count,
             iterator=self._repo.get_all(
                 query=query, offset=command.offset, limit=command.limit
             ),
@@ -1,12 +1,18 @@
 """Module that implements a NewsItemQuery for a database."""
 
+from datetime import datetime
 from typing import AsyncIterator
 
-from sql_smith.functions import criteria, express, func, group, literal, on
+from sql_smith.functions import express, group, on
 
 from kwai.core.db.database import Database
-from kwai.core.db.database_query import DatabaseQuery
+from kwai.core.db.database_query import (
+    DatabaseQuery,
+    create_date_range_condition,
+    create_keyset_condition,
+)
 from kwai.core.db.rows import OwnersTable
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.value_objects.timestamp import Timestamp
 from kwai.core.domain.value_objects.unique_id import UniqueId
 from kwai.modules.portal.applications.application_tables import ApplicationsTable
@@ -77,20 +83,11 @@ class NewsItemDbQuery(NewsItemQuery, DatabaseQuery):
     def filter_by_publication_date(
         self, year: int, month: int | None = None
     ) -> "NewsItemQuery":
-        condition = criteria(
-            "{} = {}",
-            func("YEAR", NewsItemsTable.column("publish_date")),
-            literal(year),
-        )
-        if month is not None:
-            condition.and_(
-                criteria(
-                    "{} = {}",
-                    func("MONTH", NewsItemsTable.column("publish_date")),
-                    literal(month),
-                )
+        self._query.and_where(
+            create_date_range_condition(
+                NewsItemsTable.column("publish_date"), year, month
             )
-        self._query.and_where(condition)
+        )
         return self
 
     def filter_by_promoted(self) -> "NewsItemQuery":
@@ -154,9 +151,27 @@ class NewsItemDbQuery(NewsItemQuery, DatabaseQuery):
         return self
 
     def order_by_publication_date(self) -> "NewsItemQuery":
+        # The id makes the order unique, which is required for keyset pagination.
         self._main_query.order_by(NewsItemsTable.column("publish_date"), "DESC")
+        self._main_query.order_by(NewsItemsTable.column("id"), "DESC")
         # Also add the order to the CTE
         self._query.order_by(NewsItemsTable.column("publish_date"), "DESC")
+        self._query.order_by(NewsItemsTable.column("id"), "DESC")
+        return self
+
+    def filter_after(self, cursor: Cursor) -> "NewsItemQuery":
+        publish_date, id_ = cursor.unpack(datetime, int)
+        self._query.and_where(
+            group(
+                create_keyset_condition(
+                    [
+                        (NewsItemsTable.column("publish_date"), "DESC"),
+                        (NewsItemsTable.column("id"), "DESC"),
+                    ],
+                    [str(publish_date), id_],
+                )
+            )
+        )
         return self
 
     def fetch(
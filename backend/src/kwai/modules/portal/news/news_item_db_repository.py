@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator
 
 from sql_smith.functions import field
 
+from kwai.core.db.collection_versions import CollectionVersions
 from kwai.core.db.database import Database
 from kwai.core.db.rows import OwnersTable
 from kwai.core.domain.entity import Entity
@@ -55,6 +56,7 @@ class NewsItemDbRepository(NewsItemRepository):
         ]
         await self._database.insert(NewsItemTextsTable.table_name, *content_rows)
 
+        await CollectionVersions(self._database).increment(NewsItemsTable.table_name)
         await self._database.commit()
         return result
 
@@ -76,6 +78,7 @@ class NewsItemDbRepository(NewsItemRepository):
             NewsItemTextRow.persist(news_item, content) for content in news_item.texts
         ]
         await self._database.insert(NewsItemTextsTable.table_name, *content_rows)
+        await CollectionVersions(self._database).increment(NewsItemsTable.table_name)
         await self._database.commit()
 
     async def delete(self, news_item: NewsItemEntity):
@@ -86,6 +89,7 @@ class NewsItemDbRepository(NewsItemRepository):
         )
         await self._database.execute(delete_contents_query)
         await self._database.delete(news_item.id.value, NewsItemsTable.table_name)
+        await CollectionVersions(self._database).increment(NewsItemsTable.table_name)
         await self._database.commit()
 
     def create_query(self) -> NewsItemQuery:
@@ -2,9 +2,10 @@
 
 from abc import abstractmethod
 
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.repository.query import Query
 from kwai.core.domain.value_objects.unique_id import UniqueId
-from kwai.modules.portal.news.news_item import NewsItemIdentifier
+from kwai.modules.portal.news.news_item import NewsItemEntity, NewsItemIdentifier
 
 
 class NewsItemQuery(Query):
@@ -69,3 +70,22 @@ class NewsItemQuery(Query):
     def order_by_publication_date(self) -> "NewsItemQuery":
         """Order the result on the publication date."""
         raise NotImplementedError
+
+    @abstractmethod
+    def filter_after(self, cursor: Cursor) -> "NewsItemQuery":
+        """Add a filter to get only the news items after the cursor.
+
+        The cursor contains the publication date and the id of a news item (see
+        [create_cursor][kwai.modules.portal.news.news_item_query.NewsItemQuery.create_cursor]).
+        Use this filter in combination with order_by_publication_date. It can't be
+        combined with filter_by_promoted, which orders on the promotion first.
+
+        Raises:
+            InvalidCursorException: when the cursor is not a cursor for news items.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def create_cursor(news_item: NewsItemEntity) -> Cursor:
+        """Create a cursor for the news items after the given news item."""
+        return Cursor.create(str(news_item.period.start_date), news_item.id.value)
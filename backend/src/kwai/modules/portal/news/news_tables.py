@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from kwai.core.converter import MarkdownConverter
 from kwai.core.db.rows import TextRow
 from kwai.core.db.table import Table
 from kwai.core.domain.value_objects.period import Period
@@ -45,6 +46,10 @@ class NewsItemTextRow(TextRow):
             user_id=text.author.id.value,
             created_at=text.traceable_time.created_at.timestamp,
             updated_at=text.traceable_time.updated_at.timestamp,
+            html_summary=MarkdownConverter().convert(text.summary),
+            html_content=MarkdownConverter().convert(text.content)
+            if text.content
+            else None,
         )
 
 
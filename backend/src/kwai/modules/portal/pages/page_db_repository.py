@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator
 
 from sql_smith.functions import field
 
+from kwai.core.db.collection_versions import CollectionVersions
 from kwai.core.db.database import Database
 from kwai.core.db.rows import OwnersTable
 from kwai.core.domain.entity import Entity
@@ -50,6 +51,7 @@ class PageDbRepository(PageRepository):
         content_rows = [PageTextRow.persist(result, content) for content in page.texts]
         await self._database.insert(PageContentsTable.table_name, *content_rows)
 
+        await CollectionVersions(self._database).increment(PagesTable.table_name)
         await self._database.commit()
         return result
 
@@ -67,6 +69,7 @@ class PageDbRepository(PageRepository):
 
         content_rows = [PageTextRow.persist(page, content) for content in page.texts]
         await self._database.insert(PageContentsTable.table_name, *content_rows)
+        await CollectionVersions(self._database).increment(PagesTable.table_name)
         await self._database.commit()
 
     async def delete(self, page: PageEntity):
@@ -77,6 +80,7 @@ class PageDbRepository(PageRepository):
         )
         await self._database.execute(delete_contents_query)
         await self._database.delete(page.id.value, PagesTable.table_name)
+        await CollectionVersions(self._database).increment(PagesTable.table_name)
         await self._database.commit()
 
     def create_query(self) -> PageQuery:
@@ -5,6 +5,7 @@ from typing import Any, AsyncGenerator, Self
 
 from sql_smith.functions import field, on
 
+from kwai.core.db.collection_versions import CollectionVersions
 from kwai.core.db.database import Database
 from kwai.core.db.database_query import DatabaseQuery
 from kwai.core.db.table_row import JoinedTableRow
@@ -158,6 +159,7 @@ class TeamDbRepository(TeamRepository):
         new_team_id = await self._database.insert(
             TeamRow.__table_name__, TeamRow.persist(team)
         )
+        await CollectionVersions(self._database).increment(TeamRow.__table_name__)
         return Entity.replace(team, id_=TeamIdentifier(new_team_id))
 
     async def delete(self, team: TeamEntity) -> None:
@@ -168,11 +170,13 @@ class TeamDbRepository(TeamRepository):
         )
         await self._database.execute(delete_team_members_query)
         await self._database.delete(team.id.value, TeamRow.__table_name__)
+        await CollectionVersions(self._database).increment(TeamRow.__table_name__)
 
     async def update(self, team: TeamEntity):
         await self._database.update(
             team.id.value, TeamRow.__table_name__, TeamRow.persist(team)
         )
+        await CollectionVersions(self._database).increment(TeamRow.__table_name__)
 
     async def add_team_member(self, team: TeamEntity, member: TeamMember):
         team_member_row = TeamMemberRow.persist(team, member)
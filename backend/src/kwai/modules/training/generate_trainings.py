@@ -0,0 +1,178 @@
+"""Module for the use case "Generate trainings"."""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from kwai.core.domain.value_objects.owner import Owner
+from kwai.core.domain.value_objects.period import Period
+from kwai.core.domain.value_objects.text import DocumentFormat, Locale, LocaleText
+from kwai.core.domain.value_objects.timestamp import Timestamp
+from kwai.modules.training.trainings.training import TrainingEntity
+from kwai.modules.training.trainings.training_definition import (
+    TrainingDefinitionEntity,
+    TrainingDefinitionIdentifier,
+)
+from kwai.modules.training.trainings.training_definition_repository import (
+    TrainingDefinitionRepository,
+)
+from kwai.modules.training.trainings.training_repository import TrainingRepository
+
+
+# The maximum number of days that can be generated at once (a season fits in it).
+MAX_DAYS = 366
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class GenerateTrainingsCommand:
+    """Input for the use case "Generate trainings".
+
+    Attributes:
+        definition: The id of the training definition.
+        start_date: The first date of the range (format YYYY-MM-DD).
+        end_date: The last date of the range (format YYYY-MM-DD).
+        skip_dates: Dates without a training, like holidays (format YYYY-MM-DD).
+        locale: The locale of the text of the trainings.
+    """
+
+    definition: int
+    start_date: str
+    end_date: str
+    skip_dates: list[str] = field(default_factory=list)
+    locale: str = Locale.NL.value
+
+
+class GenerateTrainings:
+    """Use case for generating the trainings of a training definition.
+
+    A training is created for each date in the range that falls on the weekday of
+    the definition. Dates that already have a training of the definition, and the
+    dates to skip, are ignored. All trainings are saved at once.
+    """
+
+    def __init__(
+        self,
+        repo: TrainingRepository,
+        definition_repo: TrainingDefinitionRepository,
+        owner: Owner,
+    ):
+        """Initialize the use case.
+
+        Args:
+            repo: The repository used to create the trainings.
+            definition_repo: The repository for getting the training definition.
+            owner: The user that executes this use case.
+        """
+        self._repo = repo
+        self._definition_repo = definition_repo
+        self._owner = owner
+
+    async def execute(self, command: GenerateTrainingsCommand) -> list[TrainingEntity]:
+        """Execute the use case.
+
+        Args:
+            command: The input for this use case.
+
+        Returns:
+            The created trainings.
+
+        Raises:
+            TrainingDefinitionNotFoundException: Raised when the training definition
+                cannot be found.
+            ValueError: Raised when the range of dates is not valid.
+        """
+        start_date = date.fromisoformat(command.start_date)
+        end_date = date.fromisoformat(command.end_date)
+        if start_date > end_date:
+            raise ValueError("start_date should be before end_date")
+        if (end_date - start_date).days >= MAX_DAYS:
+            raise ValueError(f"A range can't be longer than {MAX_DAYS} days")
+
+        definition = await self._definition_repo.get_by_id(
+            TrainingDefinitionIdentifier(command.definition)
+        )
+
+        skip_dates = {date.fromisoformat(skip_date) for skip_date in command.skip_dates}
+        skip_dates |= await self._get_existing_dates(definition, start_date, end_date)
+
+        trainings = [
+            self._create_training(definition, training_date, Locale(command.locale))
+            for training_date in _get_dates(definition, start_date, end_date)
+            if training_date not in skip_dates
+        ]
+        if not trainings:
+            return []
+
+        return await self._repo.create_many(*trainings)
+
+    async def _get_existing_dates(
+        self, definition: TrainingDefinitionEntity, start_date: date, end_date: date
+    ) -> set[date]:
+        """Return the dates that already have a training of the definition."""
+        tz = ZoneInfo(definition.period.timezone)
+        query = (
+            self._repo.create_query()
+            .filter_by_definition(definition)
+            .filter_by_dates(
+                _to_utc(datetime.combine(start_date, datetime.min.time(), tz)),
+                _to_utc(
+                    datetime.combine(
+                        end_date + timedelta(days=1), datetime.min.time(), tz
+                    )
+                ),
+            )
+        )
+        # The start date of a training is read as a naive datetime in UTC.
+        return {
+            training.period.start_date.timestamp.replace(tzinfo=timezone.utc)
+            .astimezone(tz)
+            .date()
+            async for training in self._repo.get_all(query)
+        }
+
+    def _create_training(
+        self, definition: TrainingDefinitionEntity, training_date: date, locale: Locale
+    ) -> TrainingEntity:
+        """Create a training for the given date."""
+        tz = ZoneInfo(definition.period.timezone)
+        start = datetime.combine(training_date, definition.period.start, tz)
+        end = (
+            start
+            if definition.period.end is None
+            else datetime.combine(training_date, definition.period.end, tz)
+        )
+        return TrainingEntity(
+            texts=[
+                LocaleText(
+                    locale=locale,
+                    format=DocumentFormat.MARKDOWN,
+                    title=definition.name,
+                    content="",
+                    summary=definition.description,
+                    author=self._owner,
+                )
+            ],
+            definition=definition,
+            teams=[] if definition.team is None else [definition.team],
+            period=Period(start_date=_to_utc(start), end_date=_to_utc(end)),
+            location=definition.location,
+        )
+
+
+def _get_dates(
+    definition: TrainingDefinitionEntity, start_date: date, end_date: date
+) -> list[date]:
+    """Return all dates in the range that fall on the weekday of the definition."""
+    # Weekday uses 1 for monday, date.weekday uses 0.
+    days = (definition.weekday.value - 1 - start_date.weekday()) % 7
+    current_date = start_date + timedelta(days=days)
+    dates = []
+    while current_date <= end_date:
+        dates.append(current_date)
+        current_date += timedelta(days=7)
+    return dates
+
+
+def _to_utc(local_datetime: datetime) -> Timestamp:
+    """Convert a local datetime into a UTC timestamp."""
+    return Timestamp(local_datetime.astimezone(timezone.utc))
@@ -0,0 +1,74 @@
+"""Module for the use case "Get training calendar"."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from kwai.core.domain.value_objects.text import Locale
+from kwai.modules.training.trainings.training_calendar_query import (
+    TrainingCalendarItem,
+)
+from kwai.modules.training.trainings.training_repository import TrainingRepository
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class GetTrainingCalendarCommand:
+    """Input for the use case "Get training calendar".
+
+    Use year (and month) for a month view, or start and end for another period.
+
+    Attributes:
+        year: Only return trainings of this year.
+        month: Only return trainings of this month.
+        start: Only return trainings starting from this date.
+        end: Only return trainings before this date.
+        active: Only return trainings that are active (default is True).
+        locale: The locale of the titles.
+    """
+
+    year: int | None = None
+    month: int | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+    active: bool = True
+    locale: str = Locale.NL.value
+
+
+class GetTrainingCalendar:
+    """Use case to get the trainings for a calendar.
+
+    Unlike "Get trainings", this use case doesn't create training entities. It
+    returns the read model that is needed to show trainings in a calendar.
+    """
+
+    def __init__(self, repo: TrainingRepository):
+        """Initialize the use case.
+
+        Args:
+            repo: The repository for trainings.
+        """
+        self._repo = repo
+
+    async def execute(
+        self, command: GetTrainingCalendarCommand
+    ) -> list[TrainingCalendarItem]:
+        """Execute the use case.
+
+        Args:
+            command: The input for this use case.
+
+        Raises:
+            ValueError: Raised when there is no year, nor a start and end date.
+        """
+        query = self._repo.create_calendar_query(Locale(command.locale))
+
+        if command.year:
+            query.filter_by_year_month(command.year, command.month)
+        elif command.start and command.end:
+            query.filter_by_dates(command.start, command.end)
+        else:
+            raise ValueError("A year, or a start and end date is required")
+
+        if command.active:
+            query.filter_active()
+
+        return await query.fetch_items()
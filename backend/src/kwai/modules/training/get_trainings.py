@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.use_case import UseCaseBrowseResult
 from kwai.modules.training.coaches.coach import CoachIdentifier
 from kwai.modules.training.coaches.coach_repository import CoachRepository
@@ -22,6 +23,7 @@ class GetTrainingsCommand:
     Attributes:
         limit: the max. number of elements to return. Default is None, which means all.
         offset: Offset to use. Default is None.
+        after: Only return trainings after this cursor (keyset pagination).
         year: Only return trainings of this year.
         month: Only return trainings of this month.
         start: Only return trainings starting from this date.
@@ -33,6 +35,7 @@ class GetTrainingsCommand:
 
     limit: int | None = None
     offset: int | None = None
+    after: Cursor | None = None
     year: int | None = None
     month: int | None = None
     start: datetime | None = None
@@ -71,9 +74,12 @@ class GetTrainings:
         Raises:
             CoachNotFoundException: Raised when a coach is not found.
             TrainingDefinitionNotFoundException: Raised when a definition is not found.
+            InvalidCursorException: Raised when the cursor is not valid.
 
         Returns:
             A tuple with the number of entities and an iterator for training entities.
+            The number of entities is only calculated for the first page, when
+            there is no cursor.
         """
         query = self._repo.create_query().order_by_date()
 
@@ -98,7 +104,13 @@ class GetTrainings:
 
         query.order_by_date()
 
+        count = None
+        if command.after is None:
+            count = await query.count()
+        else:
+            query.filter_after(command.after)
+
         return UseCaseBrowseResult(
-            count=await query.count(),
+            count=count,
             iterator=self._repo.get_all(query, command.limit, command.offset),
         )
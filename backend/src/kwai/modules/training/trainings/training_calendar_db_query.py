@@ -0,0 +1,119 @@
+"""Module that implements a query of the training calendar for a database."""
+
+from collections import defaultdict
+from datetime import datetime
+
+from sql_smith.functions import on
+
+from kwai.core.db.database import Database
+from kwai.core.db.database_query import DatabaseQuery, create_date_range_condition
+from kwai.core.domain.value_objects.text import Locale
+from kwai.modules.training.trainings.training_calendar_query import (
+    TrainingCalendarItem,
+    TrainingCalendarQuery,
+)
+from kwai.modules.training.trainings.training_tables import (
+    TrainingContentsTable,
+    TrainingsTable,
+    TrainingTeamsTable,
+)
+
+
+class TrainingCalendarDbQuery(TrainingCalendarQuery, DatabaseQuery):
+    """A database query for the training calendar.
+
+    Only the columns needed for a calendar are selected. The teams are fetched
+    with a second query for all trainings at once.
+    """
+
+    def __init__(self, database: Database, locale: Locale = Locale.NL):
+        """Initialize the query.
+
+        Args:
+            database: The database to use.
+            locale: The locale of the title.
+        """
+        self._locale = locale
+        super().__init__(database)
+
+    def init(self):
+        self._query.from_(TrainingsTable.table_name).left_join(
+            TrainingContentsTable.table_name,
+            on(
+                TrainingContentsTable.column("training_id"),
+                TrainingsTable.column("id"),
+            ).and_(TrainingContentsTable.field("locale").eq(self._locale.value)),
+        )
+
+    @property
+    def columns(self):
+        return [
+            TrainingsTable.column("id"),
+            TrainingsTable.column("start_date"),
+            TrainingsTable.column("end_date"),
+            TrainingsTable.column("location"),
+            TrainingsTable.column("cancelled"),
+            TrainingContentsTable.column("title"),
+        ]
+
+    @property
+    def count_column(self) -> str:
+        return TrainingsTable.column("id")
+
+    def filter_by_year_month(
+        self, year: int, month: int | None = None
+    ) -> TrainingCalendarQuery:
+        self._query.and_where(
+            create_date_range_condition(
+                TrainingsTable.column("start_date"), year, month
+            )
+        )
+        return self
+
+    def filter_by_dates(self, start: datetime, end: datetime) -> TrainingCalendarQuery:
+        self._query.and_where(
+            TrainingsTable.field("start_date").between(str(start), str(end))
+        )
+        return self
+
+    def filter_active(self) -> TrainingCalendarQuery:
+        self._query.and_where(TrainingsTable.field("active").eq(1))
+        return self
+
+    async def fetch_items(self) -> list[TrainingCalendarItem]:
+        self._query.order_by(TrainingsTable.column("start_date"), "ASC").order_by(
+            TrainingsTable.column("id"), "ASC"
+        )
+        rows = [row async for row in self.fetch()]
+        if not rows:
+            return []
+
+        team_query = (
+            self._database.create_query_factory()
+            .select(
+                TrainingTeamsTable.column("training_id"),
+                TrainingTeamsTable.column("team_id"),
+            )
+            .from_(TrainingTeamsTable.table_name)
+            .where(
+                TrainingTeamsTable.field("training_id").in_(
+                    *[row["id"] for row in rows]
+                )
+            )
+        )
+        team_ids: dict[int, list[int]] = defaultdict(list)
+        async for team_row in self._database.fetch(team_query):
+            team_ids[team_row["training_id"]].append(team_row["team_id"])
+
+        return [
+            TrainingCalendarItem(
+                id=row["id"],
+                start_date=row["start_date"],
+                end_date=row["end_date"],
+                title=row["title"] or "",
+                location=row["location"] or "",
+                cancelled=row["cancelled"] == 1,
+                team_ids=tuple(team_ids.get(row["id"], ())),
+            )
+            for row in rows
+        ]
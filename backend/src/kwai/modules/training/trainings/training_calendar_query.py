@@ -0,0 +1,71 @@
+"""Module that defines an interface for a query of the training calendar."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+from kwai.core.domain.repository.query import Query
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class TrainingCalendarItem:
+    """A training as it is shown in a calendar.
+
+    This is a read model: it only contains what a calendar needs, so it can be
+    loaded without creating training entities.
+
+    Attributes:
+        id: The id of the training.
+        start_date: The start of the training (UTC).
+        end_date: The end of the training (UTC).
+        title: The title of the training.
+        location: The location of the training.
+        cancelled: Is the training cancelled?
+        team_ids: The ids of the teams of the training.
+    """
+
+    id: int
+    start_date: datetime
+    end_date: datetime
+    title: str
+    location: str
+    cancelled: bool
+    team_ids: tuple[int, ...] = ()
+
+
+class TrainingCalendarQuery(Query, ABC):
+    """Interface for a query of the training calendar."""
+
+    @abstractmethod
+    def filter_by_year_month(
+        self, year: int, month: int | None = None
+    ) -> "TrainingCalendarQuery":
+        """Add filter to get only trainings for the given year/month.
+
+        Args:
+            year: The year to use for the filter.
+            month: The month to use for the filter.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def filter_by_dates(
+        self, start: datetime, end: datetime
+    ) -> "TrainingCalendarQuery":
+        """Add filter to get only trainings between two dates.
+
+        Args:
+            start: The start date to use for the filter.
+            end: The end date to use for the filter.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def filter_active(self) -> "TrainingCalendarQuery":
+        """Add filter to get only the active trainings."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_items(self) -> list[TrainingCalendarItem]:
+        """Fetch the trainings, ordered by start date."""
+        raise NotImplementedError
@@ -1,12 +1,18 @@
 """Module that implements a training query for a database."""
 
+from datetime import datetime
 from typing import AsyncIterator
 
-from sql_smith.functions import alias, criteria, express, func, group, literal, on
+from sql_smith.functions import alias, express, group, on
 
 from kwai.core.db.database import Database
-from kwai.core.db.database_query import DatabaseQuery
+from kwai.core.db.database_query import (
+    DatabaseQuery,
+    create_date_range_condition,
+    create_keyset_condition,
+)
 from kwai.core.db.rows import OwnersTable
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.value_objects.timestamp import Timestamp
 from kwai.modules.training.coaches.coach import CoachEntity
 from kwai.modules.training.teams.team import TeamEntity
@@ -96,18 +102,11 @@ class TrainingDbQuery(TrainingQuery, DatabaseQuery):
     def filter_by_year_month(
         self, year: int, month: int | None = None
     ) -> "TrainingQuery":
-        condition = criteria(
-            "{} = {}", func("YEAR", TrainingsTable.column("start_date")), literal(year)
-        )
-        if month is not None:
-            condition = condition.and_(
-                criteria(
-                    "{} = {}",
-                    func("MONTH", TrainingsTable.column("start_date")),
-                    literal(month),
-                )
+        self._query.and_where(
+            create_date_range_condition(
+                TrainingsTable.column("start_date"), year, month
             )
-        self._query.and_where(group(condition))
+        )
         return self
 
     def filter_by_dates(self, start: Timestamp, end: Timestamp) -> "TrainingQuery":
@@ -164,5 +163,22 @@ class TrainingDbQuery(TrainingQuery, DatabaseQuery):
 
     def order_by_date(self) -> "TrainingQuery":
         self._query.order_by(TrainingsTable.column("start_date"), "ASC")
+        # The id makes the order unique, which is required for keyset pagination.
+        self._query.order_by(TrainingsTable.column("id"), "ASC")
         self._main_query.order_by(TrainingsTable.column("start_date"), "ASC")
         return self
+
+    def filter_after(self, cursor: Cursor) -> "TrainingQuery":
+        start_date, id_ = cursor.unpack(datetime, int)
+        self._query.and_where(
+            group(
+                create_keyset_condition(
+                    [
+                        (TrainingsTable.column("start_date"), "ASC"),
+                        (TrainingsTable.column("id"), "ASC"),
+                    ],
+                    [str(start_date), id_],
+                )
+            )
+        )
+        return self
@@ -4,12 +4,20 @@ from typing import AsyncIterator
 
 from sql_smith.functions import alias, express, field
 
+from kwai.core.db.collection_versions import CollectionVersions
 from kwai.core.db.database import Database, Record
 from kwai.core.db.rows import OwnersTable
 from kwai.core.domain.entity import Entity
+from kwai.core.domain.value_objects.text import Locale
 from kwai.modules.training.teams.team import TeamEntity
 from kwai.modules.training.teams.team_tables import TeamsTable
 from kwai.modules.training.trainings.training import TrainingEntity, TrainingIdentifier
+from kwai.modules.training.trainings.training_calendar_db_query import (
+    TrainingCalendarDbQuery,
+)
+from kwai.modules.training.trainings.training_calendar_query import (
+    TrainingCalendarQuery,
+)
 from kwai.modules.training.trainings.training_coach_db_query import TrainingCoachDbQuery
 from kwai.modules.training.trainings.training_db_query import TrainingDbQuery
 from kwai.modules.training.trainings.training_definition import TrainingDefinitionEntity
@@ -64,6 +72,9 @@ class TrainingDbRepository(TrainingRepository):
     def create_query(self) -> TrainingQuery:
         return TrainingDbQuery(self._database)
 
+    def create_calendar_query(self, locale: Locale) -> TrainingCalendarQuery:
+        return TrainingCalendarDbQuery(self._database, locale)
+
     async def get_by_id(self, id: TrainingIdentifier) -> TrainingEntity:
         query = self.create_query()
         query.filter_by_id(id)
@@ -153,10 +164,58 @@ class TrainingDbRepository(TrainingRepository):
         await self._insert_coaches(result)
         await self._insert_teams(result)
 
+        await CollectionVersions(self._database).increment(TrainingsTable.table_name)
         await self._database.commit()
 
         return result
 
+    async def create_many(self, *trainings: TrainingEntity) -> list[TrainingEntity]:
+        if not trainings:
+            return []
+
+        # A multi-row insert only returns the id of the first row, and the ids of
+        # the other rows are not always consecutive. Each training is inserted on
+        # its own to know its id, the related rows are inserted at once.
+        result = [
+            Entity.replace(
+                training,
+                id_=TrainingIdentifier(
+                    await self._database.insert(
+                        TrainingsTable.table_name, TrainingRow.persist(training)
+                    )
+                ),
+            )
+            for training in trainings
+        ]
+
+        content_rows = [
+            TrainingTextRow.persist(training, content)
+            for training in result
+            for content in training.texts
+        ]
+        if content_rows:
+            await self._database.insert(TrainingContentsTable.table_name, *content_rows)
+
+        coach_rows = [
+            TrainingCoachRow.persist(training, training_coach)
+            for training in result
+            for training_coach in training.coaches
+        ]
+        if coach_rows:
+            await self._database.insert(TrainingCoachRow.__table_name__, *coach_rows)
+
+        team_rows = [
+            TrainingTeamRow.persist(training, team)
+            for training in result
+            for team in training.teams
+        ]
+        if team_rows:
+            await self._database.insert(TrainingTeamsTable.table_name, *team_rows)
+
+        await CollectionVersions(self._database).increment(TrainingsTable.table_name)
+
+        return result
+
     async def update(self, training: TrainingEntity) -> None:
         # Update the training
         await self._database.update(
@@ -180,6 +239,7 @@ class TrainingDbRepository(TrainingRepository):
         await self._delete_teams(training)
         await self._insert_teams(training)
 
+        await CollectionVersions(self._database).increment(TrainingsTable.table_name)
         await self._database.commit()
 
     async def _insert_coaches(self, training: TrainingEntity):
@@ -237,6 +297,7 @@ class TrainingDbRepository(TrainingRepository):
         (await self._delete_coaches(training),)
         (await self._delete_teams(training),)
 
+        await CollectionVersions(self._database).increment(TrainingsTable.table_name)
         await self._database.commit()
 
     async def reset_definition(
@@ -271,6 +332,9 @@ class TrainingDbRepository(TrainingRepository):
                 )
             )
             await self._database.execute(delete_contents)
+            await CollectionVersions(self._database).increment(
+                TrainingsTable.table_name
+            )
             await self._database.commit()
         else:
             # Because it is not allowed to update the table that is used
@@ -286,4 +350,7 @@ class TrainingDbRepository(TrainingRepository):
                 .where(TrainingsTable.field("id").in_(copy_trainings_query))
             )
             await self._database.execute(update_trainings)
+            await CollectionVersions(self._database).increment(
+                TrainingsTable.table_name
+            )
             await self._database.commit()
@@ -2,6 +2,7 @@
 
 from typing import Any, AsyncIterator
 
+from kwai.core.db.collection_versions import CollectionVersions
 from kwai.core.db.database import Database
 from kwai.core.db.rows import OwnersTable
 from kwai.core.domain.entity import Entity
@@ -81,6 +82,9 @@ class TrainingDefinitionDbRepository(TrainingDefinitionRepository):
             TrainingDefinitionsTable.table_name,
             TrainingDefinitionRow.persist(training_definition),
         )
+        await CollectionVersions(self._database).increment(
+            TrainingDefinitionsTable.table_name
+        )
         await self._database.commit()
         return Entity.replace(
             training_definition, id_=TrainingDefinitionIdentifier(new_id)
@@ -92,10 +96,16 @@ class TrainingDefinitionDbRepository(TrainingDefinitionRepository):
             TrainingDefinitionsTable.table_name,
             TrainingDefinitionRow.persist(training_definition),
         )
+        await CollectionVersions(self._database).increment(
+            TrainingDefinitionsTable.table_name
+        )
         await self._database.commit()
 
     async def delete(self, training_definition: TrainingDefinitionEntity):
         await self._database.delete(
             training_definition.id.value, TrainingDefinitionsTable.table_name
         )
+        await CollectionVersions(self._database).increment(
+            TrainingDefinitionsTable.table_name
+        )
         await self._database.commit()
@@ -2,11 +2,15 @@
 
 from abc import ABC, abstractmethod
 
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.domain.repository.query import Query
 from kwai.core.domain.value_objects.timestamp import Timestamp
 from kwai.modules.training.coaches.coach import CoachEntity
 from kwai.modules.training.teams.team import TeamEntity
-from kwai.modules.training.trainings.training import TrainingIdentifier
+from kwai.modules.training.trainings.training import (
+    TrainingEntity,
+    TrainingIdentifier,
+)
 from kwai.modules.training.trainings.training_definition import TrainingDefinitionEntity
 
 
@@ -82,3 +86,21 @@ class TrainingQuery(Query, ABC):
     def order_by_date(self) -> "TrainingQuery":
         """Order the trainings by date."""
         raise NotImplementedError
+
+    @abstractmethod
+    def filter_after(self, cursor: Cursor) -> "TrainingQuery":
+        """Add filter to get only the trainings after the cursor.
+
+        The cursor contains the start date and the id of a training (see
+        [create_cursor][kwai.modules.training.trainings.training_query.TrainingQuery.create_cursor]).
+        Use this filter in combination with order_by_date.
+
+        Raises:
+            InvalidCursorException: when the cursor is not a cursor for trainings.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def create_cursor(training: TrainingEntity) -> Cursor:
+        """Create a cursor for the trainings after the given training."""
+        return Cursor.create(str(training.period.start_date), training.id.value)
@@ -3,7 +3,11 @@
 from abc import ABC, abstractmethod
 from typing import AsyncIterator
 
+from kwai.core.domain.value_objects.text import Locale
 from kwai.modules.training.trainings.training import TrainingEntity, TrainingIdentifier
+from kwai.modules.training.trainings.training_calendar_query import (
+    TrainingCalendarQuery,
+)
 from kwai.modules.training.trainings.training_definition import TrainingDefinitionEntity
 from kwai.modules.training.trainings.training_query import TrainingQuery
 
@@ -20,6 +24,15 @@ class TrainingRepository(ABC):
         """Create a query for querying trainings."""
         raise NotImplementedError
 
+    @abstractmethod
+    def create_calendar_query(self, locale: Locale) -> TrainingCalendarQuery:
+        """Create a query for the calendar of trainings.
+
+        Args:
+            locale: The locale of the titles of the trainings.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_all(
         self,
@@ -63,6 +76,21 @@ class TrainingRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, *trainings: TrainingEntity) -> list[TrainingEntity]:
+        """Save multiple trainings at once.
+
+        The trainings are not committed, the caller is responsible for the
+        transaction.
+
+        Args:
+            trainings: The trainings to save.
+
+        Returns:
+            The training entities with an identifier.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, training: TrainingEntity) -> None:
         """Update a training.
@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from datetime import datetime, time
 
+from kwai.core.converter import MarkdownConverter
 from kwai.core.db.rows import TextRow
 from kwai.core.db.table import Table
 from kwai.core.db.table_row import TableRow
@@ -54,6 +55,10 @@ class TrainingTextRow(TextRow):
             user_id=content.author.id.value,
             created_at=content.traceable_time.created_at.timestamp,
             updated_at=content.traceable_time.updated_at.timestamp,
+            html_summary=MarkdownConverter().convert(content.summary),
+            html_content=MarkdownConverter().convert(content.content)
+            if content.content
+            else None,
         )
 
 
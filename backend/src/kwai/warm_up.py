@@ -0,0 +1,151 @@
+"""Module that implements the warm-up of a worker.
+
+Without a warm-up, the first requests after a start pay for work that is done
+lazily: generating the OpenAPI schema of the API, connecting to the database and
+Redis, loading the manifests and compiling the templates. The warm-up does this
+work before the worker reports that it is ready.
+
+A worker is only ready when the database can be reached. When the database is not
+available, the warm-up keeps trying to connect.
+"""
+
+import asyncio
+import time
+
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI
+from loguru import logger
+from starlette.types import ASGIApp, Message
+
+from kwai.core.db.database import Database
+from kwai.core.settings import Settings
+
+
+async def check_database(settings: Settings) -> None:
+    """Connect to the database to check that it can be reached."""
+    database = Database(settings.db)
+    try:
+        await database.check_connection()
+    finally:
+        await database.close()
+
+
+async def wait_for_database(settings: Settings) -> None:
+    """Wait until the database can be reached.
+
+    The connection is retried every retry_interval seconds of the warm-up
+    settings.
+    """
+    while True:
+        try:
+            await check_database(settings)
+            return
+        except Exception as ex:
+            logger.warning(
+                f"Warm-up: Connect to the database failed: {ex}, retrying in "
+                f"{settings.warm_up.retry_interval} seconds"
+            )
+        await asyncio.sleep(settings.warm_up.retry_interval)
+
+
+async def ping_redis(app: FastAPI) -> None:
+    """Ping Redis with the shared client of the application.
+
+    This opens the first connection of the connection pool.
+    """
+    redis = getattr(app.state, "redis", None)
+    if redis is not None:
+        await redis.ping()
+
+
+async def send_request(app: ASGIApp, path: str) -> int:
+    """Send a GET request to the application and return the status code.
+
+    The request is sent without a server, so it doesn't need a network
+    connection. The body of the response is discarded.
+    """
+    path, _, query_string = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("localhost", 80),
+        "client": ("127.0.0.1", 0),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "headers": [(b"host", b"localhost"), (b"user-agent", b"kwai-warm-up")],
+    }
+    status_code = 500
+    request_sent = False
+    response_sent = asyncio.Event()
+
+    async def receive() -> Message:
+        # A streaming response listens for a disconnect while it sends the body,
+        # so after the request the client only disconnects when the response
+        # is complete.
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_sent.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body" and not message.get(
+            "more_body", False
+        ):
+            response_sent.set()
+
+    await app(scope, receive, send)
+    return status_code
+
+
+async def warm_up(app: FastAPI, api_app: FastAPI, settings: Settings) -> None:
+    """Warm up the worker.
+
+    The warm-up waits until the database can be reached. Other failing steps are
+    logged, but don't stop the warm-up.
+
+    Args:
+        app: The application that is served.
+        api_app: The API application.
+        settings: The settings of the application.
+    """
+    start = time.perf_counter()
+
+    steps: list[tuple[str, Callable[[], Awaitable[None]]]] = [
+        ("Build the OpenAPI schema", lambda: _build_openapi(api_app)),
+        ("Connect to Redis", lambda: ping_redis(api_app)),
+    ]
+    for name, step in steps:
+        try:
+            await step()
+        except Exception as ex:
+            logger.warning(f"Warm-up: {name} failed: {ex}")
+
+    await wait_for_database(settings)
+
+    for path in settings.warm_up.requests:
+        try:
+            status_code = await send_request(app, path)
+        except Exception as ex:
+            logger.warning(f"Warm-up: GET {path} failed: {ex}")
+        else:
+            if status_code >= 400:
+                logger.warning(f"Warm-up: GET {path} returned {status_code}")
+
+    duration = (time.perf_counter() - start) * 1000
+    logger.info(f"Warm-up finished in {duration:.2f}ms")
+
+
+async def _build_openapi(api_app: FastAPI) -> None:
+    """Generate the OpenAPI schema, FastAPI keeps it for the next requests."""
+    api_app.openapi()
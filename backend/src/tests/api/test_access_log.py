@@ -0,0 +1,72 @@
+"""Module for testing the access log middleware."""
+
+import pytest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from kwai.api.access_log import AccessLogMiddleware, RequestIdGenerator
+
+
+@pytest.fixture
+def records() -> list[dict]:
+    """Capture the log records."""
+    records = []
+    handler_id = logger.add(lambda message: records.append(message.record))
+    yield records
+    logger.remove(handler_id)
+
+
+def create_client(sample_rate: float = 1.0) -> TestClient:
+    """Create a client for an app with the access log middleware."""
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate)
+
+    @app.get("/dojos")
+    def get_dojos():
+        logger.info("Get dojos")
+        return []
+
+    @app.get("/error")
+    def get_error():
+        raise ValueError("Something went wrong")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_request_id_generator():
+    """Test that the generated ids are unique."""
+    generate = RequestIdGenerator()
+    assert len({generate() for _ in range(1000)}) == 1000
+
+
+def test_access_log(records: list[dict]):
+    """Test that a request is logged with one structured record."""
+    response = create_client().get("/dojos")
+    assert response.status_code == 200
+
+    request_id = response.headers["X-Request-ID"]
+    assert [record["extra"]["request_id"] for record in records] == [request_id] * 2
+
+    access_record = records[-1]
+    assert access_record["extra"]["method"] == "GET"
+    assert access_record["extra"]["path"] == "/dojos"
+    assert access_record["extra"]["status"] == 200
+    assert access_record["extra"]["duration"] >= 0
+
+
+def test_exception(records: list[dict]):
+    """Test that an exception results in a 500 response and is logged."""
+    response = create_client(sample_rate=0.0).get("/error")
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Something went wrong"}
+    assert "X-Request-ID" in response.headers
+    assert records[0]["exception"] is not None
+    assert records[-1]["extra"]["status"] == 500
+
+
+def test_sampling(records: list[dict]):
+    """Test that successful requests are not logged with a sample rate of 0."""
+    create_client(sample_rate=0.0).get("/dojos")
+    assert [record["message"] for record in records] == ["Get dojos"]
@@ -0,0 +1,92 @@
+"""Module for testing the compression of responses."""
+
+import gzip
+
+import pytest
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from fastapi.testclient import TestClient
+
+from kwai.api.compression import CompressionMiddleware, accepted_encodings
+
+
+CONTENT = "kwai " * 1000
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Return a client for an app with compression."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large", response_class=PlainTextResponse)
+    def get_large():
+        return CONTENT
+
+    @app.get("/small", response_class=PlainTextResponse)
+    def get_small():
+        return "kwai"
+
+    @app.get("/compressed")
+    def get_compressed():
+        return Response(
+            gzip.compress(CONTENT.encode()),
+            media_type="text/plain",
+            headers={"content-encoding": "gzip"},
+        )
+
+    return TestClient(app)
+
+
+def test_gzip(client: TestClient):
+    """Test that a large response is compressed with gzip."""
+    response = client.get("/large", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(CONTENT)
+    assert response.text == CONTENT
+
+
+def test_small_response(client: TestClient):
+    """Test that a small response is not compressed."""
+    response = client.get("/small", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "kwai"
+
+
+def test_identity(client: TestClient):
+    """Test that a response is not compressed when no encoding is accepted."""
+    response = client.get("/large", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.text == CONTENT
+
+
+def test_already_compressed(client: TestClient):
+    """Test that a response with a content encoding is not compressed again."""
+    response = client.get("/compressed", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == CONTENT
+
+
+def test_brotli(client: TestClient):
+    """Test that brotli is used when it is preferred."""
+    pytest.importorskip("brotli")
+    response = client.get("/large", headers={"accept-encoding": "gzip;q=0.8, br"})
+    assert response.headers["content-encoding"] == "br"
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        (None, []),
+        ("gzip", ["gzip"]),
+        ("gzip, deflate, br", ["gzip", "deflate", "br"]),
+        ("gzip;q=0.5, br;q=1.0", ["br", "gzip"]),
+        ("gzip;q=0, *", []),
+        ("GZIP; q=0.8", ["gzip"]),
+    ],
+)
+def test_accepted_encodings(accept_encoding: str | None, expected: list[str]):
+    """Test parsing the Accept-Encoding header."""
+    assert accepted_encodings(accept_encoding) == expected
@@ -0,0 +1,142 @@
+"""Module for testing the HTTP cache of the API."""
+
+from datetime import datetime, timezone
+from typing import Iterator
+
+import pytest
+
+from fastapi import APIRouter, Depends, FastAPI, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from kwai.api import http_cache
+from kwai.api.dependencies import create_database, get_response_cache
+from kwai.api.http_cache import ConditionalGet
+from kwai.api.response_cache import MemoryResponseCache
+from kwai.api.responses import JsonApiRoute
+from kwai.core.db.collection_versions import (
+    CollectionVersion,
+    CollectionVersions,
+    collection_version_cache,
+)
+from kwai.core.domain.value_objects.timestamp import Timestamp
+
+
+class DojoDocument(BaseModel):
+    """A document for a dojo."""
+
+    name: str
+
+
+@pytest.fixture
+def versions(monkeypatch) -> Iterator[dict[str, int]]:
+    """Replace the versions of the collections."""
+    versions = {"dojos": 1}
+
+    async def get(self, *names: str) -> list[CollectionVersion]:
+        return [
+            CollectionVersion(
+                name=name,
+                version=versions.get(name, 0),
+                updated_at=Timestamp.create_utc(datetime(2024, 1, 1, 10, 0, 0)),
+            )
+            for name in names
+        ]
+
+    monkeypatch.setattr(CollectionVersions, "get", get)
+    collection_version_cache.clear()
+    yield versions
+    collection_version_cache.clear()
+
+
+@pytest.fixture
+def client(versions) -> TestClient:
+    """Return a client for an app with a cached endpoint."""
+    router = APIRouter(route_class=JsonApiRoute)
+
+    @router.get("/dojos", dependencies=[Depends(ConditionalGet("dojos", max_age=60))])
+    async def get_dojos() -> DojoDocument:
+        return DojoDocument(name="Kodokan")
+
+    @router.get(
+        "/events", dependencies=[Depends(ConditionalGet("dojos", time_bucket=60))]
+    )
+    async def get_events() -> DojoDocument:
+        return DojoDocument(name="Kodokan")
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[create_database] = lambda: None
+    app.dependency_overrides[get_response_cache] = MemoryResponseCache
+    return TestClient(app)
+
+
+def test_cache_headers(client: TestClient):
+    """Test that the cache headers are added."""
+    response = client.get("/dojos")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["last-modified"] == "Mon, 01 Jan 2024 10:00:00 GMT"
+    assert response.headers["cache-control"] == "public, max-age=60, must-revalidate"
+
+
+def test_not_modified(client: TestClient):
+    """Test that 304 is returned when the ETag matches."""
+    etag = client.get("/dojos").headers["etag"]
+    response = client.get("/dojos", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_modified(client: TestClient, versions: dict[str, int]):
+    """Test that the ETag changes when the version of the collection changes."""
+    etag = client.get("/dojos").headers["etag"]
+    versions["dojos"] += 1
+    collection_version_cache.invalidate("dojos")
+    response = client.get("/dojos", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+def test_time_bucket(client: TestClient, monkeypatch):
+    """Test that the ETag changes when the time bucket changes."""
+    now = datetime(2024, 1, 2, 10, 0, 30, tzinfo=timezone.utc).timestamp()
+    monkeypatch.setattr(http_cache.time, "time", lambda: now)
+    response = client.get("/events")
+    etag = response.headers["etag"]
+    assert response.headers["last-modified"] == "Tue, 02 Jan 2024 10:00:00 GMT", (
+        "The start of the time bucket is newer than the version"
+    )
+
+    now += 20
+    response = client.get("/events", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    now += 60
+    response = client.get("/events", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+def test_private(client: TestClient):
+    """Test that a response for a logged-in user is private."""
+    client.cookies.set("access_token", "token")
+    response = client.get("/dojos")
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+@pytest.mark.parametrize(
+    "if_none_match,expected",
+    [
+        (None, False),
+        ("*", True),
+        ('W/"1"', True),
+        ('"1"', True),
+        ('"2", W/"1"', True),
+        ('"2"', False),
+    ],
+)
+def test_matches(if_none_match: str | None, expected: bool):
+    """Test the weak comparison of ETags."""
+    assert ConditionalGet.matches(if_none_match, 'W/"1"') is expected
@@ -0,0 +1,15 @@
+"""Module for testing the metrics endpoint."""
+
+import pytest
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+
+pytestmark = pytest.mark.api
+
+
+def test_get_metrics_not_logged_in(client: TestClient):
+    """Test that the metrics are not available for an anonymous user."""
+    response = client.get("/api/metrics")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
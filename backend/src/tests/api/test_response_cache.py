@@ -0,0 +1,244 @@
+"""Module for testing the server-side response cache."""
+
+import asyncio
+
+from datetime import datetime
+from typing import Iterator
+
+import pytest
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from kwai.api.dependencies import create_database, get_response_cache
+from kwai.api.http_cache import ConditionalGet
+from kwai.api.response_cache import MemoryResponseCache, RedisResponseCache
+from kwai.api.responses import JsonApiRoute
+from kwai.core.db.collection_versions import (
+    CollectionVersion,
+    CollectionVersions,
+    collection_version_cache,
+)
+from kwai.core.domain.value_objects.timestamp import Timestamp
+
+
+class DojoDocument(BaseModel):
+    """A document for a dojo."""
+
+    name: str
+    visits: int
+
+
+async def test_memory_cache():
+    """Test storing and getting a response."""
+    cache = MemoryResponseCache()
+    assert await cache.get("dojos") is None
+    await cache.set("dojos", b"[]")
+    assert await cache.get("dojos") == b"[]"
+
+
+async def test_memory_cache_max_entries():
+    """Test that the least recently used response is removed."""
+    cache = MemoryResponseCache(max_entries=2)
+    await cache.set("1", b"1")
+    await cache.set("2", b"2")
+    await cache.get("1")
+    await cache.set("3", b"3")
+    assert len(cache) == 2
+    assert await cache.get("2") is None
+    assert await cache.get("1") == b"1"
+
+
+async def test_memory_cache_expired():
+    """Test that an expired response is not returned."""
+    cache = MemoryResponseCache(ttl=-1)
+    await cache.set("dojos", b"[]")
+    assert await cache.get("dojos") is None
+    assert len(cache) == 0
+
+
+async def test_single_flight():
+    """Test that concurrent requests for the same key create the content once."""
+    cache = MemoryResponseCache()
+    calls = 0
+
+    async def create() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"[]"
+
+    results = await asyncio.gather(
+        *[cache.get_or_create("dojos", create) for _ in range(10)]
+    )
+    assert results == [b"[]"] * 10
+    assert calls == 1
+
+
+async def test_single_flight_exception():
+    """Test that all waiting coroutines receive the exception."""
+    cache = MemoryResponseCache()
+
+    async def create() -> bytes:
+        await asyncio.sleep(0.01)
+        raise ValueError("Failed")
+
+    results = await asyncio.gather(
+        *[cache.get_or_create("dojos", create) for _ in range(3)],
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert await cache.get("dojos") is None
+
+
+async def test_single_flight_cancelled():
+    """Test that a waiting coroutine takes over when the creator is cancelled."""
+    cache = MemoryResponseCache()
+
+    async def create() -> bytes:
+        await asyncio.sleep(0.01)
+        return b"[]"
+
+    creator = asyncio.create_task(cache.get_or_create("dojos", create))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_create("dojos", create))
+    await asyncio.sleep(0)
+    creator.cancel()
+
+    assert await waiter == b"[]"
+    assert creator.cancelled()
+
+
+class FailingRedis:
+    """A Redis client that can't reach the server."""
+
+    async def get(self, key: str) -> bytes | None:
+        raise RedisConnectionError("Redis is not available")
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        raise RedisConnectionError("Redis is not available")
+
+
+async def test_redis_cache_unavailable():
+    """Test that the content is still created when Redis fails."""
+    cache = RedisResponseCache(FailingRedis())  # type: ignore[arg-type]
+
+    async def create() -> bytes:
+        return b"[]"
+
+    assert await cache.get("dojos") is None
+    assert await cache.get_or_create("dojos", create) == b"[]"
+
+
+@pytest.fixture
+def versions(monkeypatch) -> Iterator[dict[str, int]]:
+    """Replace the versions of the collections."""
+    versions = {"dojos": 1}
+
+    async def get(self, *names: str) -> list[CollectionVersion]:
+        return [
+            CollectionVersion(
+                name=name,
+                version=versions.get(name, 0),
+                updated_at=Timestamp.create_utc(datetime(2024, 1, 1, 10, 0, 0)),
+            )
+            for name in names
+        ]
+
+    monkeypatch.setattr(CollectionVersions, "get", get)
+    collection_version_cache.clear()
+    yield versions
+    collection_version_cache.clear()
+
+
+@pytest.fixture
+def client(versions) -> TestClient:
+    """Return a client for an app with cached endpoints."""
+    router = APIRouter(route_class=JsonApiRoute)
+    visits = {"count": 0}
+
+    @router.get("/dojos", dependencies=[Depends(ConditionalGet("dojos", cache=True))])
+    async def get_dojos() -> DojoDocument:
+        visits["count"] += 1
+        return DojoDocument(name="Kodokan", visits=visits["count"])
+
+    @router.get(
+        "/dojos/{name}", dependencies=[Depends(ConditionalGet("dojos", cache=True))]
+    )
+    async def get_dojo(name: str) -> DojoDocument:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    @router.get(
+        "/kodokan",
+        response_model=DojoDocument,
+        dependencies=[Depends(ConditionalGet("dojos", cache=True))],
+    )
+    async def get_kodokan():
+        visits["count"] += 1
+        return {"name": "Kodokan", "visits": visits["count"]}
+
+    cache = MemoryResponseCache()
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[create_database] = lambda: None
+    app.dependency_overrides[get_response_cache] = lambda: cache
+    return TestClient(app)
+
+
+def test_cached_response(client: TestClient):
+    """Test that the response is created once."""
+    first = client.get("/dojos")
+    second = client.get("/dojos")
+    assert second.status_code == status.HTTP_200_OK
+    assert second.json() == first.json() == {"name": "Kodokan", "visits": 1}
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["content-type"] == "application/json"
+
+
+def test_cached_without_database(client: TestClient, monkeypatch):
+    """Test that a cached response is returned without querying the versions."""
+    client.get("/dojos")
+
+    async def get(self, *names: str) -> list[CollectionVersion]:
+        raise AssertionError("The versions should be kept in memory")
+
+    monkeypatch.setattr(CollectionVersions, "get", get)
+    assert client.get("/dojos").json()["visits"] == 1
+
+
+def test_query_is_part_of_the_key(client: TestClient):
+    """Test that another query string creates another response."""
+    client.get("/dojos")
+    assert client.get("/dojos?page[limit]=10").json()["visits"] == 2
+
+
+def test_invalidated_by_version(client: TestClient, versions: dict[str, int]):
+    """Test that a new version of the collection creates a new response."""
+    client.get("/dojos")
+    versions["dojos"] += 1
+    collection_version_cache.invalidate("dojos")
+    assert client.get("/dojos").json()["visits"] == 2
+
+
+def test_not_cached_for_user(client: TestClient):
+    """Test that the response for a logged-in user is not cached."""
+    client.get("/dojos")
+    client.cookies.set("access_token", "token")
+    assert client.get("/dojos").json()["visits"] == 2
+    assert client.get("/dojos").json()["visits"] == 3
+
+
+def test_exception_not_cached(client: TestClient):
+    """Test that an exception of the endpoint is not cached."""
+    assert client.get("/dojos/kodokan").status_code == status.HTTP_404_NOT_FOUND
+    assert client.get("/dojos/kodokan").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_other_result_not_cached(client: TestClient):
+    """Test that a result that isn't the response model is returned uncached."""
+    assert client.get("/kodokan").json() == {"name": "Kodokan", "visits": 1}
+    assert client.get("/kodokan").json() == {"name": "Kodokan", "visits": 2}
+    client.cookies.set("access_token", "token")
+    assert client.get("/kodokan").json() == {"name": "Kodokan", "visits": 3}
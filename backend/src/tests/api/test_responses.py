@@ -0,0 +1,154 @@
+"""Module for testing the JSON:API route and response."""
+
+from datetime import datetime
+
+import pytest
+
+from fastapi import APIRouter, FastAPI, Response, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
+
+from kwai.api.responses import (
+    JsonApiResponse,
+    JsonApiRoute,
+    JsonApiStreamingResponse,
+)
+from kwai.core.json_api import Document, DocumentStream, Meta
+
+
+class DojoAttributes(BaseModel):
+    """Attributes of a dojo."""
+
+    name: str
+    opened_at: datetime
+    remark: str | None = None
+
+
+class DojoDocument(BaseModel):
+    """A document for a dojo."""
+
+    id: str
+    type_: str = Field(default="dojos", alias="type")
+    attributes: DojoAttributes
+
+
+def _create_document() -> DojoDocument:
+    return DojoDocument(
+        id="1",
+        attributes=DojoAttributes(name="Kodokan", opened_at=datetime(1882, 2, 5)),
+    )
+
+
+def _create_client(route_class: type) -> TestClient:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/dojo")
+    async def get_dojo() -> DojoDocument:
+        return _create_document()
+
+    @router.post("/dojo", status_code=status.HTTP_201_CREATED)
+    async def create_dojo() -> DojoDocument:
+        return _create_document()
+
+    @router.get("/dojo_with_header")
+    async def get_dojo_with_header(response: Response) -> DojoDocument:
+        response.headers["X-Dojo"] = "Kodokan"
+        return _create_document()
+
+    @router.get("/unvalidated_dojo")
+    async def get_unvalidated_dojo() -> DojoDocument:
+        return DojoDocument.model_construct(
+            id=1, attributes=DojoAttributes(name="Kodokan", opened_at=datetime.now())
+        )
+
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """Return a client for an app that uses the JSON:API route."""
+    return _create_client(JsonApiRoute)
+
+
+@pytest.fixture(scope="module")
+def default_client() -> TestClient:
+    """Return a client for an app that uses the default FastAPI route."""
+    return _create_client(APIRouter().route_class)
+
+
+def test_response_is_the_same(client: TestClient, default_client: TestClient):
+    """Test that the response is the same as the response of FastAPI."""
+    response = client.get("/dojo")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == default_client.get("/dojo").content
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_response_is_not_validated(client: TestClient):
+    """Test that the returned document is not validated again."""
+    response = client.get("/unvalidated_dojo")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == 1
+
+
+def test_status_code(client: TestClient):
+    """Test that the status code of the route is used."""
+    response = client.post("/dojo")
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+def test_response_parameter(client: TestClient):
+    """Test that headers set on a response parameter are still returned."""
+    response = client.get("/dojo_with_header")
+    assert response.headers["X-Dojo"] == "Kodokan"
+
+
+def test_openapi_is_the_same(client: TestClient, default_client: TestClient):
+    """Test that the OpenAPI schema is not changed."""
+    assert (
+        client.get("/openapi.json").json() == default_client.get("/openapi.json").json()
+    )
+
+
+def test_render_other_content():
+    """Test that other content is rendered as JSON."""
+    assert JsonApiResponse({"name": "Kodokan"}).body == b'{"name":"Kodokan"}'
+
+
+def test_streaming_response():
+    """Test a streaming response."""
+    closed = []
+
+    async def create_dojos():
+        for _ in range(3):
+            yield _create_document()
+
+    async def close():
+        closed.append(True)
+
+    router = APIRouter(route_class=JsonApiRoute)
+
+    @router.get("/dojos", response_model=DojoDocument)
+    async def get_dojos() -> JsonApiStreamingResponse:
+        return JsonApiStreamingResponse(
+            DocumentStream(
+                create_dojos(),
+                lambda dojo: Document[DojoDocument, None](data=dojo),
+                meta=Meta(count=3),
+            ),
+            background=BackgroundTask(close),
+        )
+
+    app = FastAPI()
+    app.include_router(router)
+    response = TestClient(app).get("/dojos")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    json_doc = response.json()
+    assert len(json_doc["data"]) == 3
+    assert json_doc["meta"]["count"] == 3
+    assert closed == [True], "The background task should be executed"
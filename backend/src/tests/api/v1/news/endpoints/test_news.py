@@ -5,6 +5,7 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.modules.portal.applications.application import ApplicationEntity
 from kwai.modules.portal.news.news_item import NewsItemEntity
 
@@ -23,6 +24,16 @@ def test_get_news_items(client: TestClient):
     assert "data" in json, "There should be a data list in the response"
 
 
+def test_get_promoted_news_items_after(client: TestClient):
+    """Test that page[after] can't be used for promoted news items."""
+    response = client.get(
+        "/api/v1/news_items",
+        params={"filter[promoted]": "true", "page[after]": Cursor.create(1).encode()},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "filter[promoted]" in response.json()["detail"]
+
+
 def test_get_news_item(client: TestClient, news_item_entity: NewsItemEntity):
     """Test /api/v1/news_items/{id}."""
     response = client.get(f"/api/v1/news_items/{news_item_entity.id}")
@@ -128,3 +128,32 @@ def test_get_trainings(
     json = response.json()
     assert "meta" in json, "There should be a meta object in the response"
     assert "data" in json, "There should be a data list in the response"
+
+
+def test_generate_trainings(
+    secure_client: TestClient, training_definition_entity: TrainingDefinitionEntity
+):
+    """Test generating the trainings of a training definition."""
+    payload = {
+        "data": {
+            "type": "training_generations",
+            "attributes": {
+                "start_date": "2031-09-01",
+                "end_date": "2031-09-30",
+                "skip_dates": ["2031-09-15"],
+            },
+        }
+    }
+    response = secure_client.post(
+        f"/api/v1/training_definitions/{training_definition_entity.id}/trainings",
+        json=payload,
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response.json()
+
+    json = response.json()
+    try:
+        assert json["meta"]["count"] == 4, "There should be 4 mondays without a holiday"
+    finally:
+        for training in json["data"]:
+            response = secure_client.delete(f"/api/v1/trainings/{training['id']}")
+            assert response.status_code == status.HTTP_200_OK
@@ -38,6 +38,27 @@ def test_get_trainings(client: TestClient, training_entity: TrainingEntity):
     )
 
 
+def test_get_training_calendar(client: TestClient, training_entity: TrainingEntity):
+    """Test get training calendar api."""
+    response = client.get(
+        "/api/v1/trainings/calendar", params={"filter[year]": 2023, "filter[month]": 1}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    json = response.json()
+    training_resource = _find(json["data"], str(training_entity.id))
+    assert training_resource is not None, (
+        f"Training with id {training_entity.id} should be in the calendar"
+    )
+    assert training_resource["attributes"]["title"] == "Test API Training"
+
+
+def test_get_training_calendar_without_period(client: TestClient):
+    """Test that the training calendar requires a period."""
+    response = client.get("/api/v1/trainings/calendar")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 def test_get_trainings_filter_year_month(
     client: TestClient, training_entity: TrainingEntity
 ):
@@ -0,0 +1 @@
+"""Package for testing the CLI."""
@@ -0,0 +1,73 @@
+"""Module for testing the cold start of the CLI and the event worker.
+
+The imports are measured with `python -X importtime` in a new process. The
+import of the module is done twice, so the time to compile the modules is not
+measured.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# The budgets in milliseconds. Override them with the environment variable
+# KWAI_IMPORT_BUDGET_FACTOR on a slow machine.
+CLI_BUDGET = 750
+EVENT_WORKER_BUDGET = 1000
+
+BUDGET_FACTOR = float(os.environ.get("KWAI_IMPORT_BUDGET_FACTOR", "1"))
+
+
+def _import(module: str) -> tuple[float, set[str]]:
+    """Import a module in a new process.
+
+    Returns:
+        The cumulative import time in milliseconds and the imported modules.
+    """
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    import_time = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):  # A top level import
+            try:
+                import_time += int(cumulative)
+            except ValueError:
+                continue
+    return import_time / 1000, set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["kwai.cli.__main__", "kwai.cli.commands.db"],
+)
+def test_cli_cold_start(module: str):
+    """Test that the CLI doesn't import the modules of the database, redis, ..."""
+    import_time, modules = _import(module)
+
+    for forbidden in ("fastapi", "redis", "asyncmy", "jinja2", "kwai.modules"):
+        assert forbidden not in modules, f"{module} should not import {forbidden}."
+    assert import_time < CLI_BUDGET * BUDGET_FACTOR, (
+        f"Importing {module} took {import_time:.0f}ms."
+    )
+
+
+def test_event_worker_cold_start():
+    """Test that the event worker doesn't import FastAPI."""
+    import_time, modules = _import("kwai.events.__main__")
+
+    assert "fastapi" not in modules, "The event worker should not import fastapi."
+    assert import_time < EVENT_WORKER_BUDGET * BUDGET_FACTOR, (
+        f"Importing the event worker took {import_time:.0f}ms."
+    )
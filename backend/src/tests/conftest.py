@@ -2,11 +2,12 @@
 
 import asyncio
 
-from typing import AsyncGenerator, AsyncIterator, Iterator
+from typing import Any, AsyncGenerator, AsyncIterator, Iterator
 
 import pytest
 
 from redis.asyncio import Redis
+from sql_smith.query import Query
 
 from kwai.core.db.database import Database
 from kwai.core.db.uow import UnitOfWork
@@ -48,6 +49,42 @@ async def database():
     await db.close()
 
 
+class _ExplainQuery:
+    """Wrap a select query to compile it as an EXPLAIN statement."""
+
+    def __init__(self, query):
+        self._query = query
+
+    def compile(self) -> Query:
+        compiled_query = self._query.compile()
+        return Query("EXPLAIN " + compiled_query.sql, compiled_query.params)
+
+
+class _ExplainDatabase:
+    """A database that returns the execution plan of a fetched query.
+
+    A database query that is created with this database returns the rows of the
+    EXPLAIN statement of the query that it executes. On a small test database the
+    optimizer can prefer a full scan, so tests should check possible_keys instead
+    of the chosen key.
+    """
+
+    def __init__(self, database: Database):
+        self._database = database
+
+    def fetch(self, query) -> AsyncIterator[dict[str, Any]]:
+        return self._database.fetch(_ExplainQuery(query))
+
+    def __getattr__(self, name: str):
+        return getattr(self._database, name)
+
+
+@pytest.fixture(scope="module")
+def explain_database(database: Database) -> Database:
+    """Fixture for a database that returns the execution plan of a query."""
+    return _ExplainDatabase(database)
+
+
 @pytest.fixture(scope="session")
 async def redis() -> AsyncGenerator[Redis, None]:
     """Fixture for a redis instance."""
@@ -0,0 +1,8 @@
+"""Module with fixtures for the database tests."""
+
+from tests.fixtures.club.coaches import *  # noqa
+from tests.fixtures.club.contacts import *  # noqa
+from tests.fixtures.club.countries import *  # noqa
+from tests.fixtures.club.members import *  # noqa
+from tests.fixtures.club.persons import *  # noqa
+from tests.fixtures.training.trainings import *  # noqa
@@ -0,0 +1,71 @@
+"""Module for testing the collection versions."""
+
+import pytest
+
+from kwai.core.db import collection_versions
+from kwai.core.db.collection_versions import (
+    CollectionVersion,
+    CollectionVersionCache,
+    CollectionVersions,
+    collection_version_cache,
+)
+from kwai.core.db.database import Database
+
+
+def test_cache_expires(monkeypatch):
+    """Test that a version is removed from the cache when it is expired."""
+    now = 100.0
+    monkeypatch.setattr(collection_versions.time, "monotonic", lambda: now)
+    cache = CollectionVersionCache(ttl=2)
+    cache.set(CollectionVersion(name="trainings", version=1))
+    assert cache.get("trainings").version == 1, "The version should be cached"
+
+    now += 3
+    assert cache.get("trainings") is None, "The version should be expired"
+
+
+def test_cache_invalidate():
+    """Test removing a version from the cache."""
+    cache = CollectionVersionCache()
+    cache.set(CollectionVersion(name="trainings", version=1))
+    cache.invalidate("trainings")
+    assert cache.get("trainings") is None, "The version should be removed"
+
+
+@pytest.mark.db
+async def test_increment(database: Database):
+    """Test incrementing the version of a collection."""
+    versions = CollectionVersions(database)
+    [old_version] = await versions.get("trainings")
+    await versions.increment("trainings")
+    await database.commit()
+
+    [new_version] = await versions.get("trainings")
+    assert new_version.version == old_version.version + 1, (
+        "The version should be incremented"
+    )
+    assert not new_version.updated_at.empty, "The version should have a timestamp"
+
+
+@pytest.mark.db
+async def test_get_cached(database: Database):
+    """Test that an increment removes the version from the cache."""
+    versions = CollectionVersions(database)
+    [old_version] = await versions.get_cached("trainings")
+    assert collection_version_cache.get("trainings") == old_version, (
+        "The version should be cached"
+    )
+
+    await versions.increment("trainings")
+    await database.commit()
+    [new_version] = await versions.get_cached("trainings")
+    assert new_version.version == old_version.version + 1, (
+        "The new version should be returned after an increment"
+    )
+
+
+@pytest.mark.db
+async def test_get_unknown(database: Database):
+    """Test getting the version of an unknown collection."""
+    [version] = await CollectionVersions(database).get("unknown_collection")
+    assert version.version == 0, "An unknown collection should have version 0"
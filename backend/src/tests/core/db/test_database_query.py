@@ -0,0 +1,81 @@
+"""Module for testing the functions of a database query."""
+
+import pytest
+
+from kwai.core.db.database import Database
+from kwai.core.db.database_query import (
+    SelectForUpdate,
+    create_date_range_condition,
+    create_keyset_condition,
+)
+
+
+def test_keyset_condition_one_column():
+    """Test the condition for a sort key with one column."""
+    query = (
+        Database.create_query_factory()
+        .select("id")
+        .from_("members")
+        .where(create_keyset_condition([("id", "ASC")], [10]))
+    ).compile()
+    assert query.sql == "SELECT `id` FROM `members` WHERE `id` > %s"
+    assert query.params == (10,)
+
+
+def test_keyset_condition_descending():
+    """Test the condition for a descending sort key with two columns."""
+    query = (
+        Database.create_query_factory()
+        .select("id")
+        .from_("news_stories")
+        .where(
+            create_keyset_condition(
+                [("publish_date", "DESC"), ("id", "DESC")],
+                ["2024-01-01 00:00:00", 10],
+            )
+        )
+    ).compile()
+    assert query.sql == (
+        "SELECT `id` FROM `news_stories` WHERE `publish_date` <= %s "
+        "AND (`publish_date` < %s OR (`publish_date` = %s AND (`id` < %s)))"
+    )
+    assert query.params == ("2024-01-01 00:00:00",) * 3 + (10,)
+
+
+@pytest.mark.parametrize(
+    "year,month,start,end",
+    [
+        (2024, None, "2024-01-01", "2025-01-01"),
+        (2024, 2, "2024-02-01", "2024-03-01"),
+        (2024, 12, "2024-12-01", "2025-01-01"),
+    ],
+)
+def test_date_range_condition(year: int, month: int | None, start: str, end: str):
+    """Test the half-open range for a year or a month."""
+    query = (
+        Database.create_query_factory()
+        .select("id")
+        .from_("trainings")
+        .where(create_date_range_condition("start_date", year, month))
+    ).compile()
+    assert query.sql == (
+        "SELECT `id` FROM `trainings` WHERE (`start_date` >= %s AND `start_date` < %s)"
+    )
+    assert query.params == (start, end)
+
+
+def test_date_range_condition_invalid_month():
+    """Test that an invalid month raises a ValueError."""
+    with pytest.raises(ValueError):
+        create_date_range_condition("start_date", 2024, 13)
+
+
+def test_select_for_update():
+    """Test that the rows of a select query are locked."""
+    query = SelectForUpdate(
+        Database.create_query_factory().select("id").from_("event_outbox").limit(10),
+        skip_locked=True,
+    ).compile()
+    assert query.sql == (
+        "SELECT `id` FROM `event_outbox` LIMIT 10 FOR UPDATE SKIP LOCKED"
+    )
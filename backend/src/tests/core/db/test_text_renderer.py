@@ -0,0 +1,50 @@
+"""Module for testing the text renderer."""
+
+import pytest
+
+from sql_smith.functions import field
+
+from kwai.core.db.collection_versions import CollectionVersions
+from kwai.core.db.database import Database
+from kwai.core.db.text_renderer import TextRenderer
+
+
+pytestmark = pytest.mark.db
+
+
+async def test_render(database: Database, make_training_in_db):
+    """Test rendering the HTML of texts without HTML."""
+    training = await make_training_in_db()
+    await database.execute(
+        Database.create_query_factory()
+        .update("training_contents")
+        .set({"html_summary": None, "html_content": None})
+        .where(field("training_id").eq(training.id.value))
+    )
+    await database.commit()
+
+    versions = CollectionVersions(database)
+    [old_version] = await versions.get("trainings")
+
+    renderer = TextRenderer(
+        database,
+        "training_contents",
+        "training_id",
+        collection="trainings",
+        batch_size=1,
+    )
+    count = sum([rendered async for rendered in renderer.render()])
+    assert count > 0, "At least one text should be rendered"
+
+    row = await database.fetch_one(
+        Database.create_query_factory()
+        .select("html_summary")
+        .from_("training_contents")
+        .where(field("training_id").eq(training.id.value))
+    )
+    assert row["html_summary"] == "<p>Test</p>", "The summary should be rendered"
+
+    [new_version] = await versions.get("trainings")
+    assert new_version.version > old_version.version, (
+        "The version of the collection should be incremented"
+    )
@@ -0,0 +1,42 @@
+"""Module for testing the cursor for keyset pagination."""
+
+from datetime import datetime
+
+import pytest
+
+from kwai.core.domain.repository.cursor import Cursor, InvalidCursorException
+
+
+def test_encode_decode():
+    """Test that a decoded token results in the same cursor."""
+    cursor = Cursor.create("2024-01-01 19:00:00", 1)
+    token = cursor.encode()
+    assert "=" not in token
+    assert Cursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["not a cursor", "e30", "WzEsbnVsbF0", "W3RydWVd"])
+def test_invalid_token(token: str):
+    """Test that an invalid token raises an exception."""
+    with pytest.raises(InvalidCursorException):
+        Cursor.decode(token)
+
+
+def test_unpack():
+    """Test unpacking the values of a cursor."""
+    cursor = Cursor.create("2024-01-01 19:00:00", 1)
+    assert cursor.unpack(datetime, int) == (datetime(2024, 1, 1, 19, 0, 0), 1)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        (1,),
+        ("2024-01-01 19:00:00", "1"),
+        ("not a date", 1),
+    ],
+)
+def test_unpack_invalid(values: tuple):
+    """Test that a cursor that doesn't match the sort key raises an exception."""
+    with pytest.raises(InvalidCursorException):
+        Cursor.create(*values).unpack(datetime, int)
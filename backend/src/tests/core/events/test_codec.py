@@ -0,0 +1,94 @@
+"""Tests for the codecs of messages on a stream."""
+
+import pytest
+
+from kwai.core.events.codec import (
+    EventCodecException,
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    create_json_codec,
+    get_codec,
+)
+from kwai.core.events.stream import RedisMessage, RedisMessageException
+from kwai.modules.identity.user_invitations.user_invitation_events import (
+    UserInvitationCreatedEvent,
+)
+
+
+def _create_redis_messages(fields: dict) -> list:
+    """Create the structure Redis returns when reading one message."""
+    return [(b"kwai_test", [(b"1-0", fields)])]
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), create_json_codec()])
+def test_json_codec(codec):
+    """Test encoding and decoding with a JSON codec."""
+    data = {"text": "Hello World!"}
+    assert codec.decode(codec.encode(data)) == data
+
+
+def test_get_codec_without_content_type():
+    """Test that a message without content type is handled as JSON."""
+    assert get_codec(None).content_type == JsonCodec.content_type
+
+
+def test_get_unknown_codec():
+    """Test that an unknown content type raises an exception."""
+    with pytest.raises(EventCodecException):
+        get_codec("text/unknown")
+
+
+@pytest.mark.parametrize("codec_class", [OrjsonCodec, MsgpackCodec])
+def test_codec_without_extra(codec_class, monkeypatch):
+    """Test that a codec can't be created when the events-fast extra is missing."""
+    monkeypatch.setattr("kwai.core.events.codec.orjson", None)
+    monkeypatch.setattr("kwai.core.events.codec.msgpack", None)
+    with pytest.raises(EventCodecException, match="events-fast"):
+        codec_class()
+
+
+def test_get_msgpack_codec_without_extra(monkeypatch):
+    """Test that msgpack data can't be decoded when the extra is missing."""
+    monkeypatch.setattr("kwai.core.events.codec._msgpack_codec", None)
+    with pytest.raises(EventCodecException, match="events-fast"):
+        get_codec("application/msgpack")
+
+
+def test_create_from_redis():
+    """Test creating a message with a content type."""
+    message = RedisMessage.create_from_redis(
+        _create_redis_messages(
+            {b"data": b'{"text": "Hello World!"}', b"content-type": b"application/json"}
+        )
+    )
+    assert message.id == "1-0"
+    assert message.data == {"text": "Hello World!"}
+
+
+def test_create_from_redis_without_content_type():
+    """Test creating a message that was stored without a content type."""
+    message = RedisMessage.create_from_redis(
+        _create_redis_messages({b"data": b'{"text": "Hello World!"}'})
+    )
+    assert message.data == {"text": "Hello World!"}
+
+
+def test_create_from_redis_with_invalid_data():
+    """Test that invalid data raises an exception."""
+    with pytest.raises(RedisMessageException):
+        RedisMessage.create_from_redis(_create_redis_messages({b"data": b"{"}))
+
+
+def test_create_event_from_data():
+    """Test creating an event from the serialized data."""
+    event = UserInvitationCreatedEvent(uuid="1234")
+    assert UserInvitationCreatedEvent.create_from_data(event.data) == event
+
+
+def test_create_event_from_data_with_other_version():
+    """Test that data of another version of the event is refused."""
+    data = UserInvitationCreatedEvent(uuid="1234").data
+    data["meta"]["version"] = "v2"
+    with pytest.raises(ValueError):
+        UserInvitationCreatedEvent.create_from_data(data)
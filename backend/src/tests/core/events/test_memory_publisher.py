@@ -0,0 +1,27 @@
+"""Tests for the memory publisher."""
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+from kwai.core.events.event import Event, EventMeta
+from kwai.core.events.memory_publisher import MemoryPublisher
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class MemoryTestEvent(Event):
+    """An event used for testing the memory publisher."""
+
+    meta: ClassVar[EventMeta] = EventMeta(module="test", name="memory")
+    text: str
+
+
+async def test_publish_many():
+    """Test publishing multiple events."""
+    publisher = MemoryPublisher()
+    await publisher.publish(MemoryTestEvent(text="1"))
+    ids = await publisher.publish_many(
+        MemoryTestEvent(text="2"), MemoryTestEvent(text="3")
+    )
+
+    assert len(publisher.events) == 3, "There should be 3 published events"
+    assert publisher.ids[1:] == ids, "The ids of the published events are returned"
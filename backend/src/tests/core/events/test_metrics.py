@@ -0,0 +1,112 @@
+"""Tests for the metrics of the event bus."""
+
+import pytest
+
+from redis.asyncio import Redis
+
+from kwai.core.events.metrics import (
+    HANDLER_METRICS_KEY,
+    EventBusMetrics,
+    GroupStats,
+    HandlerMetrics,
+    collect_group_stats,
+    render_prometheus,
+)
+from kwai.core.events.stream import RedisMessage, RedisStream
+
+
+def test_observe():
+    """Test observing durations of a handler."""
+    metrics = HandlerMetrics(stream="kwai_test", group="test", buckets=(0.1, 1.0))
+    metrics.observe(0.05)
+    metrics.observe(0.5, success=False)
+    metrics.observe(5.0)
+
+    assert metrics.count == 3, "There should be 3 observations"
+    assert metrics.failures == 1, "There should be 1 failure"
+    assert metrics.bucket_counts == [1, 1], "The last observation is above all buckets"
+
+
+def test_merge():
+    """Test merging the metrics of the same handler of two workers."""
+    metrics = HandlerMetrics(stream="kwai_test", group="test", buckets=(0.1, 1.0))
+    metrics.observe(0.05)
+    other = HandlerMetrics(stream="kwai_test", group="test", buckets=(0.1, 1.0))
+    other.observe(0.5, success=False)
+    metrics.merge(other)
+
+    assert metrics.count == 2, "There should be 2 observations"
+    assert metrics.failures == 1, "There should be 1 failure"
+    assert metrics.bucket_counts == [1, 1], "The bucket counts should be summed"
+
+
+def test_render_prometheus():
+    """Test rendering the metrics in the Prometheus text format."""
+    metrics = EventBusMetrics()
+    metrics.observe("kwai_test", "test", 0.05, True)
+    text = render_prometheus(
+        [
+            GroupStats(
+                stream="kwai_test",
+                length=10,
+                last_entry_id="10-0",
+                group="test",
+                consumers=1,
+                pending=2,
+                last_delivered_id="8-0",
+                lag=2,
+            )
+        ],
+        metrics.handlers,
+    )
+    assert 'kwai_bus_group_lag{stream="kwai_test",group="test"} 2' in text
+    assert 'kwai_bus_group_pending{stream="kwai_test",group="test"} 2' in text
+    assert (
+        'kwai_bus_handler_duration_seconds_bucket{stream="kwai_test",group="test",'
+        'le="+Inf"} 1'
+    ) in text
+
+
+@pytest.mark.bus
+async def test_collect_group_stats(redis: Redis):
+    """Test collecting the statistics of the groups of a stream."""
+    stream = RedisStream(redis, "kwai_test_metrics")
+    try:
+        await stream.create_group("kwai_test_metrics_group", "0")
+        await stream.add(RedisMessage(data={"text": "Hello Metrics!"}))
+
+        stats = [
+            stats
+            for stats in await collect_group_stats(redis)
+            if stats.stream == stream.name
+        ]
+        assert len(stats) == 1, "There should be statistics for one group"
+        assert stats[0].lag == 1, "One message should not be delivered yet"
+    finally:
+        await stream.delete()
+
+
+@pytest.mark.bus
+async def test_store_and_load(redis: Redis):
+    """Test that the stored metrics of all workers are summed."""
+    workers = [EventBusMetrics(worker=f"kwai_test_worker_{i}") for i in range(2)]
+    for worker in workers:
+        worker.observe("kwai_test_metrics", "test", 0.05, True)
+    try:
+        for worker in workers:
+            await worker.store(redis)
+
+        handlers = [
+            handler
+            for handler in await EventBusMetrics.load(redis)
+            if handler.stream == "kwai_test_metrics"
+        ]
+        assert len(handlers) == 1, "The metrics of the handler should be merged"
+        assert handlers[0].count == 2, "The observations of both workers are summed"
+        assert await redis.ttl(f"{HANDLER_METRICS_KEY}/kwai_test_worker_0") > 0, (
+            "The snapshot of a worker should expire"
+        )
+    finally:
+        await redis.delete(
+            *[f"{HANDLER_METRICS_KEY}/kwai_test_worker_{i}" for i in range(2)]
+        )
@@ -0,0 +1,104 @@
+"""Tests for the event outbox."""
+
+import asyncio
+import json
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+import pytest
+
+from redis.asyncio import Redis
+from sql_smith.functions import field
+
+from kwai.core.db.database import Database
+from kwai.core.db.uow import UnitOfWork
+from kwai.core.events.event import Event, EventMeta
+from kwai.core.events.outbox_publisher import OutboxPublisher, OutboxRow
+from kwai.core.events.outbox_relay import OutboxRelay
+from kwai.core.events.stream import RedisStream
+from kwai.core.settings import get_settings
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class OutboxTestEvent(Event):
+    """An event used for testing the outbox."""
+
+    meta: ClassVar[EventMeta] = EventMeta(module="test", name="outbox")
+    text: str
+
+
+def test_persist_event():
+    """Test persisting an event into an outbox row."""
+    row = OutboxRow.persist(OutboxTestEvent(text="Hello Outbox!"))
+    assert row.stream == "kwai/v1/test/outbox", "The stream should be the event name"
+    assert json.loads(row.data)["data"]["text"] == "Hello Outbox!", (
+        "The event data should be serialized"
+    )
+
+
+@pytest.mark.db
+async def test_publish_many(database: Database):
+    """Test that publish_many returns the ids of the outbox rows."""
+    events = [OutboxTestEvent(text="Same"), OutboxTestEvent(text="Same")]
+    async with UnitOfWork(database):
+        ids = await OutboxPublisher(database).publish_many(*events)
+        query = (
+            Database.create_query_factory()
+            .select("id")
+            .from_(OutboxRow.__table_name__)
+            .where(field("id").in_(*[int(id_) for id_ in ids]))
+        )
+        rows = [row async for row in database.fetch(query)]
+        await database.execute(
+            Database.create_query_factory()
+            .delete(OutboxRow.__table_name__)
+            .where(field("id").in_(*[int(id_) for id_ in ids]))
+        )
+    assert len(set(ids)) == 2, "Each event should have its own id"
+    assert len(rows) == 2, "The ids should be the ids of the outbox rows"
+
+
+@pytest.mark.db
+@pytest.mark.bus
+async def test_relay(database: Database, redis: Redis):
+    """Test relaying an event from the outbox to a stream."""
+    stream = RedisStream(redis, OutboxTestEvent.meta.full_name)
+    async with UnitOfWork(database):
+        await OutboxPublisher(database).publish(OutboxTestEvent(text="Hello Relay!"))
+
+    try:
+        count = await OutboxRelay(database, redis).relay()
+        assert count > 0, "At least one event should be relayed"
+
+        message = await stream.read(last_id="0")
+        assert message is not None, "There should be a message on the stream"
+        assert message.data["data"]["text"] == "Hello Relay!"
+    finally:
+        await stream.delete()
+
+
+@pytest.mark.db
+@pytest.mark.bus
+async def test_concurrent_relays(database: Database, redis: Redis):
+    """Test that two relays don't relay the same event."""
+    stream = RedisStream(redis, OutboxTestEvent.meta.full_name)
+    async with UnitOfWork(database):
+        await OutboxPublisher(database).publish_many(
+            *[OutboxTestEvent(text=f"Event {index}") for index in range(10)]
+        )
+
+    other_database = Database(get_settings().db)
+    try:
+        relays = [
+            OutboxRelay(database, redis, batch_size=5),
+            OutboxRelay(other_database, redis, batch_size=5),
+        ]
+        while sum(await asyncio.gather(*[relay.relay() for relay in relays])) > 0:
+            pass
+        assert await redis.xlen(stream.name) == 10, (
+            "Each event should be added to the stream only once"
+        )
+    finally:
+        await other_database.close()
+        await stream.delete()
@@ -0,0 +1,53 @@
+"""Tests for the Redis bus."""
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+import pytest
+
+from redis.asyncio import Redis
+
+from kwai.core.events.event import Event, EventMeta
+from kwai.core.events.redis_bus import RedisBus
+from kwai.core.events.stream import RedisStream
+
+
+pytestmark = pytest.mark.bus
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class FirstTestEvent(Event):
+    """A first event used for testing the bus."""
+
+    meta: ClassVar[EventMeta] = EventMeta(module="test", name="first")
+    text: str
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class SecondTestEvent(Event):
+    """A second event used for testing the bus."""
+
+    meta: ClassVar[EventMeta] = EventMeta(module="test", name="second")
+    text: str
+
+
+async def test_publish_many(bus: RedisBus, redis: Redis):
+    """Test publishing multiple events with one pipeline."""
+    first_stream = RedisStream(redis, FirstTestEvent.meta.full_name)
+    second_stream = RedisStream(redis, SecondTestEvent.meta.full_name)
+    try:
+        ids = await bus.publish_many(
+            FirstTestEvent(text="1"),
+            SecondTestEvent(text="2"),
+            FirstTestEvent(text="3"),
+        )
+        assert len(ids) == 3, "There should be an id for each event"
+        assert await first_stream.length() == 2, "There should be 2 first events"
+        assert await second_stream.length() == 1, "There should be 1 second event"
+
+        message = await first_stream.read(last_id="0")
+        assert message is not None, "There should be a message"
+        assert message.id == ids[0], "The id of the first event should be returned"
+    finally:
+        await first_stream.delete()
+        await second_stream.delete()
@@ -0,0 +1,23 @@
+"""Tests for creating a pooled Redis client."""
+
+from redis.asyncio import BlockingConnectionPool
+
+from kwai.core.events.redis_client import create_redis
+from kwai.core.settings import RedisSettings
+
+
+async def test_create_redis():
+    """Test that the client uses a connection pool configured from the settings."""
+    redis = create_redis(
+        RedisSettings(max_connections=5, pool_timeout=3, health_check_interval=15)
+    )
+    pool = redis.connection_pool
+    assert isinstance(pool, BlockingConnectionPool), (
+        "A command should wait for a free connection"
+    )
+    assert pool.timeout == 3, "The pool should wait at most 3 seconds"
+    assert pool.max_connections == 5, "The pool should be limited to 5 connections"
+    assert pool.connection_kwargs["health_check_interval"] == 15, (
+        "The health check interval should be set"
+    )
+    await redis.aclose()
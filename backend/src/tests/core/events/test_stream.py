@@ -55,3 +55,11 @@ async def test_consume(stream: RedisStream):
     await stream.add(RedisMessage(data={"text": "Hello Consuming World!"}))
     message = await stream.consume("kwai_test_group", "kwai_test_group.c1")
     assert message is not None, "There should be a message"
+
+
+async def test_count_entries_after(stream: RedisStream):
+    """Test counting the entries after an id with a limit."""
+    await stream.add(RedisMessage(data={"text": "Hello Counting World!"}))
+    assert await stream.count_entries_after("0", limit=1) == 1, (
+        "The count should be capped at the limit"
+    )
@@ -1,5 +1,7 @@
 """Module for testing Template class."""
 
+from jinja2 import FileSystemBytecodeCache
+
 from kwai.core.template.jinja2_engine import Jinja2Engine
 from kwai.frontend.vite import DevelopmentVite
 
@@ -14,3 +16,14 @@ def test_render():
     )
 
     assert result is not None, "The template didn't render the correct output"
+
+
+def test_bytecode_cache(tmp_path):
+    """Test that a compiled template is stored in the bytecode cache."""
+    engine = Jinja2Engine(
+        bytecode_cache=FileSystemBytecodeCache(str(tmp_path)),
+        website={"name": "Kwai Test"},
+    )
+    engine.compile("index.jinja2")
+
+    assert len(list(tmp_path.iterdir())) == 1, "The template should be cached."
@@ -0,0 +1,56 @@
+"""Module for testing the document converters."""
+
+import markdown
+
+from kwai.core.converter import HtmlCache, MarkdownConverter
+
+
+MARKDOWN = """
+# Kwai
+
+| Dojo    | City  |
+|---------|-------|
+| Kodokan | Tokyo |
+"""
+
+
+def test_markdown_converter():
+    """Test that the converter returns the same HTML as markdown."""
+    assert MarkdownConverter().convert(MARKDOWN) == markdown.markdown(
+        MARKDOWN, extensions=["tables"]
+    )
+
+
+def test_markdown_converter_uses_cache():
+    """Test that converted HTML is cached."""
+    MarkdownConverter.cache.clear()
+    html = MarkdownConverter().convert(MARKDOWN)
+    assert len(MarkdownConverter.cache) == 1, "The HTML should be cached"
+    assert MarkdownConverter().convert(MARKDOWN) == html
+    assert len(MarkdownConverter.cache) == 1, "The HTML should be cached once"
+
+
+def test_markdown_converter_reuses_parser():
+    """Test that a reused parser does not keep state of a previous conversion."""
+    MarkdownConverter.cache.clear()
+    MarkdownConverter().convert("[Kwai][1]\n\n[1]: https://kwai.be")
+    assert MarkdownConverter().convert("[Kwai][1]") == "<p>[Kwai][1]</p>"
+
+
+def test_html_cache_is_bounded():
+    """Test that the least recently used entry is removed."""
+    cache = HtmlCache(maxsize=2)
+    keys = [HtmlCache.create_key(str(index)) for index in range(3)]
+    cache.set(keys[0], "0")
+    cache.set(keys[1], "1")
+    cache.get(keys[0])
+    cache.set(keys[2], "2")
+
+    assert len(cache) == 2, "The cache should contain 2 entries"
+    assert cache.get(keys[1]) is None, "The least recently used entry is removed"
+    assert cache.get(keys[0]) == "0"
+
+
+def test_html_cache_key_contains_extensions():
+    """Test that the extensions are part of the key."""
+    assert HtmlCache.create_key("Kwai", "tables") != HtmlCache.create_key("Kwai")
@@ -7,9 +7,13 @@ import pytest
 from pydantic import BaseModel
 from rich import json
 
+from kwai.core.domain.repository.cursor import Cursor
 from kwai.core.json_api import (
     Document,
+    DocumentBuilder,
+    DocumentStream,
     Error,
+    Meta,
     MultipleDocument,
     ResourceData,
     ResourceIdentifier,
@@ -136,3 +140,141 @@ def test_merge_document(judoka_resource):
     assert isinstance(multi_doc["data"], list), "The 'data' property should be a list"
     assert "id" in multi_doc["data"][0], "There should be an 'id' in the document."
     assert multi_doc["data"][0]["id"] == "1", "The id should be '1'."
+
+
+class DojoResourceIdentifier(ResourceIdentifier):
+    """A JSON:API resource identifier for a dojo."""
+
+    type: Literal["dojos"] = "dojos"
+
+
+class DojoAttributes(BaseModel):
+    """Attributes for a JSON:API resource of a dojo."""
+
+    name: str
+
+
+class DojoResource(DojoResourceIdentifier, ResourceData[DojoAttributes, None]):
+    """A JSON:API resource for a dojo."""
+
+
+class JudokaDojoDocument(Document[JudokaResource, DojoResource]):
+    """A JSON:API document for a judoka with the dojo included."""
+
+
+def test_meta_with_next_cursor():
+    """Test adding the token of the next page to the meta."""
+    meta = Meta(count=10, offset=0, limit=5)
+    next_meta = meta.with_next_cursor(Cursor.create(5))
+    assert next_meta.model_dump() == {
+        "count": 10,
+        "offset": 0,
+        "limit": 5,
+        "next_cursor": Cursor.create(5).encode(),
+    }
+    assert "next_cursor" not in meta.model_dump(), "The meta should not be changed"
+
+
+def test_document_builder():
+    """Test building a document with multiple resources and included resources."""
+    dojo = DojoResource(id="1", attributes=DojoAttributes(name="Kodokan"))
+    builder = DocumentBuilder(JudokaDojoDocument)
+    for id_ in range(3):
+        builder.add(
+            JudokaDojoDocument(
+                data=JudokaResource(
+                    id=str(id_),
+                    attributes=JudokaAttributes(
+                        name=f"Judoka {id_}", birth_date="18601210"
+                    ),
+                ),
+                included={dojo},
+            )
+        )
+    document = builder.build()
+
+    assert len(document.resources) == 3, "There should be 3 resources"
+    assert len(document.included) == 1, "The dojo should only be included once"
+
+
+def test_document_builder_with_included():
+    """Test building a document with included always present."""
+    json_doc = json.loads(
+        DocumentBuilder(JudokaDocument, with_included=True).build().model_dump_json()
+    )
+    assert json_doc["data"] == [], "There should be no data"
+    assert json_doc["included"] == [], "There should be an empty included"
+
+
+async def _create_judokas(count: int):
+    for id_ in range(count):
+        yield JudokaResource(
+            id=str(id_),
+            attributes=JudokaAttributes(name=f"Judoka {id_}", birth_date="18601210"),
+        )
+
+
+def _create_judoka_dojo_document(judoka: JudokaResource) -> JudokaDojoDocument:
+    return JudokaDojoDocument(
+        data=judoka,
+        included={DojoResource(id="1", attributes=DojoAttributes(name="Kodokan"))},
+    )
+
+
+async def test_document_stream():
+    """Test that a stream results in the same document as a builder."""
+    builder = DocumentBuilder(JudokaDojoDocument, meta=Meta(count=3))
+    async for judoka in _create_judokas(3):
+        builder.add(_create_judoka_dojo_document(judoka))
+
+    stream = DocumentStream(
+        _create_judokas(3), _create_judoka_dojo_document, meta=Meta(count=3)
+    )
+    chunks = [chunk async for chunk in stream]
+
+    assert json.loads(b"".join(chunks)) == json.loads(
+        builder.build().model_dump_json()
+    ), "The stream should result in the same document"
+
+
+async def test_document_stream_in_chunks():
+    """Test that a stream yields multiple chunks."""
+    stream = DocumentStream(
+        _create_judokas(100), lambda judoka: JudokaDocument(data=judoka), chunk_size=256
+    )
+    chunks = [chunk async for chunk in stream]
+
+    assert len(chunks) > 1, "There should be multiple chunks"
+    json_doc = json.loads(b"".join(chunks))
+    assert len(json_doc["data"]) == 100, "There should be 100 resources"
+    assert "included" not in json_doc, "There should be no included"
+    assert "meta" not in json_doc, "There should be no meta"
+
+
+async def test_empty_document_stream():
+    """Test a stream without resources."""
+    stream = DocumentStream(
+        _create_judokas(0),
+        lambda judoka: JudokaDocument(data=judoka),
+        with_included=True,
+    )
+    json_doc = json.loads(b"".join([chunk async for chunk in stream]))
+
+    assert json_doc == {"data": [], "included": []}
+
+
+@pytest.mark.parametrize("count,expected", [(3, True), (2, False)])
+async def test_document_stream_next_cursor(count: int, expected: bool):
+    """Test that the cursor of the last resource is added when the page is full."""
+    stream = DocumentStream(
+        _create_judokas(count),
+        lambda judoka: JudokaDocument(data=judoka),
+        meta=Meta(count=10, limit=3),
+        create_cursor=lambda judoka: Cursor.create(int(judoka.id)),
+    )
+    json_doc = json.loads(b"".join([chunk async for chunk in stream]))
+
+    if expected:
+        assert json_doc["meta"]["next_cursor"] == Cursor.create(2).encode()
+    else:
+        assert "next_cursor" not in json_doc["meta"]
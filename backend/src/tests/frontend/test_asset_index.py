@@ -0,0 +1,105 @@
+"""Module for testing the asset index."""
+
+import gzip
+
+from pathlib import Path
+
+import pytest
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from kwai.frontend.asset_index import (
+    IMMUTABLE_CACHE_CONTROL,
+    AssetIndex,
+    AssetResponse,
+)
+
+
+JS_CONTENT = b"console.log('kwai');" * 100
+
+
+@pytest.fixture
+def dist_path(tmp_path: Path) -> Path:
+    """A dist folder with some files."""
+    dist_path = tmp_path / "dist"
+    (dist_path / "assets").mkdir(parents=True)
+    (dist_path / ".vite").mkdir()
+    (dist_path / ".vite" / "manifest.json").write_text("{}")
+    (dist_path / "favicon.svg").write_text("<svg></svg>")
+    js_path = dist_path / "assets" / "index-533fa9ea.js"
+    js_path.write_bytes(JS_CONTENT)
+    js_path.with_name(js_path.name + ".gz").write_bytes(gzip.compress(JS_CONTENT))
+    return dist_path
+
+
+@pytest.fixture
+def client(dist_path: Path) -> TestClient:
+    """A client for an application that serves the assets of the index."""
+    app = FastAPI()
+    asset_index = AssetIndex.build(dist_path)
+
+    @app.get("/{path:path}")
+    def get_asset(path: str, request: Request):
+        return AssetResponse(
+            asset_index.get(path), request.headers.get("accept-encoding")
+        )
+
+    return TestClient(app)
+
+
+def test_build(dist_path: Path):
+    """Test building the index."""
+    asset_index = AssetIndex.build(dist_path)
+    assert len(asset_index) == 2, "The manifest and .gz file should not be indexed."
+
+    asset = asset_index.get(Path("assets/index-533fa9ea.js"))
+    assert asset is not None
+    assert asset.immutable, "A file of the assets folder should be immutable."
+    assert asset.file.size == len(JS_CONTENT)
+    assert "gzip" in asset.encodings
+
+    asset = asset_index.get("favicon.svg")
+    assert asset is not None
+    assert asset.media_type == "image/svg+xml"
+    assert not asset.immutable, "A file outside the assets folder can change."
+
+    assert asset_index.get("../dist/favicon.svg") is None
+
+
+def test_immutable_asset(client: TestClient):
+    """Test the headers of a hashed asset."""
+    response = client.get(
+        "/assets/index-533fa9ea.js", headers={"Accept-Encoding": "identity"}
+    )
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.content == JS_CONTENT
+
+
+def test_precompressed_asset(client: TestClient):
+    """Test that the precompressed file is sent."""
+    response = client.get(
+        "/assets/index-533fa9ea.js", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == JS_CONTENT, "The client should decompress the file."
+
+
+def test_not_modified(client: TestClient):
+    """Test that a 304 is returned when the ETag matches."""
+    etag = client.get("/favicon.svg").headers["etag"]
+    response = client.get("/favicon.svg", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_range(client: TestClient):
+    """Test a range request."""
+    response = client.get(
+        "/assets/index-533fa9ea.js",
+        headers={"Range": "bytes=0-9", "Accept-Encoding": "identity"},
+    )
+    assert response.status_code == 206
+    assert response.content == JS_CONTENT[:10]
@@ -0,0 +1,58 @@
+"""Module for testing the manifest registry."""
+
+import os
+import shutil
+
+from pathlib import Path
+
+import pytest
+
+from kwai.frontend.manifest_registry import ApplicationManifest, ManifestRegistry
+
+
+@pytest.fixture
+def manifest_copy(manifest_path: Path, tmp_path: Path) -> Path:
+    """A copy of the manifest file that can be modified."""
+    return Path(shutil.copy(manifest_path, tmp_path / "manifest.json"))
+
+
+def test_resolve(manifest_path: Path):
+    """Test resolving the files of an entry."""
+    manifest = ApplicationManifest.load(manifest_path)
+    resolved = manifest.resolve("src/index.ts")
+    assert resolved.scripts == ("assets/index-533fa9ea.js",)
+    assert resolved.css == ("assets/index-ace45c09.css",)
+    assert resolved.preloads == ("assets/vendor-97e41b2b.js",)
+    assert manifest.resolve("src/index.ts") is resolved, (
+        "The resolved entries should be cached."
+    )
+
+
+def test_resolve_unknown_entry(manifest_path: Path):
+    """Test resolving an entry that is not in the manifest."""
+    manifest = ApplicationManifest.load(manifest_path)
+    with pytest.raises(ValueError):
+        manifest.resolve("src/unknown.ts")
+
+
+def test_registry_caches_manifest(manifest_copy: Path):
+    """Test that a manifest is only loaded once."""
+    registry = ManifestRegistry()
+    manifest = registry.get("portal", manifest_copy)
+    assert registry.get("portal", manifest_copy) is manifest
+
+
+def test_registry_reloads_modified_manifest(manifest_copy: Path):
+    """Test that a manifest is reloaded when the file is modified."""
+    registry = ManifestRegistry()
+    manifest = registry.get("portal", manifest_copy)
+    stat = manifest_copy.stat()
+    os.utime(manifest_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert registry.get("portal", manifest_copy) is not manifest
+
+
+def test_registry_missing_manifest(tmp_path: Path):
+    """Test that a missing manifest raises an error."""
+    registry = ManifestRegistry()
+    with pytest.raises(FileNotFoundError):
+        registry.get("portal", tmp_path / "manifest.json")
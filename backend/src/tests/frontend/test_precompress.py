@@ -0,0 +1,31 @@
+"""Module for testing the creation of precompressed files."""
+
+import gzip
+
+from pathlib import Path
+
+from kwai.frontend.precompress import precompress
+
+
+def test_precompress(tmp_path: Path) -> None:
+    """Test that compressible files are compressed."""
+    content = "console.log('Hello world');" * 100
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index.js").write_text(content)
+    (tmp_path / "assets" / "small.css").write_text("body {}")
+    (tmp_path / "favicon.png").write_bytes(b"\0" * 2048)
+
+    created = list(precompress(tmp_path))
+
+    gzip_path = tmp_path / "assets" / "index.js.gz"
+    assert gzip_path in created
+    assert gzip.decompress(gzip_path.read_bytes()).decode() == content
+    assert not (tmp_path / "assets" / "small.css.gz").exists()
+    assert not (tmp_path / "favicon.png.gz").exists()
+
+
+def test_precompress_is_skipped_when_up_to_date(tmp_path: Path) -> None:
+    """Test that a file is not compressed again."""
+    (tmp_path / "index.js").write_text("console.log('Hello world');" * 100)
+    assert len(list(precompress(tmp_path))) > 0
+    assert list(precompress(tmp_path)) == []
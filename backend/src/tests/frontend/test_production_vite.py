@@ -36,15 +36,15 @@ def test_production_vite_preload(vite: Vite):
     assert preload[0] == "assets/vendor-97e41b2b.js"
 
 
-def test_production_vite_get_asset_path(vite: Vite, tmp_path: Path):
-    """Test getting the path of an asset."""
+def test_production_vite_get_asset(vite: Vite, tmp_path: Path):
+    """Test getting an asset."""
     dist_path = tmp_path / "dist"
     dist_path.mkdir(exist_ok=True)
     with open(dist_path / "test_file.txt", "w") as f:
         f.write("This is a test file.")
 
-    asset_file = vite.get_asset_path(Path("test_file.txt"))
-    assert asset_file is not None
+    asset = vite.get_asset(Path("test_file.txt"))
+    assert asset is not None
 
 
 def test_production_vite_get_public_path(vite: Vite, tmp_path: Path):
@@ -54,16 +54,16 @@ def test_production_vite_get_public_path(vite: Vite, tmp_path: Path):
     with open(dist_path / "test_file.txt", "w") as f:
         f.write("This is a test file.")
 
-    asset_file = vite.get_asset_path(Path("test_file.txt"))
-    assert asset_file is not None
+    asset = vite.get_asset(Path("test_file.txt"))
+    assert asset is not None
 
 
-def test_production_vite_get_asset_path_with_relative(vite: Vite, tmp_path: Path):
+def test_production_vite_get_asset_with_relative(vite: Vite, tmp_path: Path):
     """Test if a relative path fails."""
     dist_path = tmp_path / "dist"
     dist_path.mkdir(exist_ok=True)
     with open(dist_path / "test_file.txt", "w") as f:
         f.write("This is a test file.")
 
-    asset_file = vite.get_asset_path(Path("../../test_file.txt"))
-    assert asset_file is None
+    asset = vite.get_asset(Path("../../test_file.txt"))
+    assert asset is None
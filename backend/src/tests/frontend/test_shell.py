@@ -0,0 +1,75 @@
+"""Module for testing the application shell."""
+
+from pathlib import Path
+
+import pytest
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from kwai.core.template.jinja2_engine import Jinja2Engine
+from kwai.frontend.manifest_registry import ApplicationManifest
+from kwai.frontend.shell import ShellCache, create_shell_response, shell_cache
+from kwai.frontend.vite import ProductionVite
+
+
+@pytest.fixture
+def client(manifest_path: Path, tmp_path: Path) -> TestClient:
+    """A client for an application that serves the shell of the portal."""
+    app = FastAPI()
+    templates = Jinja2Engine(website={"name": "Kwai Test"}).web_templates
+    manifest = ApplicationManifest.load(manifest_path)
+
+    @app.get("/apps/portal/{path:path}", name="portal")
+    def get_app(path: str, request: Request):
+        vite = ProductionVite(manifest_path, tmp_path, manifest)
+        return create_shell_response(request, "portal", templates, vite)
+
+    shell_cache.clear()
+    return TestClient(app)
+
+
+def test_shell(client: TestClient):
+    """Test that the shell is sent with an ETag."""
+    response = client.get("/apps/portal/")
+    assert response.status_code == 200
+    assert "ETag" in response.headers, "There should be an ETag."
+    assert "assets/index-533fa9ea.js" in response.text
+
+    etag = response.headers["ETag"]
+    response = client.get("/apps/portal/news")
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag, "The same shell should be used."
+
+
+def test_shell_not_modified(client: TestClient):
+    """Test that a 304 is returned when the ETag matches."""
+    etag = client.get("/apps/portal/").headers["ETag"]
+    response = client.get("/apps/portal/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_shell_cache_other_manifest(manifest_path: Path):
+    """Test that a shell rendered with another manifest is not returned."""
+    cache = ShellCache()
+    manifest = ApplicationManifest.load(manifest_path)
+    cache.set("portal", "http://localhost/apps/portal/", manifest, b"<html></html>")
+    assert cache.get("portal", "http://localhost/apps/portal/", manifest) is not None
+    assert (
+        cache.get(
+            "portal",
+            "http://localhost/apps/portal/",
+            ApplicationManifest.load(manifest_path),
+        )
+        is None
+    ), "A reloaded manifest should invalidate the shell."
+
+
+def test_shell_cache_max_entries(manifest_path: Path):
+    """Test that no shells are stored for new keys when the cache is full."""
+    cache = ShellCache(max_entries=1)
+    manifest = ApplicationManifest.load(manifest_path)
+    cache.set("portal", "http://localhost/apps/portal/", manifest, b"<html></html>")
+    cache.set("portal", "http://example.com/apps/portal/", manifest, b"<html></html>")
+    assert cache.get("portal", "http://example.com/apps/portal/", manifest) is None
@@ -58,6 +58,21 @@ async def test_filter_by_license_date(query: MemberQuery):
         pytest.fail(f"An exception occurred: {exc}")
 
 
+async def test_filter_by_license_date_uses_index(explain_database: Database):
+    """Test that filtering by license date can use the index on license_end_date."""
+    query = MemberDbQuery(explain_database).filter_by_license_date(1, 2024)
+    plan = [row async for row in query.fetch(limit=10)]
+    keys = [
+        key
+        for row in plan
+        if row["table"] == "judo_members"
+        for key in (row["possible_keys"] or "").split(",")
+    ]
+    assert "judo_members_license_end_date_index" in keys, (
+        "The index on license_end_date should be a possible key."
+    )
+
+
 async def test_filter_by_uuid(query: MemberQuery):
     """Test filtering by uuid."""
     query.filter_by_uuid(UniqueId.generate())
@@ -4,6 +4,7 @@ import pytest
 
 from kwai.core.db.database import Database
 from kwai.modules.portal.news.news_item_db_query import NewsItemDbQuery
+from kwai.modules.portal.news.news_tables import NewsItemsTable
 
 
 pytestmark = pytest.mark.db
@@ -26,6 +27,26 @@ async def test_filter_by_publication_date(database: Database):
     assert count >= 0, "There should be 0 or more news items."
 
 
+async def test_filter_by_publication_date_uses_index(explain_database: Database):
+    """Test that the listing of a month can use the index on publish_date."""
+    query = (
+        NewsItemDbQuery(explain_database)
+        .filter_by_active()
+        .filter_by_publication_date(2023, 1)
+        .order_by_publication_date()
+    )
+    plan = [row async for row in query.fetch(limit=10)]
+    keys = [
+        key
+        for row in plan
+        if row["table"] == NewsItemsTable.table_name
+        for key in (row["possible_keys"] or "").split(",")
+    ]
+    assert "news_stories_publish_date_index" in keys, (
+        "The index on publish_date should be a possible key."
+    )
+
+
 async def test_filter_by_promoted(database: Database):
     """Test the query with filtering on promoted news items."""
     query = NewsItemDbQuery(database)
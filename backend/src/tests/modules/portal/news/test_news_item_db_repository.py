@@ -31,6 +31,14 @@ async def test_get_by_id(news_item_repo, saved_news_item):
     )
 
 
+async def test_get_by_id_with_html(news_item_repo, saved_news_item):
+    """Test that the rendered HTML of the texts is stored."""
+    entity = await news_item_repo.get_by_id(saved_news_item.id)
+    assert entity.texts[0].html_summary == "<p>This is a test news item</p>", (
+        "The summary should be stored as HTML"
+    )
+
+
 async def test_delete(news_item_repo, saved_news_item):
     """Test the deletion of a news item."""
     await news_item_repo.delete(saved_news_item)
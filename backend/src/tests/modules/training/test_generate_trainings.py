@@ -0,0 +1,137 @@
+"""Module for testing the use case "Generate trainings"."""
+
+import time
+
+from datetime import date
+
+import pytest
+
+from kwai.core.db.database import Database
+from kwai.core.db.uow import UnitOfWork
+from kwai.core.domain.value_objects.owner import Owner
+from kwai.core.domain.value_objects.time_period import TimePeriod
+from kwai.modules.training.generate_trainings import (
+    GenerateTrainings,
+    GenerateTrainingsCommand,
+)
+from kwai.modules.training.trainings.training_db_repository import TrainingDbRepository
+from kwai.modules.training.trainings.training_definition_db_repository import (
+    TrainingDefinitionDbRepository,
+)
+from kwai.modules.training.trainings.training_definition_repository import (
+    TrainingDefinitionRepository,
+)
+from kwai.modules.training.trainings.training_repository import TrainingRepository
+
+
+@pytest.fixture
+def training_repo(database: Database) -> TrainingRepository:
+    """A fixture for a training repository."""
+    return TrainingDbRepository(database)
+
+
+@pytest.fixture
+def definition_repo(database: Database) -> TrainingDefinitionRepository:
+    """A fixture for a training definition repository."""
+    return TrainingDefinitionDbRepository(database)
+
+
+async def test_generate_trainings(
+    database: Database,
+    training_repo: TrainingRepository,
+    definition_repo: TrainingDefinitionRepository,
+    make_training_definition_in_db,
+    owner: Owner,
+):
+    """Test the use case "Generate trainings"."""
+    # The definition is for a training on monday.
+    definition = await make_training_definition_in_db()
+    command = GenerateTrainingsCommand(
+        definition=definition.id.value,
+        start_date="2030-09-01",
+        end_date="2030-09-30",
+        skip_dates=["2030-09-16"],
+    )
+    use_case = GenerateTrainings(training_repo, definition_repo, owner)
+    async with UnitOfWork(database):
+        trainings = await use_case.execute(command)
+
+    try:
+        assert [
+            training.period.start_date.timestamp.date() for training in trainings
+        ] == [date(2030, 9, 2), date(2030, 9, 9), date(2030, 9, 23), date(2030, 9, 30)]
+        assert len({training.id for training in trainings}) == 4, (
+            "Each training should have its own id"
+        )
+
+        training = await training_repo.get_by_id(trainings[0].id)
+        assert training.definition.id == definition.id
+        assert training.texts[0].title == definition.name
+
+        async with UnitOfWork(database):
+            assert await use_case.execute(command) == [], (
+                "Existing trainings should be skipped"
+            )
+    finally:
+        for training in trainings:
+            await training_repo.delete(training)
+
+
+@pytest.fixture
+def local_timezone(monkeypatch):
+    """A fixture that sets the local timezone of the process to Asia/Tokyo."""
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+async def test_generate_trainings_after_midnight(
+    database: Database,
+    training_repo: TrainingRepository,
+    definition_repo: TrainingDefinitionRepository,
+    make_training_definition,
+    make_training_definition_in_db,
+    owner: Owner,
+    local_timezone,
+):
+    """Test that existing trainings are skipped when they start on another UTC date.
+
+    A training at 00:30 in Brussels starts on the day before in UTC. The local
+    timezone of the process should not be used to get the date of a training.
+    """
+    definition = await make_training_definition_in_db(
+        make_training_definition(
+            period=TimePeriod.create_from_string("00:30", "01:30", "Europe/Brussels")
+        )
+    )
+    command = GenerateTrainingsCommand(
+        definition=definition.id.value, start_date="2030-10-01", end_date="2030-10-31"
+    )
+    use_case = GenerateTrainings(training_repo, definition_repo, owner)
+    async with UnitOfWork(database):
+        trainings = await use_case.execute(command)
+
+    try:
+        assert len(trainings) == 4, "There should be 4 mondays in october 2030"
+        async with UnitOfWork(database):
+            assert await use_case.execute(command) == [], (
+                "Existing trainings should be skipped"
+            )
+    finally:
+        for training in trainings:
+            await training_repo.delete(training)
+
+
+async def test_generate_trainings_invalid_range(
+    training_repo: TrainingRepository,
+    definition_repo: TrainingDefinitionRepository,
+    owner: Owner,
+):
+    """Test that a range that ends before it starts is not allowed."""
+    command = GenerateTrainingsCommand(
+        definition=1, start_date="2030-09-30", end_date="2030-09-01"
+    )
+    with pytest.raises(ValueError):
+        await GenerateTrainings(training_repo, definition_repo, owner).execute(command)
@@ -0,0 +1,43 @@
+"""Module for testing the use case "Get training calendar"."""
+
+import pytest
+
+from kwai.core.db.database import Database
+from kwai.modules.training.get_training_calendar import (
+    GetTrainingCalendar,
+    GetTrainingCalendarCommand,
+)
+from kwai.modules.training.trainings.training_db_repository import TrainingDbRepository
+from kwai.modules.training.trainings.training_repository import TrainingRepository
+
+
+@pytest.fixture
+def training_repo(database: Database) -> TrainingRepository:
+    """A fixture for a training repository."""
+    return TrainingDbRepository(database)
+
+
+async def test_get_training_calendar(
+    training_repo: TrainingRepository, make_training_in_db
+):
+    """Test the use case "Get training calendar"."""
+    training = await make_training_in_db()
+    command = GetTrainingCalendarCommand(
+        year=training.period.start_date.year, month=training.period.start_date.month
+    )
+    items = await GetTrainingCalendar(training_repo).execute(command)
+
+    item = next((item for item in items if item.id == training.id.value), None)
+    assert item is not None, "The training should be in the calendar"
+    assert item.title == training.texts[0].title
+    assert [item.start_date for item in items] == sorted(
+        item.start_date for item in items
+    ), "The trainings should be ordered by start date"
+
+
+async def test_get_training_calendar_without_period(
+    training_repo: TrainingRepository,
+):
+    """Test that a year, or a start and end date is required."""
+    with pytest.raises(ValueError):
+        await GetTrainingCalendar(training_repo).execute(GetTrainingCalendarCommand())
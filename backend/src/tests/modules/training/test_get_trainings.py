@@ -15,6 +15,7 @@ from kwai.modules.training.trainings.training_definition_db_repository import (
 from kwai.modules.training.trainings.training_definition_repository import (
     TrainingDefinitionRepository,
 )
+from kwai.modules.training.trainings.training_query import TrainingQuery
 from kwai.modules.training.trainings.training_repository import TrainingRepository
 
 
@@ -73,3 +74,43 @@ async def test_get_year_month_trainings(
     assert count > 0, "There should be at least one training in 01/2024."
     entities = {entity.id: entity async for entity in iterator}
     assert training.id in entities, "The training should be returned in the result."
+
+
+async def test_get_trainings_with_cursor(
+    training_repo: TrainingRepository,
+    coach_repo: CoachRepository,
+    definition_repo: TrainingDefinitionRepository,
+    make_training_in_db,
+    make_training,
+):
+    """Test the use case "Get Trainings" with keyset pagination."""
+    for day in (1, 2):
+        start_date = Timestamp.create_from_string(f"2023-12-0{day} 19:00:00")
+        await make_training_in_db(
+            make_training(period=Period.create_from_delta(start_date, hours=2))
+        )
+
+    use_case = GetTrainings(training_repo, coach_repo, definition_repo)
+    count, iterator = await use_case.execute(
+        GetTrainingsCommand(year=2023, month=12, limit=1)
+    )
+    first_page = [entity async for entity in iterator]
+    assert count >= 2, "There should be at least two trainings in 12/2023."
+    assert len(first_page) == 1, "There should be one training on the first page."
+
+    count, iterator = await use_case.execute(
+        GetTrainingsCommand(
+            year=2023,
+            month=12,
+            limit=1,
+            after=TrainingQuery.create_cursor(first_page[0]),
+        )
+    )
+    second_page = [entity async for entity in iterator]
+    assert count is None, "The count should only be calculated for the first page."
+    assert len(second_page) == 1, "There should be one training on the second page."
+    assert second_page[0].id != first_page[0].id
+    assert (
+        second_page[0].period.start_date.timestamp
+        >= first_page[0].period.start_date.timestamp
+    ), "The trainings should be ordered on start date."
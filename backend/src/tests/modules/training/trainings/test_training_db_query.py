@@ -20,6 +20,7 @@ from kwai.modules.training.trainings.training_definition import (
     TrainingDefinitionEntity,
     TrainingDefinitionIdentifier,
 )
+from kwai.modules.training.trainings.training_tables import TrainingsTable
 
 
 pytestmark = pytest.mark.db
@@ -52,6 +53,26 @@ async def test_filter_by_year_month(database: Database):
     assert count >= 0, "There should be 0 or more trainings."
 
 
+async def test_filter_by_year_month_uses_index(explain_database: Database):
+    """Test that the listing of a month can use the index on start_date."""
+    query = (
+        TrainingDbQuery(explain_database)
+        .filter_active()
+        .filter_by_year_month(2022, 1)
+        .order_by_date()
+    )
+    plan = [row async for row in query.fetch(limit=10)]
+    keys = [
+        key
+        for row in plan
+        if row["table"] == TrainingsTable.table_name
+        for key in (row["possible_keys"] or "").split(",")
+    ]
+    assert "trainings_active_start_date_index" in keys, (
+        "The index on start_date should be a possible key."
+    )
+
+
 async def test_filter_by_dates(database: Database):
     """Test filtering on dates."""
     query = TrainingDbQuery(database)
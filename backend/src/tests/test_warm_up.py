@@ -0,0 +1,64 @@
+"""Module for testing the warm-up of a worker."""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from kwai.core.settings import Settings, WarmUpSettings
+from kwai.warm_up import send_request, warm_up
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+    app.state.paths = []
+
+    @app.get("/hello")
+    def hello(name: str = "world"):
+        app.state.paths.append(f"/hello?name={name}")
+        return {"hello": name}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"hello", b"world"]))
+
+    return app
+
+
+async def test_send_request():
+    """Test sending a request without a server."""
+    app = _create_app()
+    assert await send_request(app, "/hello?name=kwai") == 200
+    assert app.state.paths == ["/hello?name=kwai"]
+    assert await send_request(app, "/unknown") == 404
+
+
+async def test_send_request_streaming():
+    """Test sending a request for a streaming response."""
+    app = _create_app()
+    assert await asyncio.wait_for(send_request(app, "/stream"), timeout=5) == 200
+
+
+async def test_warm_up(monkeypatch):
+    """Test that the warm-up waits for the database and sends the requests."""
+    attempts = []
+
+    async def check_database(settings):
+        attempts.append(settings)
+        if len(attempts) == 1:
+            raise ConnectionError("The database is not available.")
+
+    monkeypatch.setattr("kwai.warm_up.check_database", check_database)
+
+    app = _create_app()
+    settings = Settings.model_construct(
+        warm_up=WarmUpSettings(requests=["/hello?name=warm-up"], retry_interval=0)
+    )
+
+    await warm_up(app, app, settings)
+
+    assert app.openapi_schema is not None, "The OpenAPI schema should be built."
+    assert len(attempts) == 2, "The database connection should be retried."
+    assert app.state.paths == ["/hello?name=warm-up"], (
+        "A failing step should not stop the warm-up."
+    )